@@ -0,0 +1,277 @@
+"""
+File de rendu des objets 3D (fruits, moitiés, bombes) : culling, tri par
+état et draws instanciés par modèle.
+"""
+import ctypes
+import math
+import numpy
+from OpenGL.GL import *
+from core.shaders import (
+    compile_program_variants, INSTANCED_MESH_PROGRAM_VARIANTS,
+    INSTANCED_MESH_ATTRIBUTES, ATTRIB_MODEL, ATTRIB_COLOR
+)
+from data.config import MODEL_LOD_RADII
+
+# Données par instance : matrice modèle 4x4 (colonnes) + couleur RGB
+INSTANCE_FLOATS = 16 + 3
+INSTANCE_STRIDE = INSTANCE_FLOATS * 4
+
+
+def compute_model_matrices(objects, camera):
+    """Calcule en une passe vectorisée les matrices modèle des objets.
+
+    Équivaut, pour chaque objet, à glTranslatef(gl_x, gl_y, 0),
+    glScalef(s), glTranslatef(offset_x, 0, 0) puis les rotations X, Y, Z.
+    Retourne un tableau (N, 4, 4) en convention lignes (numpy).
+    """
+    count = len(objects)
+    data = numpy.array([
+        (obj.x, obj.y, obj.scale_3d, obj.offset_x,
+         obj.rotation_x, obj.rotation_y, obj.rotation_z)
+        for obj in objects
+    ], dtype=numpy.float64).reshape(count, 7)
+
+    gl_x, gl_y = camera.screen_to_world(data[:, 0], data[:, 1])
+    scale = data[:, 2]
+
+    ax, ay, az = numpy.radians(data[:, 4:7]).T
+    cx, sx = numpy.cos(ax), numpy.sin(ax)
+    cy, sy = numpy.cos(ay), numpy.sin(ay)
+    cz, sz = numpy.cos(az), numpy.sin(az)
+
+    # R = Rx * Ry * Rz développé
+    rotation = numpy.empty((count, 3, 3))
+    rotation[:, 0, 0] = cy * cz
+    rotation[:, 0, 1] = -cy * sz
+    rotation[:, 0, 2] = sy
+    rotation[:, 1, 0] = sx * sy * cz + cx * sz
+    rotation[:, 1, 1] = -sx * sy * sz + cx * cz
+    rotation[:, 1, 2] = -sx * cy
+    rotation[:, 2, 0] = -cx * sy * cz + sx * sz
+    rotation[:, 2, 1] = cx * sy * sz + sx * cz
+    rotation[:, 2, 2] = cx * cy
+
+    matrices = numpy.zeros((count, 4, 4))
+    matrices[:, :3, :3] = rotation * scale[:, None, None]
+    matrices[:, 0, 3] = gl_x + scale * data[:, 3]
+    matrices[:, 1, 3] = gl_y
+    matrices[:, 3, 3] = 1.0
+    return matrices
+
+
+def frustum_visible(matrices, radii, camera):
+    """Masque des sphères englobantes qui touchent le volume de vue.
+
+    Les objets sont dans le plan z = 0, la caméra à camera.distance :
+    une sphère de rayon r est visible si elle est à moins de r de chacun
+    des quatre plans latéraux du frustum.
+    """
+    x = numpy.abs(matrices[:, 0, 3])
+    y = numpy.abs(matrices[:, 1, 3])
+    return ((x <= camera.half_width + radii / math.cos(camera.half_fov_x)) &
+            (y <= camera.half_height + radii / math.cos(camera.half_fov_y)))
+
+
+def select_lods(radii, camera, pixel_scale=1.0, thresholds=MODEL_LOD_RADII):
+    """Niveau de détail par objet d'après le rayon projeté en pixels rastérisés.
+
+    Les objets sont dans le plan z = 0 : un rayon monde r y couvre
+    r * (hauteur logique / 2) / half_height pixels logiques, multipliés par
+    pixel_scale (pixels réellement rastérisés par pixel logique).
+    """
+    projected = radii * (camera.height * 0.5 / camera.half_height) * pixel_scale
+    # Seuils décroissants : 0 au-dessus du premier, 1 au-dessus du second...
+    return numpy.searchsorted(-numpy.asarray(thresholds, dtype=numpy.float64), -projected, side='right')
+
+
+class BatchRenderer:
+    """File de rendu des objets 3D : culling, tri par état, puis lots par modèle.
+
+    Les objets hors du volume de vue sont ignorés. Les lots texturés passent
+    en premier pour que l'atlas ne soit lié qu'une fois par frame. Avec le
+    backend VBO, chaque objet prend le niveau de détail adapté à sa taille
+    à l'écran ; avec l'instanciation, chaque (modèle, niveau) est un seul
+    draw. Sinon les objets d'un lot sont dessinés un par un sans changer
+    d'état entre eux.
+    """
+
+    def __init__(self, model_cache, renderer):
+        self.model_cache = model_cache
+        self.state = renderer.state
+        self.camera = renderer.camera
+        self.pixel_scale = renderer.pixel_scale
+        self.program = None
+        self.uniforms = {}
+        self.instance_vbo = None
+
+        if model_cache.backend == 'vbo' and bool(glDrawElementsInstanced) and bool(glVertexAttribDivisor):
+            try:
+                self.program, self.uniforms = compile_program_variants(
+                    INSTANCED_MESH_PROGRAM_VARIANTS, INSTANCED_MESH_ATTRIBUTES)
+                # Caméra fixe et éclairage constant : uniforms envoyés une seule fois
+                self.state.use_program(self.program)
+                glUniformMatrix4fv(self.uniforms['u_projection'], 1, GL_FALSE, self.camera.projection)
+                glUniformMatrix4fv(self.uniforms['u_view'], 1, GL_FALSE, self.camera.view)
+                model_cache.set_lighting_uniforms(self.uniforms)
+                glUniform1i(self.uniforms['u_texture'], 0)
+                self.state.use_program(0)
+                self.instance_vbo = glGenBuffers(1)
+            except Exception as e:
+                print(f"Warning: instanced rendering unavailable: {e}")
+                self.program = None
+
+    @property
+    def instanced(self):
+        return self.program is not None
+
+    def render(self, objects):
+        """Dessine les objets visibles."""
+        batches = {}
+        missing = []
+        for obj in objects:
+            name = obj.model_name
+            if self.model_cache.has_model(name):
+                batches.setdefault(name, []).append(obj)
+            else:
+                missing.append(obj)
+
+        if missing:
+            # Sphères de secours en pipeline fixe
+            self.state.use_program(0)
+            for obj in missing:
+                obj.render_3d(self.camera.width, self.camera.height)
+
+        if not batches:
+            return
+
+        names = sorted(batches, key=lambda name: (name not in self.model_cache.textured, name))
+        ordered = [obj for name in names for obj in batches[name]]
+        matrices = compute_model_matrices(ordered, self.camera)
+
+        # Rayon monde : rayon du modèle mis à l'échelle, plus le décalage des moitiés
+        model_radii = numpy.array([
+            self.model_cache.radii.get(obj.model_name, 1.0) * obj.scale_3d for obj in ordered
+        ])
+        offsets = numpy.array([abs(obj.offset_x) * obj.scale_3d for obj in ordered])
+        visible = frustum_visible(matrices, model_radii + offsets, self.camera)
+        lods = select_lods(model_radii, self.camera, self.pixel_scale)
+
+        queue = []    # (nom, niveau, objets, matrices) par lot non vide
+        first = 0
+        for name in names:
+            count = len(batches[name])
+            mask = visible[first:first + count]
+            batch_lods = lods[first:first + count]
+            batch_matrices = matrices[first:first + count]
+            levels = len(self.model_cache.lods.get(name, ())) or 1
+            for lod in range(levels):
+                # Les objets plus petits que le dernier seuil prennent le niveau le plus simple
+                selected = mask & ((batch_lods == lod) if lod < levels - 1 else (batch_lods >= lod))
+                if selected.any():
+                    batch_objects = [obj for obj, shown in zip(batches[name], selected) if shown]
+                    queue.append((name, lod, batch_objects, batch_matrices[selected]))
+            first += count
+
+        if not queue:
+            return
+        if self.instanced:
+            self._render_instanced(queue)
+        else:
+            self._render_fixed(queue)
+
+    def _render_fixed(self, queue):
+        """Un draw par objet, états changés seulement entre lots."""
+        uses_program = False    # ModelCache.draw laisse son programme actif (via self.state)
+        uses_fixed = False
+        for name, lod, objects, matrices in queue:
+            if name in self.model_cache.meshes:
+                # Matrice modèle en uniform et texture lue par le shader : ni pile de matrices
+                # ni GL_TEXTURE_2D (inexistant en core profile)
+                uses_program = True
+                for obj, matrix in zip(objects, matrices):
+                    self.model_cache.draw(name, obj.color, lod, matrix)
+                continue
+
+            uses_fixed = True
+            if name in self.model_cache.textured:
+                self.state.enable(GL_TEXTURE_2D)
+                self.state.bind_texture(self.model_cache.texture_id)
+            else:
+                self.state.disable(GL_TEXTURE_2D)
+
+            display_list = self.model_cache.get_display_list(name)
+            for obj, matrix in zip(objects, matrices):
+                glPushMatrix()
+                glMultMatrixf(numpy.ascontiguousarray(matrix.T, dtype=numpy.float32))
+                glColor3f(*obj.color)
+                glCallList(display_list)
+                glPopMatrix()
+
+        if uses_fixed:
+            self.state.disable(GL_TEXTURE_2D)
+        if uses_program:
+            self.state.use_program(0)
+
+    def _render_instanced(self, queue):
+        """Upload toutes les instances dans un buffer puis un draw par modèle."""
+        objects = [obj for _, _, batch, _ in queue for obj in batch]
+        matrices = numpy.concatenate([batch_matrices for _, _, _, batch_matrices in queue])
+
+        instances = numpy.empty((len(objects), INSTANCE_FLOATS), dtype=numpy.float32)
+        instances[:, :16] = matrices.transpose(0, 2, 1).reshape(-1, 16)  # Colonnes pour GL
+        instances[:, 16:] = [obj.color for obj in objects]
+
+        self.state.use_program(self.program)
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.instance_vbo)
+        glBufferData(GL_ARRAY_BUFFER, instances.nbytes, instances, GL_STREAM_DRAW)
+
+        # Lots texturés d'abord : l'atlas est lié une seule fois
+        textured = None
+        first = 0
+        for name, lod, batch, _ in queue:
+            mesh = self.model_cache.get_mesh(name, lod)
+            if mesh.textured != textured:
+                textured = mesh.textured
+                glUniform1f(self.uniforms['u_use_texture'], 1.0 if textured else 0.0)
+                if textured:
+                    self.state.bind_texture(self.model_cache.texture_id)
+
+            mesh.bind()
+            glBindBuffer(GL_ARRAY_BUFFER, self.instance_vbo)
+            self._set_instance_pointers(first * INSTANCE_STRIDE)
+            glDrawElementsInstanced(GL_TRIANGLES, mesh.index_count, GL_UNSIGNED_INT, None, len(batch))
+            # Avant de délier : avec un VAO, les attributs d'instance font partie de son état
+            self._disable_instance_pointers()
+            mesh.unbind()
+            first += len(batch)
+
+        self.state.use_program(0)
+
+    def _set_instance_pointers(self, offset):
+        """Attributs par instance : 4 colonnes de matrice puis la couleur."""
+        for column in range(4):
+            location = ATTRIB_MODEL + column
+            glEnableVertexAttribArray(location)
+            glVertexAttribPointer(location, 4, GL_FLOAT, GL_FALSE, INSTANCE_STRIDE,
+                                  ctypes.c_void_p(offset + column * 16))
+            glVertexAttribDivisor(location, 1)
+        glEnableVertexAttribArray(ATTRIB_COLOR)
+        glVertexAttribPointer(ATTRIB_COLOR, 3, GL_FLOAT, GL_FALSE, INSTANCE_STRIDE,
+                              ctypes.c_void_p(offset + 64))
+        glVertexAttribDivisor(ATTRIB_COLOR, 1)
+
+    def _disable_instance_pointers(self):
+        for location in range(ATTRIB_MODEL, ATTRIB_COLOR + 1):
+            glVertexAttribDivisor(location, 0)
+            glDisableVertexAttribArray(location)
+
+    def cleanup(self):
+        """Libère le programme et le buffer d'instances."""
+        if self.instance_vbo is not None:
+            glDeleteBuffers(1, [self.instance_vbo])
+            self.instance_vbo = None
+        if self.program:
+            self.state.use_program(0)
+            glDeleteProgram(self.program)
+            self.program = None
@@ -1,6 +1,9 @@
 import pygame
 import math
 from collections import deque
+from core.blade_trail import TRAIL_LAYERS, smooth_points, build_strip
+from core.sounds import sounds, BLADE_SWIPE_SOUNDS, BLADE_IMPACT_SOUNDS
+from data.config import BLADE_TRAIL_SUBDIVISIONS
 
 
 class Blade:
@@ -21,17 +24,9 @@ class Blade:
         self.load_sounds()
 
     def load_sounds(self):
-        for i in range(1, 5):
-            try:
-                swipe = pygame.mixer.Sound(f"asset/Blade/bamboo-swipe-{i}.wav")
-                self.swipe_sounds.append(swipe)
-            except:
-                pass
-            try:
-                impact = pygame.mixer.Sound(f"asset/Blade/bamboo-impact-{i}.wav")
-                self.impact_sounds.append(impact)
-            except:
-                pass
+        # Sons partagés : une nouvelle lame ne relit rien sur le disque
+        self.swipe_sounds = sounds.get_list(BLADE_SWIPE_SOUNDS)
+        self.impact_sounds = sounds.get_list(BLADE_IMPACT_SOUNDS)
 
     def update(self, pos):
         """Ajoute un point si la souris a bougé."""
@@ -73,21 +68,37 @@ class Blade:
         self.last_sound_pos = None
 
     def render(self, screen):
+        """Dessine la traînée et retourne la zone touchée (ou None)."""
         if len(self.points) < 2:
-            return
+            return None
 
         points_list = list(self.points)
+        dirty = None
         for i in range(1, len(points_list)):
             thickness = max(1, int(5 * (i / len(points_list))))
 
             # Lueur bleue (dessous)
             if thickness > 2:
-                pygame.draw.line(screen, (100, 150, 255),
-                               points_list[i - 1], points_list[i], thickness + 2)
+                rect = pygame.draw.line(screen, (100, 150, 255),
+                                        points_list[i - 1], points_list[i], thickness + 2)
+                dirty = rect if dirty is None else dirty.union(rect)
 
             # Ligne blanche (dessus)
-            pygame.draw.line(screen, (255, 255, 255),
-                           points_list[i - 1], points_list[i], thickness)
+            rect = pygame.draw.line(screen, (255, 255, 255),
+                                    points_list[i - 1], points_list[i], thickness)
+            dirty = rect if dirty is None else dirty.union(rect)
+        return dirty
+
+    def render_gl(self, renderer):
+        """Dessine la traînée directement en OpenGL (bande lissée, sans passer par l'overlay)."""
+        if len(self.points) < 2:
+            return
+
+        points = smooth_points(list(self.points), BLADE_TRAIL_SUBDIVISIONS)
+        for color, width in TRAIL_LAYERS:
+            strip = build_strip(points, width)
+            if strip is not None:
+                renderer.draw_strip(strip, color)
 
     def collides_with(self, x, y, radius):
         """Vérifie si la lame touche un cercle."""
@@ -0,0 +1,62 @@
+"""
+Maillage de la traînée de lame : bande de triangles effilée, lissée par spline.
+"""
+import numpy
+
+# Couches dessinées de la queue vers la tête : (couleur RGB, largeur max en pixels)
+TRAIL_LAYERS = (
+    ((100, 150, 255), 7.0),   # Lueur bleue (dessous)
+    ((255, 255, 255), 5.0),   # Ligne blanche (dessus)
+)
+
+
+def smooth_points(points, subdivisions):
+    """Interpole les points par une spline de Catmull-Rom.
+
+    Chaque segment est découpé en subdivisions + 1 morceaux ; la courbe passe
+    par tous les points d'origine. Retourne un tableau (M, 2).
+    """
+    points = numpy.asarray(points, dtype=numpy.float32).reshape(-1, 2)
+    if subdivisions <= 0 or len(points) < 3:
+        return points
+
+    # Points fantômes aux extrémités pour que la courbe atteigne le premier et le dernier point
+    padded = numpy.concatenate((2 * points[:1] - points[1:2], points, 2 * points[-1:] - points[-2:-1]))
+    p0, p1, p2, p3 = padded[:-3], padded[1:-2], padded[2:-1], padded[3:]
+
+    t = numpy.linspace(0.0, 1.0, subdivisions + 1, endpoint=False, dtype=numpy.float32)[None, :, None]
+    t2 = t * t
+    t3 = t2 * t
+    curve = 0.5 * ((2 * p1[:, None]) +
+                   (p2 - p0)[:, None] * t +
+                   (2 * p0 - 5 * p1 + 4 * p2 - p3)[:, None] * t2 +
+                   (3 * p1 - p0 - 3 * p2 + p3)[:, None] * t3)
+    return numpy.concatenate((curve.reshape(-1, 2), points[-1:]))
+
+
+def build_strip(points, max_width, min_width=1.0):
+    """Construit une bande de triangles (GL_TRIANGLE_STRIP) autour de la polyligne.
+
+    La largeur croît de la queue (premier point) jusqu'à max_width à la tête.
+    Retourne un tableau float32 (2 * M, 2) ou None si la traînée est trop courte.
+    """
+    count = len(points)
+    if count < 2:
+        return None
+
+    # Tangentes par différences centrées, normales orientées à gauche
+    tangents = numpy.empty_like(points)
+    tangents[1:-1] = points[2:] - points[:-2]
+    tangents[0] = points[1] - points[0]
+    tangents[-1] = points[-1] - points[-2]
+    lengths = numpy.hypot(tangents[:, 0], tangents[:, 1])
+    lengths[lengths == 0] = 1.0
+    normals = numpy.stack((-tangents[:, 1], tangents[:, 0]), axis=1) / lengths[:, None]
+
+    widths = numpy.maximum(min_width, max_width * numpy.linspace(0.0, 1.0, count, dtype=numpy.float32))
+    offsets = normals * (widths * 0.5)[:, None]
+
+    strip = numpy.empty((count, 2, 2), dtype=numpy.float32)
+    strip[:, 0] = points + offsets
+    strip[:, 1] = points - offsets
+    return strip.reshape(-1, 2)
@@ -1,5 +1,13 @@
 import pygame
 import random
+from core.impostors import impostors
+from core.objet3D import SCALE_3D
+from core.sounds import sounds, BOMB_FUSE_SOUND
+from data.config import BOMB_MODEL
+
+# Teinte de l'impostor de la bombe si l'atlas de textures est absent ; sinon, comme en
+# GL, Bomb.mtl renvoie vers l'atlas des fruits et render_sheet en échantillonne les texels
+BOMB_COLOR = (60, 60, 60)
 
 
 class Bomb:
@@ -19,14 +27,16 @@ class Bomb:
 
         # Charger et jouer le son de mèche
         if Bomb.fuse_sound is None:
-            try:
-                Bomb.fuse_sound = pygame.mixer.Sound("asset/Sound object/Bomb-Fuse.wav")
-            except:
-                pass
+            Bomb.fuse_sound = sounds.get(BOMB_FUSE_SOUND)
 
         if Bomb.fuse_sound:
             self.channel = Bomb.fuse_sound.play(-1)  # Loop infini
 
+    @classmethod
+    def load_impostors(cls):
+        """Prépare la planche d'impostors de la bombe."""
+        impostors.load('Bomb', BOMB_MODEL, scale_3d=SCALE_3D.get('bomb', 1.0), color=BOMB_COLOR)
+
     def update(self, dt):
         # Facteur de temps (60 FPS de base)
         time_factor = dt * 60
@@ -36,21 +46,31 @@ class Bomb:
         self.y += self.velocity_y * time_factor
         self.rotation += 3 * time_factor
 
+    def render_sprite(self, sprites):
+        """Ajoute l'impostor de la bombe au lot de sprites ; False s'il n'y est pas."""
+        sheet = impostors.get('Bomb')
+        return not self.is_exploded and sheet is not None and sheet.add_sprite(sprites, self.x, self.y, self.rotation)
+
     def render(self, screen):
+        """Rendu logiciel, retourne la zone touchée."""
+        sheet = impostors.get('Bomb')
         if self.is_exploded:
             # Explosion
-            pygame.draw.circle(screen, (255, 150, 0), (int(self.x), int(self.y)), self.radius + 20)
+            dirty = pygame.draw.circle(screen, (255, 150, 0), (int(self.x), int(self.y)), self.radius + 20)
             pygame.draw.circle(screen, (255, 255, 0), (int(self.x), int(self.y)), self.radius + 10)
-        else:
-            # Bombe noire
-            pygame.draw.circle(screen, (30, 30, 30), (int(self.x), int(self.y)), self.radius)
-            # Mèche
-            pygame.draw.line(screen, (139, 69, 19),
-                           (int(self.x), int(self.y) - self.radius),
-                           (int(self.x) + 10, int(self.y) - self.radius - 15), 3)
-            # Étincelle
-            pygame.draw.circle(screen, (255, 200, 0),
-                             (int(self.x) + 10, int(self.y) - self.radius - 15), 5)
+            return dirty
+        if sheet:
+            return sheet.blit(screen, self.x, self.y, self.rotation)
+        # Bombe noire
+        dirty = pygame.draw.circle(screen, (30, 30, 30), (int(self.x), int(self.y)), self.radius)
+        # Mèche
+        dirty.union_ip(pygame.draw.line(screen, (139, 69, 19),
+                                        (int(self.x), int(self.y) - self.radius),
+                                        (int(self.x) + 10, int(self.y) - self.radius - 15), 3))
+        # Étincelle
+        dirty.union_ip(pygame.draw.circle(screen, (255, 200, 0),
+                                          (int(self.x) + 10, int(self.y) - self.radius - 15), 5))
+        return dirty
 
     def explode(self):
         self.is_exploded = True
@@ -1,4 +1,4 @@
-import pygame
+from core.sounds import sounds, COMBO_SOUNDS, STACK_SOUNDS, ULTRA_SOUNDS
 
 
 class ComboSystem:
@@ -17,38 +17,10 @@ class ComboSystem:
         self.load_sounds()
 
     def load_sounds(self):
-        # Sons combo 2-8 (pas de son pour combo 1)
-        for i in range(1, 9):
-            if i <= 5:
-                path = f"asset/Sound Combo/combo-{i}.wav"
-            else:
-                path = f"asset/Sound Combo/Combo-{i}.wav"
-            try:
-                self.combo_sounds[i] = pygame.mixer.Sound(path)
-            except:
-                pass
-
-        # Sons stack 1-5
-        stack_paths = {
-            1: "asset/Sound Combo/Stack-combo-1.wav",
-            2: "asset/Sound Combo/Strack-combo-2.wav",
-            3: "asset/Sound Combo/Stack-combo-3.wav",
-            4: "asset/Sound Combo/Stack-combo-4.wav",
-            5: "asset/Sound Combo/Stack-comb-5.wav"
-        }
-        for i, path in stack_paths.items():
-            try:
-                self.stack_sounds[i] = pygame.mixer.Sound(path)
-            except:
-                pass
-
-        # Sons ultra stack 1-6
-        for i in range(1, 7):
-            path = f"asset/Sound Combo/Ultra-Stack-combo-{i}.wav"
-            try:
-                self.ultra_sounds[i] = pygame.mixer.Sound(path)
-            except:
-                pass
+        # Sons partagés : un nouveau ComboSystem ne relit rien sur le disque
+        self.combo_sounds = sounds.get_dict(COMBO_SOUNDS)
+        self.stack_sounds = sounds.get_dict(STACK_SOUNDS)
+        self.ultra_sounds = sounds.get_dict(ULTRA_SOUNDS)
 
     def add_hit(self):
         """Appelé quand un fruit est coupé."""
@@ -0,0 +1,83 @@
+"""
+Suivi des zones modifiées d'un calque 2D (dirty rectangles).
+"""
+import pygame
+
+
+class DirtyRegion:
+    """Accumule les rectangles modifiés d'un calque pendant une frame.
+
+    Une zone dessinée à la frame N doit être effacée puis ré-uploadée à la
+    frame N+1 : les rectangles à envoyer sont donc l'union de ceux de la
+    frame précédente et de ceux de la frame courante.
+    """
+
+    def __init__(self, size, full_threshold=0.5, max_rects=16):
+        self.bounds = pygame.Rect((0, 0), size)
+        self.full_threshold = full_threshold  # Part de l'écran au-delà de laquelle on envoie tout
+        self.max_rects = max_rects
+        self.rects = []           # Zones de la frame courante
+        self.previous = []        # Zones de la frame précédente
+        self.full = True          # Frame courante entièrement modifiée
+        self.previous_full = True
+
+    def add(self, rect):
+        """Signale une zone modifiée (Rect, tuple ou None)."""
+        if rect is None or self.full:
+            return
+        rect = self.bounds.clip(pygame.Rect(rect))
+        if rect.width > 0 and rect.height > 0:
+            self.rects.append(rect)
+
+    def mark_full(self):
+        """Signale que tout le calque est modifié."""
+        self.full = True
+        self.rects = []
+
+    def reset(self):
+        """Oublie l'historique : la prochaine frame sera traitée en entier."""
+        self.rects = []
+        self.previous = []
+        self.full = True
+        self.previous_full = True
+
+    def begin_frame(self, surface):
+        """Efface sur la surface les zones dessinées à la frame précédente."""
+        if self.previous_full:
+            surface.fill((0, 0, 0, 0))
+        else:
+            for rect in self.previous:
+                surface.fill((0, 0, 0, 0), rect)
+        self.rects = []
+        self.full = False
+
+    def flush(self):
+        """Termine la frame et retourne les zones à uploader (None = tout le calque)."""
+        if self.full or self.previous_full:
+            result = None
+        else:
+            result = merge_rects(self.previous + self.rects, self.max_rects)
+            area = sum(rect.width * rect.height for rect in result)
+            if area > self.full_threshold * self.bounds.width * self.bounds.height:
+                result = None
+
+        self.previous = merge_rects(self.rects, self.max_rects)
+        self.previous_full = self.full
+        self.rects = []
+        return result
+
+
+def merge_rects(rects, max_rects):
+    """Fusionne les rectangles qui se chevauchent (englobant unique si trop nombreux)."""
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+
+    if len(merged) > max_rects:
+        merged = [merged[0].unionall(merged[1:])]
+    return merged
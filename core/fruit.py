@@ -1,5 +1,8 @@
 import pygame
 import random
+from core.impostors import impostors
+from core.objet3D import SCALE_3D
+from data.config import FRUIT_MODELS, FRUIT_MODELS_CUT, FRUIT_MODELS_CUT2, FRUIT_SCALES
 
 
 FRUIT_COLORS = {
@@ -27,6 +30,20 @@ class Fruit:
         self.is_cut = False
         self.radius = 30
         self.color = FRUIT_COLORS.get(self.fruit_type, (255, 255, 255))
+        self.cut_spread = 0  # Écart entre les deux moitiés après la coupe
+
+    @classmethod
+    def load_impostors(cls):
+        """Prépare les planches d'impostors des fruits entiers et coupés."""
+        for fruit_type in cls.TYPES:
+            name = fruit_type.capitalize()
+            options = dict(custom_scale=FRUIT_SCALES.get(fruit_type, 1.0),
+                           scale_3d=SCALE_3D.get(fruit_type, 1.0),
+                           color=FRUIT_COLORS[fruit_type])
+            impostors.load(name, FRUIT_MODELS[fruit_type], **options)
+            impostors.load(f"{name}-C", FRUIT_MODELS_CUT[fruit_type], **options)
+            if fruit_type in FRUIT_MODELS_CUT2:
+                impostors.load(f"{name}-C2", FRUIT_MODELS_CUT2[fruit_type], **options)
 
     def update(self, dt):
         # Facteur de temps (60 FPS de base)
@@ -36,15 +53,41 @@ class Fruit:
         self.x += self.velocity_x * time_factor
         self.y += self.velocity_y * time_factor
         self.rotation += self.rotation_speed * time_factor
+        if self.is_cut:
+            self.cut_spread += 2 * time_factor
+
+    def _impostor_frames(self):
+        """Images d'impostor à dessiner : liste de (planche, x, angle), ou None sans planche."""
+        name = self.fruit_type.capitalize()
+        if not self.is_cut:
+            sheet = impostors.get(name)
+            return [(sheet, self.x, self.rotation)] if sheet else None
+        left = impostors.get(f"{name}-C")
+        if not left:
+            return None
+        right = impostors.get(f"{name}-C2")
+        # Sans modèle -C2, la seconde moitié est la première vue de dos
+        return [(left, self.x - self.cut_spread, self.rotation),
+                (right or left, self.x + self.cut_spread, self.rotation + (0 if right else 180))]
+
+    def render_sprite(self, sprites):
+        """Ajoute les impostors du fruit au lot de sprites ; False s'ils n'y sont pas."""
+        frames = self._impostor_frames()
+        return bool(frames) and all(sheet.add_sprite(sprites, x, self.y, angle) for sheet, x, angle in frames)
 
     def render(self, screen):
+        """Rendu logiciel, retourne la zone touchée."""
+        frames = self._impostor_frames()
+        if frames:
+            dirty = [sheet.blit(screen, x, self.y, angle) for sheet, x, angle in frames]
+            return dirty[0].unionall(dirty[1:])
         if self.is_cut:
             s = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
             pygame.draw.circle(s, (*self.color, 100), (self.radius, self.radius), self.radius)
-            screen.blit(s, (self.x - self.radius, self.y - self.radius))
-        else:
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
-            pygame.draw.circle(screen, (255, 255, 255), (int(self.x) - 8, int(self.y) - 8), 8)
+            return screen.blit(s, (self.x - self.radius, self.y - self.radius))
+        dirty = pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
+        pygame.draw.circle(screen, (255, 255, 255), (int(self.x) - 8, int(self.y) - 8), 8)
+        return dirty
 
     def cut(self):
         self.is_cut = True
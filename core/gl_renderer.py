@@ -1,29 +1,221 @@
 """
 Gestionnaire du contexte OpenGL pour le rendu.
 """
+import math
+import sys
+import numpy
 import pygame
 from OpenGL.GL import *
-from OpenGL.GLU import *
+from core.shaders import compile_program, POST_VERTEX_SHADER, POST_FRAGMENT_SHADER, ATTRIB_POSITION
+from core.viewport import Viewport
+from data.config import OPENGL_FOV, OPENGL_NEAR, OPENGL_FAR, CAMERA_DISTANCE
 
 
-class GLRenderer:
-    """Gère le rendu OpenGL directement à l'écran."""
+class GLState:
+    """Mémorise l'état OpenGL courant pour sauter les appels redondants.
+
+    Le code qui modifie ces états sans passer par le cache doit les
+    restaurer avant de rendre la main (ou appeler invalidate()).
+    """
+
+    def __init__(self):
+        self.capabilities = {}
+        self.texture = None
+        self.program = None
+        self.blend_func = None
+
+    def enable(self, *capabilities):
+        for capability in capabilities:
+            if self.capabilities.get(capability) is not True:
+                glEnable(capability)
+                self.capabilities[capability] = True
+
+    def disable(self, *capabilities):
+        for capability in capabilities:
+            if self.capabilities.get(capability) is not False:
+                glDisable(capability)
+                self.capabilities[capability] = False
+
+    def bind_texture(self, texture_id):
+        if self.texture != texture_id:
+            glBindTexture(GL_TEXTURE_2D, texture_id)
+            self.texture = texture_id
+
+    def use_program(self, program):
+        if self.program != program:
+            glUseProgram(program)
+            self.program = program
+
+    def set_blend_func(self, source, destination):
+        if self.blend_func != (source, destination):
+            glBlendFunc(source, destination)
+            self.blend_func = (source, destination)
+
+    def invalidate(self):
+        """Oublie l'état connu (après du code GL extérieur au cache)."""
+        self.capabilities.clear()
+        self.texture = None
+        self.program = None
+        self.blend_func = None
+
+
+class Camera:
+    """Caméra fixe du jeu : matrices de projection et de vue précalculées.
+
+    Les matrices sont stockées en float32, ordre colonnes (prêtes pour
+    glLoadMatrixf / glUniformMatrix4fv).
+    """
+
+    def __init__(self, width, height, fov=OPENGL_FOV, near=OPENGL_NEAR, far=OPENGL_FAR,
+                 distance=CAMERA_DISTANCE):
+        self.width = width
+        self.height = height
+        self.fov = fov
+        self.distance = distance
+        aspect = width / height
+
+        # Étendue visible dans le plan z = 0 où vivent les objets
+        self.half_fov_y = math.radians(fov) / 2.0
+        self.half_fov_x = math.atan(math.tan(self.half_fov_y) * aspect)
+        self.half_height = distance * math.tan(self.half_fov_y)
+        self.half_width = self.half_height * aspect
+
+        # Équivalent de gluPerspective
+        f = 1.0 / math.tan(self.half_fov_y)
+        projection = numpy.zeros((4, 4))
+        projection[0, 0] = f / aspect
+        projection[1, 1] = f
+        projection[2, 2] = (far + near) / (near - far)
+        projection[2, 3] = 2.0 * far * near / (near - far)
+        projection[3, 2] = -1.0
+
+        # Équivalent de gluLookAt(0, 0, distance, 0, 0, 0, 0, 1, 0)
+        view = numpy.identity(4)
+        view[2, 3] = -distance
+
+        # Équivalent de glOrtho(0, width, height, 0, -1, 1)
+        ortho = numpy.identity(4)
+        ortho[0, 0] = 2.0 / width
+        ortho[1, 1] = -2.0 / height
+        ortho[2, 2] = -1.0
+        ortho[0, 3] = -1.0
+        ortho[1, 3] = 1.0
+
+        self.projection = _gl_matrix(projection)
+        self.view = _gl_matrix(view)
+        self.ortho = _gl_matrix(ortho)
+        self.identity = _gl_matrix(numpy.identity(4))
+
+    def screen_to_world(self, xs, ys):
+        """Convertit des tableaux de coordonnées écran en coordonnées monde (plan z = 0)."""
+        gl_x = (numpy.asarray(xs) / self.width - 0.5) * 2.0 * self.half_width
+        gl_y = -(numpy.asarray(ys) / self.height - 0.5) * 2.0 * self.half_height
+        return gl_x, gl_y
+
+
+def _gl_matrix(matrix):
+    """Matrice numpy (convention lignes) vers float32 en ordre colonnes."""
+    return numpy.ascontiguousarray(matrix.T, dtype=numpy.float32)
+
+
+class RenderTarget:
+    """Framebuffer hors écran (couleur + profondeur) à la résolution interne."""
 
     def __init__(self, width, height):
+        self.size = (width, height)
+        self.fbo = glGenFramebuffers(1)
+        self.color, self.depth = glGenRenderbuffers(2)
+
+        glBindRenderbuffer(GL_RENDERBUFFER, self.color)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_RGBA8, width, height)
+        glBindRenderbuffer(GL_RENDERBUFFER, self.depth)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH_COMPONENT24, width, height)
+        glBindRenderbuffer(GL_RENDERBUFFER, 0)
+
+        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_RENDERBUFFER, self.color)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_DEPTH_ATTACHMENT, GL_RENDERBUFFER, self.depth)
+        status = glCheckFramebufferStatus(GL_FRAMEBUFFER)
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        if status != GL_FRAMEBUFFER_COMPLETE:
+            self.release()
+            raise RuntimeError(f"Framebuffer incomplete: 0x{status:x}")
+
+    def bind(self):
+        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+        glViewport(0, 0, *self.size)
+
+    def blit_to_screen(self, rect, output_height):
+        """Copie l'image filtrée (GL_LINEAR) dans rect (pixels, origine en haut) du framebuffer écran."""
+        glBindFramebuffer(GL_READ_FRAMEBUFFER, self.fbo)
+        glBindFramebuffer(GL_DRAW_FRAMEBUFFER, 0)
+        bottom = output_height - rect.bottom
+        glBlitFramebuffer(0, 0, self.size[0], self.size[1],
+                          rect.left, bottom, rect.right, bottom + rect.height,
+                          GL_COLOR_BUFFER_BIT, GL_LINEAR)
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+
+    def release(self):
+        if self.fbo is not None:
+            glDeleteFramebuffers(1, [self.fbo])
+            glDeleteRenderbuffers(2, [self.color, self.depth])
+            self.fbo = None
+
+
+class GLRenderer:
+    """Gère le rendu OpenGL à l'écran, éventuellement via une résolution interne.
+
+    Tout est décrit en coordonnées logiques (width x height). Avec
+    render_scale != 1 ou une fenêtre d'une autre taille, la frame est
+    rendue dans un RenderTarget de taille logique x render_scale puis
+    étirée dans la fenêtre par un seul blit filtré ; les calques 2D
+    Pygame restent à la taille logique.
+    """
+
+    def __init__(self, width, height, render_scale=1.0, viewport=None):
         self.width = width
         self.height = height
+        self.viewport = viewport or Viewport((width, height), _drawable_size(), pygame.display.get_window_size())
+        self.target = None         # RenderTarget si la résolution interne diffère de la sortie
+        self.layers = {}           # StreamingTexture par nom de calque
+        self.static_textures = {}  # (surface, StreamingTexture) par id de surface
+        self.use_pbo = bool(glGenBuffers)
+        self.state = GLState()
+        self.camera = Camera(width, height)
+        self.mode = None           # '2d' ou '3d'
+        self.post_program = None   # Shader des teintes plein écran
+        self.post_uniforms = {}
+        self.post_vbo = None
         self._init_opengl()
+        self._init_post_process()
+        self._init_render_target(render_scale)
+
+    def _init_render_target(self, render_scale):
+        """Crée le framebuffer interne si la résolution de rendu diffère de la zone de sortie."""
+        size = (max(1, round(self.width * render_scale)), max(1, round(self.height * render_scale)))
+        if size == self.viewport.rect.size:
+            return
+        try:
+            if not (bool(glGenFramebuffers) and bool(glBlitFramebuffer)):
+                raise RuntimeError("framebuffer objects not supported")
+            self.target = RenderTarget(*size)
+        except Exception as e:
+            print(f"Warning: internal render resolution unavailable, rendering at output size: {e}")
+            self.target = None
+
+    @property
+    def pixel_scale(self):
+        """Pixels rastérisés par pixel logique (résolution interne, sinon zone de sortie)."""
+        height = self.target.size[1] if self.target is not None else self.viewport.rect.height
+        return height / self.height
 
     def _init_opengl(self):
         """Initialise le contexte OpenGL."""
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glEnable(GL_LIGHT0)
-        glEnable(GL_COLOR_MATERIAL)
-        glEnable(GL_NORMALIZE)
+        self.state.enable(GL_DEPTH_TEST, GL_LIGHTING, GL_LIGHT0, GL_COLOR_MATERIAL,
+                          GL_NORMALIZE, GL_CULL_FACE)
         glShadeModel(GL_SMOOTH)
-        glEnable(GL_CULL_FACE)
         glCullFace(GL_BACK)
+        glClearColor(0.0, 0.0, 0.0, 1.0)
         self._setup_lighting()
 
     def _setup_lighting(self):
@@ -33,82 +225,306 @@ class GLRenderer:
         light_diffuse = [0.8, 0.8, 0.8, 1.0]
         light_specular = [0.5, 0.5, 0.5, 1.0]
 
+        # La position est transformée par la modelview courante (identité ici)
+        glMatrixMode(GL_MODELVIEW)
+        glLoadIdentity()
         glLightfv(GL_LIGHT0, GL_POSITION, light_position)
         glLightfv(GL_LIGHT0, GL_AMBIENT, light_ambient)
         glLightfv(GL_LIGHT0, GL_DIFFUSE, light_diffuse)
         glLightfv(GL_LIGHT0, GL_SPECULAR, light_specular)
         glColorMaterial(GL_FRONT, GL_AMBIENT_AND_DIFFUSE)
 
+    def _init_post_process(self):
+        """Prépare le quad plein écran des teintes (sinon repli en pipeline fixe)."""
+        try:
+            self.post_program, self.post_uniforms = compile_program(
+                POST_VERTEX_SHADER, POST_FRAGMENT_SHADER, {'a_position': ATTRIB_POSITION})
+            quad = numpy.array([-1, -1, 1, -1, -1, 1, 1, 1], dtype=numpy.float32)
+            self.post_vbo = glGenBuffers(1)
+            glBindBuffer(GL_ARRAY_BUFFER, self.post_vbo)
+            glBufferData(GL_ARRAY_BUFFER, quad.nbytes, quad, GL_STATIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+        except Exception as e:
+            print(f"Warning: post-process shader unavailable: {e}")
+            self.post_program = None
+
     def begin_frame(self):
         """Début du rendu d'une frame."""
-        glClearColor(0.0, 0.0, 0.0, 1.0)
+        if self.target is not None:
+            self.target.bind()
+        else:
+            rect = self.viewport.rect
+            glViewport(rect.left, self.viewport.output_size[1] - rect.bottom, rect.width, rect.height)
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
+    def end_frame(self):
+        """Fin de frame : étire la résolution interne dans la fenêtre."""
+        if self.target is None:
+            return
+        glViewport(0, 0, *self.viewport.output_size)
+        glClear(GL_COLOR_BUFFER_BIT)   # Bandes noires hors de la zone logique
+        self.target.blit_to_screen(self.viewport.rect, self.viewport.output_size[1])
+
     def setup_3d(self):
         """Configure pour le rendu 3D."""
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glEnable(GL_LIGHT0)
-        glEnable(GL_CULL_FACE)
-
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(45.0, self.width / self.height, 0.1, 100.0)
+        self.state.enable(GL_DEPTH_TEST, GL_LIGHTING, GL_LIGHT0, GL_CULL_FACE)
+        self.state.disable(GL_TEXTURE_2D, GL_BLEND)
+        if self.mode != '3d':
+            glMatrixMode(GL_PROJECTION)
+            glLoadMatrixf(self.camera.projection)
+            self.mode = '3d'
 
         glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
-        gluLookAt(0, 0, 10,  # Caméra plus loin
-                  0, 0, 0,
-                  0, 1, 0)
+        glLoadMatrixf(self.camera.view)
 
     def setup_2d(self):
         """Configure pour le rendu 2D (textures Pygame)."""
-        glDisable(GL_DEPTH_TEST)
-        glDisable(GL_LIGHTING)
-        glDisable(GL_CULL_FACE)
-
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        glOrtho(0, self.width, self.height, 0, -1, 1)
+        self.state.disable(GL_DEPTH_TEST, GL_LIGHTING, GL_CULL_FACE)
+        if self.mode != '2d':
+            glMatrixMode(GL_PROJECTION)
+            glLoadMatrixf(self.camera.ortho)
+            self.mode = '2d'
 
         glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
+        glLoadMatrixf(self.camera.identity)
 
-    def draw_surface(self, surface):
-        """Dessine une surface Pygame comme texture OpenGL."""
-        width, height = surface.get_size()
-        data = pygame.image.tostring(surface, 'RGBA', True)
+    def draw_surface(self, surface, layer='overlay', dirty_rects=None):
+        """Dessine une surface Pygame via la texture persistante du calque.
 
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0,
-                     GL_RGBA, GL_UNSIGNED_BYTE, data)
+        dirty_rects limite l'upload aux zones modifiées (None = surface entière).
+        """
+        texture = self.layers.get(layer)
+        if texture is None or texture.size != surface.get_size():
+            if texture is None:
+                texture = StreamingTexture(self.state, self.use_pbo)
+                self.layers[layer] = texture
+            dirty_rects = None
+
+        if dirty_rects is None:
+            texture.upload(surface)
+        else:
+            for rect in dirty_rects:
+                texture.upload(surface, rect)
+        self._draw_textured_quad(texture.texture_id, *surface.get_size())
+
+    def draw_static_surface(self, surface):
+        """Dessine une surface qui ne change jamais (uploadée à la première utilisation)."""
+        entry = self.static_textures.get(id(surface))
+        if entry is None:
+            texture = StreamingTexture(self.state, use_pbo=False)
+            texture.upload(surface)
+            # On garde la surface pour que son id() reste unique
+            entry = (surface, texture)
+            self.static_textures[id(surface)] = entry
 
-        glEnable(GL_TEXTURE_2D)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        self._draw_textured_quad(entry[1].texture_id, *surface.get_size())
+
+    def draw_tint(self, color):
+        """Post-process : mélange une couleur RGBA (0-255) sur toute l'image."""
+        r, g, b, a = (c / 255.0 for c in color)
+        self.state.enable(GL_BLEND)
+        self.state.set_blend_func(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+        if self.post_program is not None:
+            self.state.use_program(self.post_program)
+            glUniform4f(self.post_uniforms['u_color'], r, g, b, a)
+            glBindBuffer(GL_ARRAY_BUFFER, self.post_vbo)
+            glEnableVertexAttribArray(ATTRIB_POSITION)
+            glVertexAttribPointer(ATTRIB_POSITION, 2, GL_FLOAT, GL_FALSE, 0, None)
+            glDrawArrays(GL_TRIANGLE_STRIP, 0, 4)
+            glDisableVertexAttribArray(ATTRIB_POSITION)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            self.state.use_program(0)
+        else:
+            self.state.disable(GL_TEXTURE_2D)
+            glColor4f(r, g, b, a)
+            glBegin(GL_QUADS)
+            glVertex2f(0, 0)
+            glVertex2f(self.width, 0)
+            glVertex2f(self.width, self.height)
+            glVertex2f(0, self.height)
+            glEnd()
+
+    def draw_strip(self, vertices, color):
+        """Dessine une bande de triangles 2D (pixels écran) d'une couleur RGB (0-255)."""
+        self.state.use_program(0)
+        self.state.disable(GL_TEXTURE_2D)
+        self.state.enable(GL_BLEND)
+        self.state.set_blend_func(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+        glColor4f(color[0] / 255.0, color[1] / 255.0, color[2] / 255.0, 1.0)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, vertices)
+        glDrawArrays(GL_TRIANGLE_STRIP, 0, len(vertices))
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    def sprite_batch(self, atlas):
+        """Lot de sprites de l'atlas pour ce backend."""
+        from core.sprite_atlas import SpriteBatch
+        return SpriteBatch(self, atlas)
+
+    def present(self):
+        pygame.display.flip()
+
+    def _draw_textured_quad(self, texture_id, width, height):
+        """Dessine un quad plein écran texturé (ligne 0 de la texture en haut)."""
+        self.state.use_program(0)
+        self.state.bind_texture(texture_id)
+        self.state.enable(GL_TEXTURE_2D, GL_BLEND)
+        self.state.set_blend_func(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
 
         glColor4f(1, 1, 1, 1)
         glBegin(GL_QUADS)
-        glTexCoord2f(0, 1); glVertex2f(0, 0)
-        glTexCoord2f(1, 1); glVertex2f(width, 0)
-        glTexCoord2f(1, 0); glVertex2f(width, height)
-        glTexCoord2f(0, 0); glVertex2f(0, height)
+        glTexCoord2f(0, 0); glVertex2f(0, 0)
+        glTexCoord2f(1, 0); glVertex2f(width, 0)
+        glTexCoord2f(1, 1); glVertex2f(width, height)
+        glTexCoord2f(0, 1); glVertex2f(0, height)
         glEnd()
 
-        glDisable(GL_BLEND)
-        glDisable(GL_TEXTURE_2D)
-        glDeleteTextures([texture_id])
-
     def cleanup(self):
         """Libère les ressources."""
-        pass
+        for texture in self.layers.values():
+            texture.release()
+        self.layers.clear()
+
+        for _, texture in self.static_textures.values():
+            texture.release()
+        self.static_textures.clear()
+
+        if self.post_program is not None:
+            glDeleteProgram(self.post_program)
+            glDeleteBuffers(1, [self.post_vbo])
+            self.post_program = None
+
+        if self.target is not None:
+            self.target.release()
+            self.target = None
+
+
+class StreamingTexture:
+    """Texture persistante mise à jour en place par glTexSubImage2D.
+
+    Les pixels sont lus directement dans le buffer de la surface (sans copie
+    tostring) et transitent par un Pixel Buffer Object orphelin à chaque
+    upload : le driver lui alloue une nouvelle mémoire au lieu d'attendre
+    que le GPU ait fini de lire la précédente.
+    """
+
+    def __init__(self, state, use_pbo=True):
+        self.state = state
+        self.texture_id = None
+        self.size = None
+        self.use_pbo = use_pbo
+        self.pbo = None
+
+    def _allocate(self, width, height):
+        """(Ré)alloue la texture à la taille de la surface."""
+        if self.texture_id is None:
+            self.texture_id = glGenTextures(1)
+        self.state.bind_texture(self.texture_id)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA8, width, height, 0,
+                     GL_RGBA, GL_UNSIGNED_BYTE, None)
+        self.size = (width, height)
+
+        if self.use_pbo and self.pbo is None:
+            try:
+                self.pbo = glGenBuffers(1)
+            except Exception as e:
+                print(f"Warning: Could not create pixel buffer object, uploading directly: {e}")
+                self.use_pbo = False
+
+    def upload(self, surface, rect=None):
+        """Envoie la zone rect (toute la surface par défaut) dans la texture."""
+        width, height = surface.get_size()
+        if self.size != (width, height):
+            self._allocate(width, height)
+            rect = None
+        else:
+            self.state.bind_texture(self.texture_id)
+
+        x, y, w, h = rect if rect is not None else (0, 0, width, height)
+        if w <= 0 or h <= 0:
+            return
+
+        pixel_format = surface_pixel_format(surface)
+        if pixel_format is None:
+            # Format inattendu : conversion logicielle de la zone
+            data = pygame.image.tostring(surface.subsurface((x, y, w, h)), 'RGBA', False)
+            glTexSubImage2D(GL_TEXTURE_2D, 0, x, y, w, h, GL_RGBA, GL_UNSIGNED_BYTE, data)
+            return
+
+        pitch = surface.get_pitch()
+        # Le buffer verrouille la surface tant qu'il (ou une vue dessus) existe
+        buffer = surface.get_buffer()
+        rows = None
+        try:
+            # Vue sur les lignes concernées, directement dans la mémoire de la surface
+            rows = numpy.frombuffer(buffer, dtype=numpy.uint8)[y * pitch:(y + h) * pitch]
+
+            glPixelStorei(GL_UNPACK_ROW_LENGTH, pitch // 4)
+            glPixelStorei(GL_UNPACK_SKIP_PIXELS, x)
+
+            if self.use_pbo:
+                glBindBuffer(GL_PIXEL_UNPACK_BUFFER, self.pbo)
+                # Orphelinage : évite d'attendre que le GPU ait fini l'upload précédent
+                glBufferData(GL_PIXEL_UNPACK_BUFFER, rows.nbytes, None, GL_STREAM_DRAW)
+                glBufferSubData(GL_PIXEL_UNPACK_BUFFER, 0, rows.nbytes, rows)
+                glTexSubImage2D(GL_TEXTURE_2D, 0, x, y, w, h,
+                                pixel_format, GL_UNSIGNED_BYTE, None)
+            else:
+                glTexSubImage2D(GL_TEXTURE_2D, 0, x, y, w, h,
+                                pixel_format, GL_UNSIGNED_BYTE, rows)
+        finally:
+            if self.use_pbo:
+                glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+            glPixelStorei(GL_UNPACK_ROW_LENGTH, 0)
+            glPixelStorei(GL_UNPACK_SKIP_PIXELS, 0)
+            del rows, buffer  # Déverrouille la surface
+
+    def release(self):
+        """Libère la texture et le PBO."""
+        if self.texture_id is not None:
+            if self.state.texture == self.texture_id:
+                self.state.bind_texture(0)
+            glDeleteTextures([self.texture_id])
+            self.texture_id = None
+        if self.pbo is not None:
+            glDeleteBuffers(1, [self.pbo])
+            self.pbo = None
+        self.size = None
+
+
+def surface_pixel_format(surface):
+    """Format GL correspondant à la mémoire d'une surface 32 bits avec alpha, sinon None."""
+    if surface.get_bytesize() != 4 or sys.byteorder != 'little':
+        return None
+    r_mask, g_mask, b_mask, a_mask = surface.get_masks()
+    if a_mask != 0xff000000 or g_mask != 0xff00:
+        return None
+    if (r_mask, b_mask) == (0xff0000, 0xff):
+        return GL_BGRA
+    if (r_mask, b_mask) == (0xff, 0xff0000):
+        return GL_RGBA
+    return None
+
+
+def _drawable_size():
+    """Taille du framebuffer écran en pixels (plus grande que la fenêtre en haute densité)."""
+    return tuple(int(v) for v in glGetIntegerv(GL_VIEWPORT)[2:4])
+
 
+def init_opengl_display(width, height, fullscreen=False):
+    """Initialise l'affichage Pygame avec support OpenGL.
 
-def init_opengl_display(width, height):
-    """Initialise l'affichage Pygame avec support OpenGL."""
+    En plein écran, (0, 0) prend la résolution du bureau.
+    """
     pygame.display.gl_set_attribute(pygame.GL_DEPTH_SIZE, 24)
-    screen = pygame.display.set_mode((width, height), pygame.DOUBLEBUF | pygame.OPENGL)
+    flags = pygame.DOUBLEBUF | pygame.OPENGL
+    if fullscreen:
+        flags |= pygame.FULLSCREEN
+    screen = pygame.display.set_mode((width, height), flags)
     return screen
@@ -0,0 +1,61 @@
+"""
+Chargement partagé des images : chaque fichier est décodé une seule fois,
+converti au format de l'affichage, et ses variantes redimensionnées sont
+gardées en cache.
+"""
+import pygame
+
+
+def to_display_format(image, alpha=False):
+    """Convertit l'image au format de l'affichage pour que ses blits ne convertissent plus rien.
+
+    Sans surface d'affichage (backend SDL2), l'image reste dans son format.
+    """
+    if pygame.display.get_surface() is None:
+        return image
+    return image.convert_alpha() if alpha else image.convert()
+
+
+class ImageCache:
+    """Surfaces prêtes à l'emploi par (chemin, taille, alpha).
+
+    Les surfaces rendues sont partagées entre les scènes (et leurs textures
+    GPU avec elles) : ne pas dessiner dessus sans les copier.
+    """
+
+    def __init__(self):
+        self.sources = {}     # Image décodée par chemin
+        self.variants = {}    # Surface convertie par (chemin, taille, alpha, lissage)
+
+    def source(self, path):
+        """Image telle que décodée depuis le fichier (lu une seule fois)."""
+        image = self.sources.get(path)
+        if image is None:
+            image = pygame.image.load(path)
+            self.sources[path] = image
+        return image
+
+    def load(self, path, size=None, alpha=False, smooth=False):
+        """Image du fichier path redimensionnée à size et convertie au format de l'affichage.
+
+        alpha garde la transparence (convert_alpha), smooth redimensionne
+        avec smoothscale au lieu de scale.
+        """
+        size = tuple(size) if size is not None else None
+        key = (path, size, alpha, smooth)
+        image = self.variants.get(key)
+        if image is None:
+            image = self.source(path)
+            if size is not None and size != image.get_size():
+                image = (pygame.transform.smoothscale if smooth else pygame.transform.scale)(image, size)
+            image = to_display_format(image, alpha)
+            self.variants[key] = image
+        return image
+
+    def clear(self):
+        self.sources.clear()
+        self.variants.clear()
+
+
+# Cache partagé par les scènes et les splashs
+images = ImageCache()
@@ -0,0 +1,215 @@
+"""
+Impostors du rendu logiciel : chaque modèle OBJ est pré-rendu sous plusieurs
+angles dans une planche de sprites, gardée en cache sur disque.
+"""
+import hashlib
+import math
+import os
+import numpy
+import pygame
+from core.mesh_cache import load_obj
+from core.obj_loader import build_mesh
+from core.objet3D import VISIBLE_HEIGHT
+from core.shaders import LIGHT_DIRECTION, LIGHT_AMBIENT, LIGHT_DIFFUSE
+from data.config import (
+    SCREEN_HEIGHT, IMPOSTOR_FRAMES, IMPOSTOR_TILT, IMPOSTOR_CACHE_DIR, TEXTURE_ATLAS_PATH
+)
+
+# Les planches sont rastérisées à cette échelle puis réduites (anticrénelage)
+SUPERSAMPLE = 2
+
+# À changer quand le rendu des planches change, pour invalider le cache disque
+IMPOSTOR_VERSION = 1
+
+
+def rotation_matrix(angle_x, angle_y):
+    """Rotation Rx * Ry (degrés), même convention que glRotatef."""
+    ax, ay = math.radians(angle_x), math.radians(angle_y)
+    cx, sx = math.cos(ax), math.sin(ax)
+    cy, sy = math.cos(ay), math.sin(ay)
+    return numpy.array([
+        (cy, 0.0, sy),
+        (sx * sy, cx, -sx * cy),
+        (-cx * sy, sx, cx * cy),
+    ])
+
+
+def triangle_colors(vertices, triangles, color, atlas=None):
+    """Couleur de base de chaque triangle : texel de l'atlas à son UV moyen, sinon color."""
+    colors = numpy.empty((len(triangles), 3))
+    colors[:] = color
+    if atlas is not None:
+        width, height = atlas.get_size()
+        uvs = vertices[triangles, 6:8].mean(axis=1) % 1.0
+        for i, (u, v) in enumerate(uvs.tolist()):
+            # v = 0 en bas de la texture
+            colors[i] = atlas.get_at((int(u * (width - 1)), int((1.0 - v) * (height - 1))))[:3]
+    return colors
+
+
+def render_sheet(vertices, indices, frames, pixels_per_unit, color, tilt=IMPOSTOR_TILT, atlas=None):
+    """Rastérise le maillage sous frames angles (algorithme du peintre).
+
+    Chaque image tourne le modèle autour de l'axe vertical, incliné de tilt
+    degrés, et le projette orthogonalement ; les triangles tournés vers la
+    caméra sont triés du plus loin au plus proche puis remplis avec un
+    éclairage Lambert équivalent au shader des modèles.
+    Retourne une surface SRCALPHA de frames images carrées côte à côte.
+    """
+    positions = vertices[:, :3].astype(numpy.float64)
+    normals = vertices[:, 3:6].astype(numpy.float64)
+    triangles = indices.reshape(-1, 3)
+    base_colors = triangle_colors(vertices, triangles, color, atlas)
+
+    radius = float(numpy.linalg.norm(positions, axis=1).max()) if len(positions) else 0.5
+    size = int(math.ceil(2.0 * radius * pixels_per_unit)) + 2
+    scale = pixels_per_unit * SUPERSAMPLE
+    big = size * SUPERSAMPLE
+
+    light = numpy.array(LIGHT_DIRECTION) / numpy.linalg.norm(LIGHT_DIRECTION)
+    sheet = pygame.Surface((size * frames, size), pygame.SRCALPHA)
+    canvas = pygame.Surface((big, big), pygame.SRCALPHA)
+
+    for frame in range(frames):
+        rotation = rotation_matrix(tilt, 360.0 * frame / frames)
+        points = positions @ rotation.T
+        facing = (normals @ rotation.T)[triangles].sum(axis=1)
+        lengths = numpy.linalg.norm(facing, axis=1)
+        facing /= numpy.where(lengths > 0, lengths, 1.0)[:, None]
+
+        # Caméra sur +z : faces arrière ignorées, puis du plus loin au plus proche
+        visible = numpy.flatnonzero(facing[:, 2] > 0.0)
+        depth = points[triangles[visible], 2].mean(axis=1)
+        visible = visible[numpy.argsort(depth)]
+
+        light_factor = LIGHT_AMBIENT + LIGHT_DIFFUSE * numpy.clip(facing[visible] @ light, 0.0, None)
+        shaded = numpy.clip(base_colors[visible] * light_factor[:, None], 0, 255).astype(int)
+        screen = numpy.empty((len(points), 2))
+        screen[:, 0] = points[:, 0] * scale + big / 2
+        screen[:, 1] = -points[:, 1] * scale + big / 2
+
+        canvas.fill((0, 0, 0, 0))
+        for triangle, rgb in zip(screen[triangles[visible]].tolist(), shaded.tolist()):
+            pygame.draw.polygon(canvas, rgb, triangle)
+        sheet.blit(pygame.transform.smoothscale(canvas, (size, size)), (frame * size, 0))
+    return sheet
+
+
+class ImpostorSheet:
+    """Planche d'images d'un modèle ; chaque rendu blitte l'image la plus proche de l'angle."""
+
+    def __init__(self, name, surface, frames):
+        self.name = name
+        self.surface = surface
+        self.frames = frames
+        self.size = surface.get_height()
+        self.areas = [pygame.Rect(frame * self.size, 0, self.size, self.size) for frame in range(frames)]
+
+    def frame_for(self, angle):
+        """Index de l'image la plus proche d'un angle en degrés."""
+        return int(round(angle * self.frames / 360.0)) % self.frames
+
+    def blit(self, surface, x, y, angle):
+        """Blitte l'image de l'angle centrée sur (x, y), retourne la zone touchée."""
+        half = self.size // 2
+        return surface.blit(self.surface, (int(x) - half, int(y) - half), self.areas[self.frame_for(angle)])
+
+    def sprite_name(self, frame):
+        """Nom de l'image frame dans un atlas de sprites."""
+        return f"{self.name}#{frame}"
+
+    def add_sprite(self, sprites, x, y, angle):
+        """Ajoute l'image de l'angle au lot de sprites ; False si l'atlas ne la contient pas."""
+        name = self.sprite_name(self.frame_for(angle))
+        if name not in sprites.atlas:
+            return False
+        half = self.size / 2
+        sprites.add(name, (x - half, y - half, self.size, self.size))
+        return True
+
+
+class ImpostorCache:
+    """Planches d'impostors par nom de modèle (mêmes noms que le ModelCache).
+
+    Une planche est générée une seule fois puis enregistrée en PNG dans
+    cache_dir ; la clé du fichier dépend du modèle (taille, date) et des
+    paramètres de rendu, donc une modification du modèle la régénère.
+    """
+
+    def __init__(self, cache_dir=IMPOSTOR_CACHE_DIR, frames=IMPOSTOR_FRAMES):
+        self.cache_dir = cache_dir
+        self.frames = frames
+        self.sheets = {}
+        self.atlas = None
+        self.atlas_loaded = False
+
+    def get(self, name):
+        return self.sheets.get(name)
+
+    def frame_images(self):
+        """Images de toutes les planches chargées, nommées pour un SpriteAtlas."""
+        return {
+            sheet.sprite_name(frame): sheet.surface.subsurface(area)
+            for sheet in self.sheets.values() for frame, area in enumerate(sheet.areas)
+        }
+
+    def _load_atlas(self):
+        if not self.atlas_loaded:
+            self.atlas_loaded = True
+            if os.path.exists(TEXTURE_ATLAS_PATH):
+                try:
+                    self.atlas = pygame.image.load(TEXTURE_ATLAS_PATH)
+                except Exception as e:
+                    print(f"Warning: Could not load texture {TEXTURE_ATLAS_PATH}: {e}")
+        return self.atlas
+
+    def _cache_path(self, name, filepath, custom_scale, scale_3d, color):
+        stat = os.stat(filepath)
+        atlas_stamp = os.path.getmtime(TEXTURE_ATLAS_PATH) if os.path.exists(TEXTURE_ATLAS_PATH) else None
+        key = repr((IMPOSTOR_VERSION, filepath, stat.st_size, stat.st_mtime, custom_scale, scale_3d,
+                    tuple(color), self.frames, IMPOSTOR_TILT, SCREEN_HEIGHT, atlas_stamp))
+        digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+        return os.path.join(self.cache_dir, f"{name}-{digest}.png")
+
+    def load(self, name, filepath, custom_scale=None, scale_3d=1.0, color=(255, 255, 255)):
+        """Charge (ou génère) la planche d'un modèle, à la taille du rendu GL."""
+        if name in self.sheets:
+            return self.sheets[name]
+
+        try:
+            path = self._cache_path(name, filepath, custom_scale, scale_3d, color)
+        except OSError as e:
+            print(f"Warning: Could not load model {filepath}: {e}")
+            return None
+
+        surface = None
+        if os.path.exists(path):
+            try:
+                surface = pygame.image.load(path)
+            except Exception as e:
+                print(f"Warning: Could not read impostor cache {path}: {e}")
+
+        if surface is None:
+            try:
+                vertices, indices = build_mesh(load_obj(filepath), custom_scale)
+            except Exception as e:
+                print(f"Warning: Could not load model {filepath}: {e}")
+                return None
+            pixels_per_unit = SCREEN_HEIGHT / VISIBLE_HEIGHT * scale_3d
+            surface = render_sheet(vertices, indices, self.frames, pixels_per_unit, color,
+                                   atlas=self._load_atlas())
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                pygame.image.save(surface, path)
+            except Exception as e:
+                print(f"Warning: Could not write impostor cache {path}: {e}")
+
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        sheet = ImpostorSheet(name, surface, self.frames)
+        self.sheets[name] = sheet
+        return sheet
+
+
+# Cache partagé par les fruits et bombes du rendu logiciel
+impostors = ImpostorCache()
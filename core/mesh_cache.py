@@ -0,0 +1,139 @@
+"""
+Cache binaire des modèles OBJ : chaque modèle analysé est enregistré sous
+forme de tableaux plats, relus en une seule lecture aux lancements suivants.
+"""
+import hashlib
+import json
+import math
+import os
+import struct
+import numpy
+from core.obj_loader import Material, OBJModel, parse_obj
+from data.config import MESH_CACHE_DIR
+
+# À changer quand le format change, pour invalider le cache disque
+MESH_CACHE_VERSION = 4
+
+# En-tête fixe : signature, version, taille de l'en-tête JSON qui suit
+MAGIC = b'FNMESH'
+HEADER = struct.Struct('<6sHI')
+
+MATERIAL_FIELDS = ('Ka', 'Kd', 'Ks', 'Ns', 'd', 'map_Kd')
+
+# Tableaux d'un OBJModel enregistrés tels quels
+MODEL_ARRAYS = ('vertices', 'tex_coords', 'normals', 'corners', 'face_sizes', 'face_materials',
+                'triangles', 'min_bounds', 'max_bounds')
+
+
+def source_stamp(path):
+    """Identité d'un fichier source : chemin, taille et date de modification."""
+    stat = os.stat(path)
+    return [path, stat.st_size, stat.st_mtime]
+
+
+def model_arrays(model):
+    """Tableaux plats d'un OBJModel, par nom d'attribut."""
+    return {key: getattr(model, key) for key in MODEL_ARRAYS}
+
+
+def model_from_arrays(arrays, material_names):
+    """Reconstruit un OBJModel à partir des tableaux de model_arrays (sans copie)."""
+    model = OBJModel()
+    for key, array in arrays.items():
+        setattr(model, key, array)
+    model.material_names = list(material_names)
+    return model
+
+
+def write_mesh(path, model, sources):
+    """Enregistre le modèle : en-tête JSON (sources, matériaux, disposition) puis tableaux bruts."""
+    arrays = model_arrays(model)
+    layout = []
+    offset = 0
+    for key, array in arrays.items():
+        layout.append([key, array.dtype.str, list(array.shape), offset])
+        offset += array.nbytes
+
+    header = json.dumps({
+        'sources': sources,
+        'mtl_path': model.mtl_path,
+        'material_names': model.material_names,
+        'materials': {name: {field: getattr(material, field) for field in MATERIAL_FIELDS}
+                      for name, material in model.materials.items()},
+        'arrays': layout,
+    }).encode()
+
+    # Écriture dans un fichier temporaire : un lancement concurrent ne lit jamais un cache partiel
+    temporary = path + '.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, MESH_CACHE_VERSION, len(header)))
+        f.write(header)
+        for array in arrays.values():
+            f.write(numpy.ascontiguousarray(array).tobytes())
+    os.replace(temporary, path)
+
+
+def read_mesh(path):
+    """Relit un modèle enregistré par write_mesh, ou None s'il est périmé."""
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    magic, version, header_size = HEADER.unpack_from(data)
+    if magic != MAGIC or version != MESH_CACHE_VERSION:
+        return None
+    header = json.loads(data[HEADER.size:HEADER.size + header_size])
+    for stamp in header['sources']:
+        if not os.path.exists(stamp[0]) or source_stamp(stamp[0]) != stamp:
+            return None
+
+    base = HEADER.size + header_size
+    arrays = {
+        key: numpy.frombuffer(data, dtype, math.prod(shape), base + offset).reshape(shape)
+        for key, dtype, shape, offset in header['arrays']
+    }
+    model = model_from_arrays(arrays, header['material_names'])
+    model.mtl_path = header['mtl_path']
+    for name, fields in header['materials'].items():
+        material = Material(name)
+        for field, value in fields.items():
+            setattr(material, field, tuple(value) if isinstance(value, list) else value)
+        model.materials[name] = material
+    return model
+
+
+def cache_path(filepath, cache_dir=MESH_CACHE_DIR):
+    """Fichier de cache d'un .obj, nommé d'après son chemin, sa taille et sa date."""
+    key = repr((MESH_CACHE_VERSION, *source_stamp(os.path.abspath(filepath))))
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+    name = os.path.splitext(os.path.basename(filepath))[0]
+    return os.path.join(cache_dir, f"{name}-{digest}.mesh")
+
+
+def load_obj(filepath, cache_dir=MESH_CACHE_DIR):
+    """Équivalent de parse_obj passant par le cache binaire.
+
+    Le .obj n'est analysé que si aucun cache valide n'existe (modèle ou MTL
+    modifié depuis) ; le résultat est alors enregistré pour la prochaine fois.
+    """
+    if not cache_dir:
+        return parse_obj(filepath)
+
+    path = cache_path(filepath, cache_dir)
+    if os.path.exists(path):
+        try:
+            model = read_mesh(path)
+            if model is not None:
+                return model
+        except Exception as e:
+            print(f"Warning: Could not read mesh cache {path}: {e}")
+
+    model = parse_obj(filepath)
+    sources = [source_stamp(filepath)]
+    if model.mtl_path and os.path.exists(model.mtl_path):
+        sources.append(source_stamp(model.mtl_path))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        write_mesh(path, model, sources)
+    except Exception as e:
+        print(f"Warning: Could not write mesh cache {path}: {e}")
+    return model
@@ -1,19 +1,141 @@
 """
 Cache des modèles 3D et textures pour optimiser le rendu.
 """
+import ctypes
+import numpy
 import pygame
 from OpenGL.GL import *
-from core.obj_loader import parse_obj, get_model_center, get_model_scale
+from core.batch_renderer import BatchRenderer, compute_model_matrices
+from core.gl_renderer import GLState
+from core.mesh_cache import load_obj
+from core.obj_loader import get_model_center, get_model_scale, get_model_bounding_radius, build_lods
+from core.shaders import (
+    compile_program_variants, MESH_PROGRAM_VARIANTS, MESH_ATTRIBUTES,
+    ATTRIB_POSITION, ATTRIB_NORMAL, ATTRIB_TEXCOORD,
+    LIGHT_DIRECTION, LIGHT_AMBIENT, LIGHT_DIFFUSE
+)
+from data.config import (
+    MODEL_BACKEND, MODEL_LOD_CELLS, FRUIT_MODELS, FRUIT_MODELS_CUT, FRUIT_MODELS_CUT2, FRUIT_SCALES,
+    BOMB_MODEL, TEXTURE_ATLAS_PATH
+)
+
+# Taille d'un vertex entrelacé : position (3) + normale (3) + uv (2) en float32
+VERTEX_STRIDE = 8 * 4
+
+IDENTITY = numpy.identity(4, dtype=numpy.float32)
+
+
+class GPUMesh:
+    """Modèle uploadé dans un vertex buffer et un index buffer.
+
+    Quand le contexte les supporte (obligatoires en core profile), un
+    vertex array object mémorise buffers et attributs : bind() se réduit
+    alors à un seul appel.
+    """
+
+    def __init__(self, vertices, indices, textured):
+        self.index_count = len(indices)
+        self.textured = textured
+        self.vao = None
+
+        self.vbo, self.ibo = glGenBuffers(2)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+        if bool(glGenVertexArrays):
+            self.vao = glGenVertexArrays(1)
+            glBindVertexArray(self.vao)
+            self._set_attributes()
+            glBindVertexArray(0)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def bind(self):
+        """Lie le VAO, ou les buffers et les attributs de vertex sans VAO."""
+        if self.vao is not None:
+            glBindVertexArray(self.vao)
+        else:
+            self._set_attributes()
+
+    def _set_attributes(self):
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        glEnableVertexAttribArray(ATTRIB_POSITION)
+        glEnableVertexAttribArray(ATTRIB_NORMAL)
+        glEnableVertexAttribArray(ATTRIB_TEXCOORD)
+        glVertexAttribPointer(ATTRIB_POSITION, 3, GL_FLOAT, GL_FALSE, VERTEX_STRIDE, ctypes.c_void_p(0))
+        glVertexAttribPointer(ATTRIB_NORMAL, 3, GL_FLOAT, GL_FALSE, VERTEX_STRIDE, ctypes.c_void_p(12))
+        glVertexAttribPointer(ATTRIB_TEXCOORD, 2, GL_FLOAT, GL_FALSE, VERTEX_STRIDE, ctypes.c_void_p(24))
+
+    def unbind(self):
+        """Délie le VAO, ou désactive les attributs et délie les buffers."""
+        if self.vao is not None:
+            glBindVertexArray(0)
+            return
+        glDisableVertexAttribArray(ATTRIB_POSITION)
+        glDisableVertexAttribArray(ATTRIB_NORMAL)
+        glDisableVertexAttribArray(ATTRIB_TEXCOORD)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
+    def release(self):
+        if self.vao is not None:
+            glDeleteVertexArrays(1, [self.vao])
+            self.vao = None
+        glDeleteBuffers(2, [self.vbo, self.ibo])
 
-class ModelCache:
-    """Cache et compile les modèles OBJ en Display Lists OpenGL."""
 
-    def __init__(self):
+class ModelCache:
+    """Cache les modèles OBJ compilés pour OpenGL.
+
+    Deux backends : 'vbo' (vertex/index buffers + shader GLSL) et
+    'display_list' (display lists legacy), utilisé en secours si les
+    shaders ne sont pas disponibles. Le backend vbo prend ses matrices de
+    projection et de vue dans camera (la Camera du GLRenderer), jamais
+    dans la pile de matrices du pipeline fixe. Programme et textures sont
+    liés via state (le GLState du GLRenderer) : le programme des modèles
+    reste actif après un draw, le code en pipeline fixe le désactive par
+    state.use_program(0).
+    """
+
+    def __init__(self, backend=MODEL_BACKEND, camera=None, state=None):
         self.models = {}           # OBJModel par nom
         self.display_lists = {}    # Display list ID par nom
+        self.meshes = {}           # GPUMesh par nom (backend vbo)
+        self.lods = {}             # Liste de GPUMesh par nom, du plus au moins détaillé
+        self.radii = {}            # Rayon de la sphère englobante par nom
+        self.textured = set()      # Noms des modèles qui utilisent l'atlas
         self.texture_id = None     # Texture atlas partagée
         self.texture_loaded = False
+        self.program = None
+        self.uniforms = {}
+        self.backend = backend
+        self.camera = camera
+        self.state = state or GLState()
+
+        if self.backend == 'vbo':
+            self._init_program()
+
+    def _init_program(self):
+        """Compile le shader des modèles, sinon repasse en display lists."""
+        try:
+            if self.camera is None:
+                raise RuntimeError("no camera for the shader matrices")
+            self.program, self.uniforms = compile_program_variants(MESH_PROGRAM_VARIANTS, MESH_ATTRIBUTES)
+            # Caméra fixe et éclairage constant : uniforms envoyés une seule fois
+            self.state.use_program(self.program)
+            glUniformMatrix4fv(self.uniforms['u_projection'], 1, GL_FALSE, self.camera.projection)
+            glUniformMatrix4fv(self.uniforms['u_view'], 1, GL_FALSE, self.camera.view)
+            self.set_lighting_uniforms(self.uniforms)
+            glUniform1i(self.uniforms['u_texture'], 0)
+            self.state.use_program(0)
+        except Exception as e:
+            print(f"Warning: VBO backend unavailable, using display lists: {e}")
+            self.program = None
+            self.backend = 'display_list'
 
     def load_texture(self, texture_path):
         """Charge la texture atlas."""
@@ -32,7 +154,7 @@ class ModelCache:
 
             # Créer la texture OpenGL
             self.texture_id = glGenTextures(1)
-            glBindTexture(GL_TEXTURE_2D, self.texture_id)
+            self.state.bind_texture(self.texture_id)
 
             # Paramètres de texture
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
@@ -47,7 +169,7 @@ class ModelCache:
             # Générer mipmaps
             glGenerateMipmap(GL_TEXTURE_2D)
 
-            glBindTexture(GL_TEXTURE_2D, 0)
+            self.state.bind_texture(0)
             self.texture_loaded = True
 
         except Exception as e:
@@ -55,13 +177,23 @@ class ModelCache:
             self.texture_id = None
 
     def load_model(self, name, filepath, custom_scale=None, use_texture=True):
-        """Charge un modèle OBJ et le compile en Display List."""
+        """Charge un modèle OBJ et le compile pour le backend actif."""
         if name in self.models:
             return
 
         try:
-            model = parse_obj(filepath)
+            model = load_obj(filepath)
             self.models[name] = model
+            self.radii[name] = get_model_bounding_radius(model, custom_scale)
+            textured = use_texture and len(model.tex_coords) > 0 and self.texture_id is not None
+            if textured:
+                self.textured.add(name)
+
+            if self.backend == 'vbo':
+                self.lods[name] = [GPUMesh(vertices, indices, textured)
+                                   for vertices, indices in build_lods(model, custom_scale, MODEL_LOD_CELLS)]
+                self.meshes[name] = self.lods[name][0]
+                return
 
             # Compiler en Display List
             display_list = glGenLists(1)
@@ -76,7 +208,11 @@ class ModelCache:
             print(f"Warning: Could not load model {filepath}: {e}")
 
     def _render_model(self, model, custom_scale=None, use_texture=True):
-        """Rend le modèle dans la Display List courante."""
+        """Rend le modèle dans la Display List courante.
+
+        La texture n'est pas liée dans la liste : c'est à l'appelant de
+        l'activer (une fois par lot de modèles texturés).
+        """
         # Calculer la transformation pour centrer et normaliser
         center = get_model_center(model)
         scale = get_model_scale(model)
@@ -90,64 +226,105 @@ class ModelCache:
         glScalef(scale, scale, scale)
         glTranslatef(-center[0], -center[1], -center[2])
 
-        # Activer les textures si disponibles et demandées
+        # Coordonnées de texture si disponibles et demandées
         has_textures = use_texture and len(model.tex_coords) > 0 and self.texture_id is not None
 
-        if has_textures:
-            glEnable(GL_TEXTURE_2D)
-            glBindTexture(GL_TEXTURE_2D, self.texture_id)
-
-        # Rendre les faces
-        for face in model.faces:
-            vertices = face['vertices']
-
-            # Triangulate si nécessaire (fans pour polygones convexes)
-            if len(vertices) == 3:
-                glBegin(GL_TRIANGLES)
-                for v_idx, vt_idx, vn_idx in vertices:
-                    self._emit_vertex(model, v_idx, vt_idx, vn_idx, has_textures)
-                glEnd()
-            elif len(vertices) == 4:
-                glBegin(GL_QUADS)
-                for v_idx, vt_idx, vn_idx in vertices:
-                    self._emit_vertex(model, v_idx, vt_idx, vn_idx, has_textures)
-                glEnd()
-            else:
-                # Triangle fan pour polygones > 4 vertices
-                glBegin(GL_TRIANGLE_FAN)
-                for v_idx, vt_idx, vn_idx in vertices:
-                    self._emit_vertex(model, v_idx, vt_idx, vn_idx, has_textures)
-                glEnd()
-
-        if has_textures:
-            glDisable(GL_TEXTURE_2D)
+        # Rendre les faces (listes Python : plus rapides à indexer que les tableaux)
+        positions = model.vertices.tolist()
+        tex_coords = model.tex_coords.tolist() if has_textures else []
+        normals = model.normals.tolist()
+        corners = model.corners.tolist()
+        start = 0
+        for size in model.face_sizes.tolist():
+            # Triangulate si nécessaire (fans pour polygones > 4 vertices)
+            glBegin(GL_TRIANGLES if size == 3 else GL_QUADS if size == 4 else GL_TRIANGLE_FAN)
+            for v_idx, vt_idx, vn_idx in corners[start:start + size]:
+                # Normale
+                if 0 <= vn_idx < len(normals):
+                    glNormal3f(*normals[vn_idx])
+                # Coordonnées de texture
+                if 0 <= vt_idx < len(tex_coords):
+                    glTexCoord2f(*tex_coords[vt_idx])
+                # Position
+                if 0 <= v_idx < len(positions):
+                    glVertex3f(*positions[v_idx])
+            glEnd()
+            start += size
 
         glPopMatrix()
 
-    def _emit_vertex(self, model, v_idx, vt_idx, vn_idx, has_textures):
-        """Émet un vertex avec ses attributs."""
-        # Normale
-        if vn_idx is not None and vn_idx < len(model.normals):
-            n = model.normals[vn_idx]
-            glNormal3f(n[0], n[1], n[2])
-
-        # Coordonnées de texture
-        if has_textures and vt_idx is not None and vt_idx < len(model.tex_coords):
-            t = model.tex_coords[vt_idx]
-            glTexCoord2f(t[0], t[1])
-
-        # Position
-        if v_idx is not None and v_idx < len(model.vertices):
-            v = model.vertices[v_idx]
-            glVertex3f(v[0], v[1], v[2])
-
     def get_display_list(self, name):
         """Retourne l'ID de la Display List pour un modèle."""
         return self.display_lists.get(name)
 
+    def get_mesh(self, name, lod=0):
+        """GPUMesh du niveau de détail lod (le plus simple disponible au-delà)."""
+        levels = self.lods[name]
+        return levels[min(lod, len(levels) - 1)]
+
     def has_model(self, name):
         """Vérifie si un modèle est chargé."""
-        return name in self.display_lists
+        return name in self.display_lists or name in self.meshes
+
+    def draw(self, name, color=(1.0, 1.0, 1.0), lod=0, matrix=None):
+        """Dessine un modèle avec la matrice modèle matrix (4x4 numpy, None = identité).
+
+        Le backend vbo la passe en uniform avec les matrices de la caméra ;
+        les display lists la multiplient à la modelview courante.
+        """
+        mesh = self.meshes.get(name)
+        if mesh is not None and lod:
+            mesh = self.get_mesh(name, lod)
+        if mesh is None:
+            self.state.use_program(0)
+            textured = name in self.textured
+            if textured:
+                self.bind_texture()
+            glColor3f(*color)
+            if matrix is not None:
+                glPushMatrix()
+                glMultMatrixf(numpy.ascontiguousarray(matrix.T, dtype=numpy.float32))
+            glCallList(self.display_lists[name])
+            if matrix is not None:
+                glPopMatrix()
+            if textured:
+                self.unbind_texture()
+            return
+
+        self.state.use_program(self.program)
+        model = IDENTITY if matrix is None else numpy.ascontiguousarray(matrix.T, dtype=numpy.float32)
+        glUniformMatrix4fv(self.uniforms['u_model'], 1, GL_FALSE, model)
+        self._set_mesh_uniforms(mesh, color)
+
+        mesh.bind()
+        glDrawElements(GL_TRIANGLES, mesh.index_count, GL_UNSIGNED_INT, None)
+        mesh.unbind()
+
+    def draw_object(self, obj, lod=0):
+        """Dessine un objet 3D (position écran, échelle, rotations) hors d'un lot."""
+        self.draw(obj.model_name, obj.color, lod, compute_model_matrices([obj], self.camera)[0])
+
+    def _set_mesh_uniforms(self, mesh, color):
+        """Renseigne couleur et texture du shader des modèles (le reste est fixé à la compilation)."""
+        glUniform3f(self.uniforms['u_color'], *color)
+        glUniform1f(self.uniforms['u_use_texture'], 1.0 if mesh.textured else 0.0)
+        if mesh.textured:
+            self.state.bind_texture(self.texture_id)
+
+    def set_lighting_uniforms(self, uniforms):
+        """Renseigne l'éclairage d'un programme de modèles."""
+        glUniform3f(uniforms['u_light_direction'], *_normalized(LIGHT_DIRECTION))
+        glUniform1f(uniforms['u_ambient'], LIGHT_AMBIENT)
+        glUniform1f(uniforms['u_diffuse'], LIGHT_DIFFUSE)
+
+    def bind_texture(self):
+        """Active l'atlas pour le pipeline fixe (display lists)."""
+        self.state.enable(GL_TEXTURE_2D)
+        self.state.bind_texture(self.texture_id)
+
+    def unbind_texture(self):
+        self.state.bind_texture(0)
+        self.state.disable(GL_TEXTURE_2D)
 
     def cleanup(self):
         """Libère les ressources OpenGL."""
@@ -155,9 +332,80 @@ class ModelCache:
             glDeleteLists(dl, 1)
         self.display_lists.clear()
 
+        for levels in self.lods.values():
+            for mesh in levels:
+                mesh.release()
+        self.lods.clear()
+        self.meshes.clear()
+
+        # Le cache d'état ne doit pas croire liés des ids que GL pourra réattribuer
+        self.state.use_program(0)
+        self.state.bind_texture(0)
+        if self.program:
+            glDeleteProgram(self.program)
+            self.program = None
+
         if self.texture_id:
             glDeleteTextures([self.texture_id])
             self.texture_id = None
 
         self.models.clear()
         self.texture_loaded = False
+
+
+class ModelRegistry:
+    """ModelCache des modèles du jeu partagé par toutes les scènes 3D.
+
+    Les scènes l'acquièrent au lieu de construire leur propre cache : les
+    OBJ ne sont chargés et l'atlas envoyé au GPU qu'une fois. Le compte de
+    références libère les ressources GL à la dernière libération.
+    """
+
+    def __init__(self):
+        self.model_cache = None
+        self.batch_renderer = None
+        self.references = 0
+
+    def acquire(self, gl_renderer):
+        """Retourne (model_cache, batch_renderer), chargés à la première acquisition."""
+        if self.model_cache is None:
+            self.model_cache = load_game_models(ModelCache(camera=gl_renderer.camera, state=gl_renderer.state))
+            self.batch_renderer = BatchRenderer(self.model_cache, gl_renderer)
+        self.references += 1
+        return self.model_cache, self.batch_renderer
+
+    def release(self):
+        """Rend une référence ; la dernière libère modèles, textures et buffers."""
+        if self.references == 0:
+            return
+        self.references -= 1
+        if self.references == 0:
+            self.batch_renderer.cleanup()
+            self.model_cache.cleanup()
+            self.batch_renderer = None
+            self.model_cache = None
+
+
+def load_game_models(model_cache):
+    """Charge l'atlas et tous les modèles du jeu (fruits entiers, moitiés, bombe)."""
+    model_cache.load_texture(TEXTURE_ATLAS_PATH)
+    for fruit_type, model_path in FRUIT_MODELS.items():
+        scale = FRUIT_SCALES.get(fruit_type, 1.0)
+        model_cache.load_model(fruit_type.capitalize(), model_path, custom_scale=scale)
+    for fruit_type, model_path in FRUIT_MODELS_CUT.items():
+        scale = FRUIT_SCALES.get(fruit_type, 1.0)
+        model_cache.load_model(f"{fruit_type.capitalize()}-C", model_path, custom_scale=scale)
+    for fruit_type, model_path in FRUIT_MODELS_CUT2.items():
+        scale = FRUIT_SCALES.get(fruit_type, 1.0)
+        model_cache.load_model(f"{fruit_type.capitalize()}-C2", model_path, custom_scale=scale)
+    model_cache.load_model('Bomb', BOMB_MODEL, custom_scale=1.0)
+    return model_cache
+
+
+# Registre partagé par les scènes de jeu
+shared_models = ModelRegistry()
+
+
+def _normalized(vector):
+    length = sum(c * c for c in vector) ** 0.5
+    return tuple(c / length for c in vector)
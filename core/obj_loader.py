@@ -1,6 +1,8 @@
 """
 Parser de fichiers Wavefront OBJ/MTL pour le rendu OpenGL.
 """
+import re
+import numpy
 
 
 class Material:
@@ -17,19 +19,45 @@ class Material:
 
 
 class OBJModel:
-    """Modèle 3D chargé depuis un fichier OBJ."""
+    """Modèle 3D chargé depuis un fichier OBJ, stocké dans quelques tableaux NumPy.
+
+    Chaque coin de face est un triplet d'indices (v, vt, vn) dans corners,
+    -1 quand l'attribut est absent ; les faces s'y suivent dans l'ordre du
+    fichier, face_sizes donnant leur nombre de coins.
+    """
 
     def __init__(self):
-        self.vertices = []      # Liste de (x, y, z)
-        self.tex_coords = []    # Liste de (u, v)
-        self.normals = []       # Liste de (nx, ny, nz)
-        self.faces = []         # Liste de faces, chaque face = [(v, vt, vn), ...]
+        self.vertices = numpy.zeros((0, 3), dtype=numpy.float32)     # (x, y, z)
+        self.tex_coords = numpy.zeros((0, 2), dtype=numpy.float32)   # (u, v)
+        self.normals = numpy.zeros((0, 3), dtype=numpy.float32)      # (nx, ny, nz)
+        self.corners = numpy.zeros((0, 3), dtype=numpy.int32)        # (v, vt, vn) par coin
+        self.face_sizes = numpy.zeros(0, dtype=numpy.int32)          # Nombre de coins par face
+        self.face_materials = numpy.zeros(0, dtype=numpy.int32)      # Index dans material_names, -1 = aucun
+        self.triangles = numpy.zeros((0, 3), dtype=numpy.int32)      # Coins de chaque triangle (éventails)
+        self.material_names = []
         self.materials = {}     # Dictionnaire de Material
-        self.current_material = None
+        self.mtl_path = None    # Fichier MTL référencé par mtllib
 
         # Bounding box pour normalisation
-        self.min_bounds = [float('inf')] * 3
-        self.max_bounds = [float('-inf')] * 3
+        self.min_bounds = numpy.full(3, numpy.inf)
+        self.max_bounds = numpy.full(3, -numpy.inf)
+
+    def set_faces(self, corners, face_sizes):
+        """Renseigne les faces et calcule leur découpage en triangles."""
+        self.corners = corners
+        self.face_sizes = face_sizes
+        self.triangles = fan_triangles(face_sizes)
+
+
+def fan_triangles(face_sizes):
+    """Découpe en éventail de faces consécutives : indices des coins de chaque triangle."""
+    face_sizes = numpy.asarray(face_sizes, dtype=numpy.int64)
+    starts = numpy.cumsum(face_sizes) - face_sizes
+    counts = numpy.maximum(face_sizes - 2, 0)
+    first = numpy.repeat(starts, counts)
+    # Rang du triangle dans sa face, de 1 à taille - 2
+    step = numpy.arange(len(first)) - numpy.repeat(numpy.cumsum(counts) - counts, counts) + 1
+    return numpy.stack((first, first + step, first + step + 1), axis=1).astype(numpy.int32)
 
 
 def parse_mtl(filepath):
@@ -88,74 +116,151 @@ def parse_mtl(filepath):
     return materials
 
 
+# Lignes d'un mot-clé donné, extraites d'un bloc par expression régulière. Le motif
+# commence par un saut de ligne littéral (plus rapide à chercher qu'une ancre ^),
+# suivi des éventuels blancs d'indentation : le texte analysé doit donc commencer
+# par '\n'.
+_LINE_PATTERNS = {
+    keyword: re.compile(rf'\n[ \t]*{keyword}[ \t]+([^\n]*)')
+    for keyword in ('v', 'vt', 'vn', 'f')
+}
+_USEMTL_PATTERN = re.compile(r'\n[ \t]*usemtl[ \t]+(\S+)[^\n]*')
+_MTLLIB_PATTERN = re.compile(r'\n[ \t]*mtllib[ \t]+([^\n]*)')
+
+
+def _split_tokens(text, line_count):
+    """Découpe en mots d'un bloc de lignes jointes par '\n'.
+
+    Retourne (chars, starts, line_of, sizes) : octets du texte, position du
+    début de chaque mot, ligne de chaque mot et nombre de mots par ligne.
+    """
+    chars = numpy.frombuffer(text.encode(), dtype=numpy.uint8)
+    blank = numpy.isin(chars, (ord(' '), ord('\t'), ord('\r'), ord('\n')))
+    # Un mot commence sur un non-blanc précédé d'un blanc (ou au début du texte)
+    starts = numpy.flatnonzero(~blank & numpy.concatenate(([True], blank[:-1])))
+    line_of = numpy.searchsorted(numpy.flatnonzero(chars == ord('\n')), starts)
+    sizes = numpy.bincount(line_of, minlength=line_count)
+    return chars, starts, line_of, sizes
+
+
+def _parse_floats(lines, width):
+    """Les width premiers nombres de chaque ligne, en un tableau (len(lines), width).
+
+    Les valeurs manquantes (ex. vt u sans v) valent 0.
+    """
+    if not lines:
+        return numpy.zeros((0, width))
+    text = '\n'.join(lines)
+    sizes = _split_tokens(text, len(lines))[3]
+    if sizes[0] >= width and (sizes == sizes[0]).all():
+        # Même nombre de valeurs par ligne (ex. v x y z w ou couleurs) : simple découpe
+        values = numpy.fromstring(text, sep=' ')
+        if len(values) == sizes.sum():
+            return values.reshape(len(lines), -1)[:, :width]
+    return numpy.array([(line.split() + ['0'] * width)[:width] for line in lines],
+                       dtype=numpy.float64).reshape(-1, width)
+
+
+def _parse_faces(lines):
+    """Coins des lignes f d'au moins 3 coins, et nombre de coins de chaque ligne.
+
+    Retourne (corners, sizes) : indices OBJ bruts (base 1, 0 = absent) en un
+    tableau (N, 3), et le nombre de coins de chaque ligne (celles de moins
+    de 3 coins n'ont pas de coins dans corners).
+    """
+    if not lines:
+        return numpy.zeros((0, 3), dtype=numpy.int64), numpy.zeros(0, dtype=numpy.int64)
+    text = '\n'.join(lines)
+    chars, starts, line_of, sizes = _split_tokens(text, len(lines))
+    kept = sizes[line_of] >= 3
+
+    # Nombre de '/' de chaque coin (les blancs qui le suivent n'en contiennent pas)
+    shapes = numpy.add.reduceat(chars == ord('/'), starts, dtype=numpy.int32) if len(starts) else starts
+    corners = numpy.zeros((len(starts), 3), dtype=numpy.int64)
+    if len(shapes) and shapes[0] <= 2 and (shapes == shapes[0]).all():
+        # Même forme pour tous les coins (v, v/vt, v/vt/vn ou v//vn) : une seule conversion
+        fields = int(shapes[0]) + 1
+        values = numpy.fromstring(text.replace('//', '/0/').replace('/', ' '), sep=' ', dtype=numpy.int64)
+        if len(values) == len(starts) * fields:
+            corners[:, :fields] = values.reshape(-1, fields)
+            return corners[kept], sizes
+
+    for i, token in enumerate(text.split()):
+        for j, index in enumerate(token.split('/')[:3]):
+            if index:
+                corners[i, j] = int(index)
+    return corners[kept], sizes
+
+
+def _declared_counts(text):
+    """Nombre de lignes v, vt et vn déclarées avant chaque ligne f, en un tableau (N, 3).
+
+    Sert aux indices négatifs, relatifs à la position de la face dans le fichier.
+    """
+    face_offsets = [match.start() for match in _LINE_PATTERNS['f'].finditer(text)]
+    counts = numpy.empty((len(face_offsets), 3), dtype=numpy.int64)
+    for column, keyword in enumerate(('v', 'vt', 'vn')):
+        offsets = [match.start() for match in _LINE_PATTERNS[keyword].finditer(text)]
+        counts[:, column] = numpy.searchsorted(offsets, face_offsets)
+    return counts
+
+
 def parse_obj(filepath):
-    """Parse un fichier OBJ et retourne un OBJModel."""
+    """Parse un fichier OBJ et retourne un OBJModel.
+
+    Le fichier est lu d'un bloc : chaque type de ligne est extrait par
+    expression régulière puis converti en une seule fois en tableau.
+    """
     import os
 
     model = OBJModel()
-    current_material_name = None
-
     with open(filepath, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-
-            parts = line.split()
-            if not parts:
-                continue
-
-            keyword = parts[0]
-
-            if keyword == 'mtllib' and len(parts) >= 2:
-                # Charger le fichier MTL
-                mtl_name = ' '.join(parts[1:])
-                mtl_path = os.path.join(os.path.dirname(filepath), mtl_name)
-                model.materials = parse_mtl(mtl_path)
-
-            elif keyword == 'usemtl' and len(parts) >= 2:
-                current_material_name = parts[1]
-
-            elif keyword == 'v' and len(parts) >= 4:
-                # Vertex position
-                x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
-                model.vertices.append((x, y, z))
-
-                # Update bounding box
-                model.min_bounds[0] = min(model.min_bounds[0], x)
-                model.min_bounds[1] = min(model.min_bounds[1], y)
-                model.min_bounds[2] = min(model.min_bounds[2], z)
-                model.max_bounds[0] = max(model.max_bounds[0], x)
-                model.max_bounds[1] = max(model.max_bounds[1], y)
-                model.max_bounds[2] = max(model.max_bounds[2], z)
-
-            elif keyword == 'vt' and len(parts) >= 3:
-                # Texture coordinate
-                u, v = float(parts[1]), float(parts[2])
-                model.tex_coords.append((u, v))
-
-            elif keyword == 'vn' and len(parts) >= 4:
-                # Normal
-                nx, ny, nz = float(parts[1]), float(parts[2]), float(parts[3])
-                model.normals.append((nx, ny, nz))
-
-            elif keyword == 'f' and len(parts) >= 4:
-                # Face - indices sont 1-based dans OBJ
-                face_vertices = []
-                for vertex_data in parts[1:]:
-                    indices = vertex_data.split('/')
-
-                    v_idx = int(indices[0]) - 1 if indices[0] else None
-                    vt_idx = int(indices[1]) - 1 if len(indices) > 1 and indices[1] else None
-                    vn_idx = int(indices[2]) - 1 if len(indices) > 2 and indices[2] else None
-
-                    face_vertices.append((v_idx, vt_idx, vn_idx))
-
-                model.faces.append({
-                    'vertices': face_vertices,
-                    'material': current_material_name
-                })
-
+        text = '\n' + f.read()
+
+    mtllib = _MTLLIB_PATTERN.search(text)
+    if mtllib:
+        # Charger le fichier MTL
+        mtl_path = os.path.join(os.path.dirname(filepath), mtllib.group(1).strip())
+        model.materials = parse_mtl(mtl_path)
+        model.mtl_path = mtl_path
+
+    positions = _parse_floats(_LINE_PATTERNS['v'].findall(text), 3)
+    model.vertices = positions.astype(numpy.float32)
+    model.tex_coords = _parse_floats(_LINE_PATTERNS['vt'].findall(text), 2).astype(numpy.float32)
+    model.normals = _parse_floats(_LINE_PATTERNS['vn'].findall(text), 3).astype(numpy.float32)
+    if len(positions):
+        model.min_bounds = positions.min(axis=0)
+        model.max_bounds = positions.max(axis=0)
+
+    # Les faces sont lues par tronçon entre deux usemtl pour connaître leur matériau
+    chunks = _USEMTL_PATTERN.split(text)
+    material_names = []
+    face_lines = []
+    line_materials = []
+    for index in range(0, len(chunks), 2):
+        lines = _LINE_PATTERNS['f'].findall(chunks[index])
+        material = -1
+        if index > 0 and lines:
+            name = chunks[index - 1]
+            if name not in material_names:
+                material_names.append(name)
+            material = material_names.index(name)
+        face_lines += lines
+        line_materials += [material] * len(lines)
+
+    corners, line_sizes = _parse_faces(face_lines)
+    kept = line_sizes >= 3
+    counts = 0
+    if (corners < 0).any():
+        # Indices négatifs : relatifs aux sommets déclarés avant la ligne de la face
+        corner_lines = numpy.repeat(numpy.flatnonzero(kept), line_sizes[kept])
+        counts = _declared_counts(text)[corner_lines]
+    # Base 1 -> base 0, 0 devient -1 (absent)
+    corners = numpy.where(corners > 0, corners - 1, numpy.where(corners < 0, corners + counts, -1))
+
+    model.set_faces(corners.astype(numpy.int32), line_sizes[kept].astype(numpy.int32))
+    model.face_materials = numpy.array(line_materials, dtype=numpy.int32).reshape(-1)[kept]
+    model.material_names = material_names
     return model
 
 
@@ -174,3 +279,97 @@ def get_model_scale(model):
     dz = model.max_bounds[2] - model.min_bounds[2]
     max_dim = max(dx, dy, dz)
     return 1.0 / max_dim if max_dim > 0 else 1.0
+
+
+def get_model_bounding_radius(model, custom_scale=None):
+    """Rayon de la sphère englobante du modèle une fois centré et normalisé."""
+    if not len(model.vertices):
+        return 0.0
+    offsets = model.vertices - numpy.array(get_model_center(model))
+    scale = get_model_scale(model) * (custom_scale or 1.0)
+    return float(numpy.sqrt((offsets ** 2).sum(axis=1).max())) * scale
+
+
+def build_mesh(model, custom_scale=None):
+    """Convertit un OBJModel en tableaux prêts pour un vertex buffer.
+
+    Retourne (vertices, indices) : vertices est un tableau float32 entrelacé
+    (x, y, z, nx, ny, nz, u, v) centré et normalisé comme la display list,
+    indices un tableau uint32 de triangles (polygones découpés en éventail).
+    Un sommet par triplet (v, vt, vn) distinct, dans l'ordre d'apparition.
+    """
+    center = numpy.array(get_model_center(model))
+    scale = get_model_scale(model)
+    if custom_scale:
+        scale *= custom_scale
+
+    unique, first, inverse = numpy.unique(model.corners, axis=0, return_index=True, return_inverse=True)
+    order = numpy.argsort(first)
+    rank = numpy.empty_like(order)
+    rank[order] = numpy.arange(len(order))
+    keys = unique[order]
+
+    def gather(values, column, default):
+        indices = keys[:, column]
+        valid = (indices >= 0) & (indices < len(values))
+        result = numpy.empty((len(keys), len(default)))
+        result[:] = default
+        result[valid] = values[indices[valid]]
+        return result
+
+    vertices = numpy.empty((len(keys), 8), dtype=numpy.float32)
+    vertices[:, 0:3] = (gather(model.vertices, 0, (0.0, 0.0, 0.0)) - center) * scale
+    vertices[:, 3:6] = gather(model.normals, 2, (0.0, 0.0, 1.0))
+    vertices[:, 6:8] = gather(model.tex_coords, 1, (0.0, 0.0))
+
+    indices = rank[inverse.ravel()][model.triangles]
+    return vertices, indices.astype(numpy.uint32).ravel()
+
+
+def decimate_mesh(vertices, indices, cell_fraction, uv_resolution=16):
+    """Simplifie un maillage build_mesh par regroupement de sommets (vertex clustering).
+
+    Les positions sont rangées dans une grille de cellules de cell_fraction
+    fois la taille du modèle ; les sommets d'une même cellule (et de
+    coordonnées de texture voisines, pour garder les coutures de l'atlas)
+    sont fusionnés en leur moyenne. Les triangles dégénérés ou en double
+    disparaissent. Retourne (vertices, indices) au même format.
+    """
+
+    positions = vertices[:, :3]
+    extent = float(numpy.ptp(positions, axis=0).max()) or 1.0
+    cells = numpy.floor((positions - positions.min(axis=0)) / (extent * cell_fraction))
+    uv_cells = numpy.floor(vertices[:, 6:8] * uv_resolution)
+    keys = numpy.concatenate((cells, uv_cells), axis=1).astype(numpy.int64)
+    _, cluster, counts = numpy.unique(keys, axis=0, return_inverse=True, return_counts=True)
+    cluster = cluster.ravel()
+
+    # Moyenne des attributs de chaque groupe
+    merged = numpy.zeros((len(counts), vertices.shape[1]))
+    numpy.add.at(merged, cluster, vertices)
+    merged /= counts[:, None]
+    lengths = numpy.linalg.norm(merged[:, 3:6], axis=1)
+    merged[:, 3:6] /= numpy.where(lengths > 0, lengths, 1.0)[:, None]
+
+    triangles = cluster[indices.reshape(-1, 3)]
+    a, b, c = triangles.T
+    triangles = triangles[(a != b) & (b != c) & (a != c)]
+    # Doublons : même triplet de sommets (ordre d'origine conservé pour l'orientation)
+    _, first = numpy.unique(numpy.sort(triangles, axis=1), axis=0, return_index=True)
+    triangles = triangles[numpy.sort(first)]
+
+    used, remap = numpy.unique(triangles, return_inverse=True)
+    return merged[used].astype(numpy.float32), remap.ravel().astype(numpy.uint32)
+
+
+def build_lods(model, custom_scale=None, cell_fractions=()):
+    """Niveaux de détail d'un modèle : le maillage complet puis une version par cell_fraction.
+
+    Un niveau qui ne réduit pas le nombre de triangles du précédent est ignoré.
+    """
+    levels = [build_mesh(model, custom_scale)]
+    for fraction in cell_fractions:
+        vertices, indices = decimate_mesh(*levels[0], fraction)
+        if 0 < len(indices) < len(levels[-1][1]):
+            levels.append((vertices, indices))
+    return levels
@@ -4,12 +4,13 @@ Objets 3D avec rendu OpenGL (Fruits, Bombes, etc).
 import random
 import math
 from OpenGL.GL import *
+from core.sounds import sounds, BOMB_FUSE_SOUND
 from data.config import (
     SCREEN_WIDTH, GRAVITY,
     FRUIT_VELOCITY_X, FRUIT_VELOCITY_Y, FRUIT_ROTATION_SPEED,
     BOMB_VELOCITY_X, BOMB_VELOCITY_Y, BOMB_ROTATION_SPEED,
     CUT_VELOCITY_X, CUT_VELOCITY_Y, CUT_ROTATION_SPEED_X, CUT_ROTATION_SPEED_YZ,
-    BORDER_VELOCITY_DAMPING
+    BORDER_VELOCITY_DAMPING, OPENGL_FOV, CAMERA_DISTANCE
 )
 
 # Bordures latérales
@@ -68,11 +69,13 @@ SPLASH_COLORS = {
 }
 
 
+# Hauteur visible dans le plan z = 0 (caméra fixe, calculée une seule fois)
+VISIBLE_HEIGHT = 2.0 * CAMERA_DISTANCE * math.tan(math.radians(OPENGL_FOV) / 2.0)
+
+
 def screen_to_gl(x, y, screen_width, screen_height):
     """Convertit coordonnées écran (pixels) vers OpenGL."""
-    fov_rad = math.radians(45.0)
-    camera_distance = 10.0
-    visible_height = 2.0 * camera_distance * math.tan(fov_rad / 2.0)
+    visible_height = VISIBLE_HEIGHT
     visible_width = visible_height * (screen_width / screen_height)
 
     gl_x = (x / screen_width - 0.5) * visible_width
@@ -110,6 +113,13 @@ class CutFruitHalf:
         self.scale_3d = SCALE_3D.get(fruit_type, 1.0)
         self.offset_x = direction * 0.3
 
+    @property
+    def model_name(self):
+        """Nom du modèle dans le ModelCache (-C ou -C2)."""
+        if self.is_second_half and self.fruit_type in FRUITS_WITH_C2:
+            return f"{self.fruit_type.capitalize()}-C2"
+        return f"{self.fruit_type.capitalize()}-C"
+
     def update(self, dt):
         # Facteur de temps (60 FPS de base)
         time_factor = dt * 60
@@ -138,6 +148,10 @@ class CutFruitHalf:
         screen.blit(s, (self.x - self.radius, self.y - self.radius))
 
     def render_3d(self, screen_width, screen_height):
+        if self.model_cache and self.model_cache.has_model(self.model_name):
+            self.model_cache.draw_object(self)
+            return
+
         gl_x, gl_y = screen_to_gl(self.x, self.y, screen_width, screen_height)
 
         glPushMatrix()
@@ -151,17 +165,7 @@ class CutFruitHalf:
         glRotatef(self.rotation_z, 0, 0, 1)
 
         glColor3f(*self.color)
-
-        # Utiliser -C ou -C2
-        if self.is_second_half and self.fruit_type in FRUITS_WITH_C2:
-            model_name = f"{self.fruit_type.capitalize()}-C2"
-        else:
-            model_name = f"{self.fruit_type.capitalize()}-C"
-
-        if self.model_cache and self.model_cache.has_model(model_name):
-            glCallList(self.model_cache.get_display_list(model_name))
-        else:
-            self._render_sphere()
+        self._render_sphere()
 
         glPopMatrix()
 
@@ -204,6 +208,12 @@ class Fruit3D:
         self.radius = RADIUS.get(self.fruit_type, 30)
         self.scale_3d = SCALE_3D.get(self.fruit_type, 1.0)
         self.color = COLORS.get(self.fruit_type, (1.0, 1.0, 1.0))
+        self.offset_x = 0
+
+    @property
+    def model_name(self):
+        """Nom du modèle dans le ModelCache."""
+        return self.fruit_type.capitalize()
 
     def update(self, dt):
         # Facteur de temps (60 FPS de base)
@@ -241,6 +251,10 @@ class Fruit3D:
         if self.is_cut:
             return
 
+        if self.model_cache and self.model_cache.has_model(self.model_name):
+            self.model_cache.draw_object(self)
+            return
+
         gl_x, gl_y = screen_to_gl(self.x, self.y, screen_width, screen_height)
 
         glPushMatrix()
@@ -253,12 +267,7 @@ class Fruit3D:
         glRotatef(self.rotation_z, 0, 0, 1)
 
         glColor3f(*self.color)
-
-        model_name = self.fruit_type.capitalize()
-        if self.model_cache and self.model_cache.has_model(model_name):
-            glCallList(self.model_cache.get_display_list(model_name))
-        else:
-            self._render_sphere()
+        self._render_sphere()
 
         glPopMatrix()
 
@@ -325,14 +334,13 @@ class Bomb3D:
         self.radius = RADIUS.get('bomb', 25)
         self.scale_3d = SCALE_3D.get('bomb', 1.0)
         self.color = COLORS.get('bomb', (1.0, 1.0, 1.0))
+        self.offset_x = 0
+        self.model_name = 'Bomb'
         self.channel = None
 
         # Son de mèche
         if Bomb3D.fuse_sound is None:
-            try:
-                Bomb3D.fuse_sound = pygame.mixer.Sound("asset/Sound object/Bomb-Fuse.wav")
-            except:
-                pass
+            Bomb3D.fuse_sound = sounds.get(BOMB_FUSE_SOUND)
 
         if Bomb3D.fuse_sound:
             self.channel = Bomb3D.fuse_sound.play(-1)
@@ -375,6 +383,10 @@ class Bomb3D:
         if self.is_exploded:
             return
 
+        if self.model_cache and self.model_cache.has_model(self.model_name):
+            self.model_cache.draw_object(self)
+            return
+
         gl_x, gl_y = screen_to_gl(self.x, self.y, screen_width, screen_height)
 
         glPushMatrix()
@@ -387,11 +399,7 @@ class Bomb3D:
         glRotatef(self.rotation_z, 0, 0, 1)
 
         glColor3f(*self.color)
-
-        if self.model_cache and self.model_cache.has_model('Bomb'):
-            glCallList(self.model_cache.get_display_list('Bomb'))
-        else:
-            self._render_sphere()
+        self._render_sphere()
 
         glPopMatrix()
 
@@ -0,0 +1,132 @@
+"""
+Système de particules vectorisé (jus, pépins, étincelles de bombe).
+"""
+import math
+import numpy
+import pygame
+from data.config import GRAVITY, PARTICLE_CAPACITY
+
+# Couleurs des étincelles de bombe
+SPARK_COLORS = numpy.array([(255, 220, 80), (255, 140, 0), (255, 60, 20)], dtype=numpy.float32)
+SEED_COLOR = (40, 30, 20)
+
+
+class ParticleSystem:
+    """Particules stockées dans des tableaux NumPy préalloués.
+
+    Toutes les particules avancent en une seule intégration vectorisée par
+    frame. Une particule expirée rend son emplacement à la liste libre, où
+    l'émission suivante le reprend : aucune allocation pendant la partie.
+    Les vitesses sont en pixels par frame à 60 FPS, comme les fruits.
+    """
+
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.position = numpy.zeros((capacity, 2), dtype=numpy.float32)
+        self.velocity = numpy.zeros((capacity, 2), dtype=numpy.float32)
+        self.color = numpy.zeros((capacity, 3), dtype=numpy.float32)
+        self.size = numpy.zeros(capacity, dtype=numpy.float32)
+        self.gravity = numpy.zeros(capacity, dtype=numpy.float32)
+        self.life = numpy.zeros(capacity, dtype=numpy.float32)       # Temps restant (s)
+        self.max_life = numpy.ones(capacity, dtype=numpy.float32)
+        self.active = numpy.zeros(capacity, dtype=bool)
+        self.free = list(range(capacity - 1, -1, -1))                # Pile d'emplacements libres
+        self.rng = numpy.random.default_rng()
+        self.scratch = None     # Surface SRCALPHA du rendu logiciel (transparente entre deux frames)
+
+    def __len__(self):
+        return self.capacity - len(self.free)
+
+    def clear(self):
+        """Libère toutes les particules."""
+        self.active[:] = False
+        self.free = list(range(self.capacity - 1, -1, -1))
+
+    def emit(self, x, y, count, color, speed=(2.0, 8.0), life=(0.4, 0.9), size=(3.0, 7.0),
+             gravity=GRAVITY, direction=-math.pi / 2, spread=math.pi):
+        """Émet jusqu'à count particules depuis (x, y).
+
+        color est une couleur RGB ou un tableau (count, 3) ; la direction est
+        tirée dans direction ± spread (radians, -pi/2 = vers le haut).
+        Retourne le nombre de particules réellement émises.
+        """
+        count = min(count, len(self.free))
+        if count <= 0:
+            return 0
+        slots = numpy.array(self.free[-count:], dtype=numpy.intp)
+        del self.free[-count:]
+
+        angles = direction + self.rng.uniform(-spread, spread, count)
+        speeds = self.rng.uniform(*speed, count)
+        self.position[slots] = (x, y)
+        self.velocity[slots, 0] = numpy.cos(angles) * speeds
+        self.velocity[slots, 1] = numpy.sin(angles) * speeds
+        color = numpy.asarray(color, dtype=numpy.float32)
+        self.color[slots] = color[:count] if color.ndim == 2 else color
+        self.size[slots] = self.rng.uniform(*size, count)
+        self.gravity[slots] = gravity
+        self.life[slots] = self.max_life[slots] = self.rng.uniform(*life, count)
+        self.active[slots] = True
+        return count
+
+    def emit_juice(self, x, y, color, count=40):
+        """Gouttes de jus de la couleur du fruit, plus quelques pépins."""
+        self.emit(x, y, count, color)
+        self.emit(x, y, count // 8, SEED_COLOR, speed=(2.0, 5.0), life=(0.6, 1.0), size=(3.0, 4.0),
+                  gravity=GRAVITY * 1.5)
+
+    def emit_sparks(self, x, y, count=120):
+        """Gerbe d'étincelles d'explosion dans toutes les directions."""
+        colors = SPARK_COLORS[self.rng.integers(len(SPARK_COLORS), size=count)]
+        self.emit(x, y, count, colors, speed=(4.0, 14.0), life=(0.3, 0.7), size=(2.0, 5.0),
+                  gravity=GRAVITY * 0.3)
+
+    def update(self, dt):
+        """Intègre toutes les particules en une passe et recycle celles qui ont expiré."""
+        if len(self.free) == self.capacity:
+            return
+        steps = dt * 60.0
+        self.velocity[:, 1] += self.gravity * steps
+        self.position += self.velocity * steps
+        self.life -= dt
+
+        expired = self.active & (self.life <= 0)
+        if expired.any():
+            self.active &= ~expired
+            self.free.extend(numpy.flatnonzero(expired).tolist())
+
+    def _alive(self):
+        alive = numpy.flatnonzero(self.active)
+        alpha = numpy.clip(self.life[alive] / self.max_life[alive], 0.0, 1.0) * 255.0
+        return alive, alpha
+
+    def render_sprites(self, sprites):
+        """Ajoute toutes les particules au lot de sprites GL (un bloc de quads)."""
+        if len(self.free) == self.capacity:
+            return
+        alive, alpha = self._alive()
+        sprites.add_many('particle', self.position[alive], self.size[alive] * 2.0,
+                         self.color[alive], alpha)
+
+    def render(self, surface):
+        """Rendu logiciel, retourne la zone touchée ou None.
+
+        pygame.draw écrit l'alpha tel quel sans mélanger : les cercles sont
+        tracés sur une surface intermédiaire transparente, puis mélangés à
+        surface par un seul blit de la zone touchée.
+        """
+        if len(self.free) == self.capacity:
+            return None
+        if self.scratch is None or self.scratch.get_size() != surface.get_size():
+            self.scratch = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        alive, alpha = self._alive()
+        dirty = None
+        for (x, y), radius, color, a in zip(self.position[alive].tolist(), self.size[alive].tolist(),
+                                            self.color[alive].astype(int).tolist(), alpha.astype(int).tolist()):
+            rect = pygame.draw.circle(self.scratch, (*color, a), (x, y), radius)
+            dirty = rect if dirty is None else dirty.union(rect)
+        if dirty is None or not dirty.width or not dirty.height:
+            return None
+        surface.blit(self.scratch, dirty, dirty)
+        self.scratch.fill((0, 0, 0, 0), dirty)
+        return dirty
@@ -1,36 +1,119 @@
 import pygame
 from OpenGL.GL import *
+from core.dirty_region import DirtyRegion
+from core.viewport import Viewport
+from data.config import DIRTY_FULL_UPLOAD_RATIO
+
+
+# Calque translucide réutilisé par fill_translucent (un par taille)
+_translucent_layers = {}
+
+
+def fill_translucent(surface, color):
+    """Mélange une couleur RGBA sur toute la surface (équivalent logiciel de draw_tint)."""
+    size = surface.get_size()
+    layer = _translucent_layers.get(size)
+    if layer is None:
+        layer = pygame.Surface(size, pygame.SRCALPHA)
+        _translucent_layers[size] = layer
+    layer.fill(color)
+    surface.blit(layer, (0, 0))
 
 
 class Scene:
     """Classe de base pour toutes les scènes."""
 
+    # Les scènes qui signalent leurs zones dessinées via mark_dirty()
+    # n'effacent et n'uploadent que ces zones de l'overlay
+    tracks_dirty_rects = False
+
     def __init__(self, manager):
         self.manager = manager
         self.screen = manager.screen
 
+    def mark_dirty(self, rect):
+        """Signale une zone de l'overlay dessinée pendant cette frame."""
+        self.manager.overlay_dirty.add(rect)
+
+    def mark_full_dirty(self):
+        """Signale que tout l'overlay est redessiné pendant cette frame."""
+        self.manager.overlay_dirty.mark_full()
+
     def handle_events(self, events):
         pass
 
     def update(self, dt):
         pass
 
+    def get_background(self):
+        """Fond statique de la scène (envoyé une seule fois au GPU en OpenGL), ou None."""
+        return None
+
+    def has_decals(self):
+        """Indique si des éléments dynamiques sont posés sur le fond."""
+        return False
+
+    def render_decals(self, surface):
+        """Rendu des éléments dynamiques du fond (splashes)."""
+        pass
+
+    def render_decal_sprites(self, sprites):
+        """Ajoute les décors dynamiques au lot de sprites GL.
+
+        Retourne False si la scène ne sait pas le faire (repli sur render_decals).
+        """
+        return False
+
     def render_background(self, surface):
         """Rendu du background 2D."""
-        pass
+        background = self.get_background()
+        if background is not None:
+            surface.blit(background, (0, 0))
+        self.render_decals(surface)
 
     def render_3d(self):
         """Rendu 3D OpenGL."""
         pass
 
+    def get_tint(self):
+        """Teinte RGBA plein écran appliquée entre la 3D et l'overlay, ou None."""
+        return None
+
+    def render_gl(self, renderer):
+        """Rendu OpenGL 2D direct, sous l'overlay (traînée de lame, etc)."""
+        pass
+
     def render_overlay(self, surface):
         """Rendu des éléments 2D au-dessus (HUD, blade, etc)."""
         pass
 
+    def get_dim(self):
+        """Assombrissement RGBA plein écran appliqué au-dessus de l'overlay, ou None."""
+        return None
+
+    def render_modal(self, surface):
+        """Rendu des éléments au-dessus de l'assombrissement (menu pause, tableaux)."""
+        pass
+
+    def get_frame_key(self):
+        """Valeur résumant l'image affichée, ou None si elle change à chaque frame.
+
+        En rendu logiciel, une frame dont la clé est égale à celle de la
+        précédente n'est ni redessinée ni présentée (menus, pause).
+        """
+        return None
+
     def render(self, surface):
         """Rendu 2D complet (pour mode sans OpenGL)."""
         self.render_background(surface)
+        tint = self.get_tint()
+        if tint:
+            fill_translucent(surface, tint)
         self.render_overlay(surface)
+        dim = self.get_dim()
+        if dim:
+            fill_translucent(surface, dim)
+            self.render_modal(surface)
 
     def on_enter(self):
         pass
@@ -38,22 +121,55 @@ class Scene:
     def on_exit(self):
         pass
 
+    def cleanup(self):
+        """Libère les ressources partagées acquises par la scène (en fin de programme)."""
+        pass
+
 
 class SceneManager:
-    """Gère les scènes avec rendu hybride OpenGL/Pygame."""
+    """Gère les scènes avec rendu hybride OpenGL/Pygame.
+
+    Les scènes dessinent dans des surfaces de taille logique et reçoivent
+    la souris en coordonnées logiques, quelle que soit la fenêtre. Le
+    rendu passe par un backend matériel (GLRenderer, ou SDLRenderer sans
+    3D) ou, à défaut, entièrement en logiciel sur screen.
+    """
 
-    def __init__(self, screen, gl_renderer=None):
+    def __init__(self, screen, gl_renderer=None, sprites=None, text=None, viewport=None, renderer=None):
         self.screen = screen
         self.gl_renderer = gl_renderer
+        self.renderer = renderer or gl_renderer   # Backend 2D matériel, None = logiciel
+        self.viewport = viewport or (self.renderer.viewport if self.renderer else
+                                     Viewport(screen.get_size(), screen.get_size()))
+        self.sprites = sprites     # Lot de sprites partagé (backend matériel uniquement)
+        self.text = text           # TextBatch partagé (backend matériel uniquement)
         self.clock = pygame.time.Clock()
         self.running = True
         self.current_scene = None
         self.scenes = {}
         self.shared_data = {}
 
-        # Surfaces pour le rendu 2D
-        self.bg_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        self.overlay_surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+        # Surfaces pour le rendu 2D (taille logique)
+        size = self.viewport.logical_size
+        self.bg_surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.overlay_surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.overlay_dirty = DirtyRegion(size, DIRTY_FULL_UPLOAD_RATIO)
+        self.modal_surface = pygame.Surface(size, pygame.SRCALPHA)
+
+        # Rendu logiciel mis à l'échelle : image étirée réutilisée, bandes noires posées une fois
+        self.scaled_surface = None
+        if not self.renderer and not self.viewport.identity:
+            self.scaled_surface = pygame.Surface(self.viewport.rect.size, pygame.SRCALPHA)
+            screen.fill((0, 0, 0))
+
+        # Présentation logicielle : fond converti une fois, clé de la dernière image affichée
+        self.base_layer = None
+        self.base_source = None
+        self.frame_key = None
+
+    def mouse_pos(self):
+        """Position de la souris en coordonnées logiques."""
+        return self.viewport.to_logical(pygame.mouse.get_pos())
 
     def add_scene(self, name, scene):
         self.scenes[name] = scene
@@ -62,6 +178,8 @@ class SceneManager:
         if self.current_scene:
             self.current_scene.on_exit()
         self.current_scene = self.scenes.get(name)
+        self.overlay_dirty.reset()
+        self.frame_key = None
         if self.current_scene:
             self.current_scene.on_enter()
 
@@ -73,41 +191,144 @@ class SceneManager:
             for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                    event.pos = self.viewport.to_logical(event.pos)
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self.frame_key = None   # Fenêtre à repeindre entièrement
 
             if self.current_scene:
                 self.current_scene.handle_events(events)
                 self.current_scene.update(dt)
 
-                if self.gl_renderer:
+                if self.renderer:
                     self._render_hybrid()
                 else:
-                    self.bg_surface.fill((0, 0, 0))
-                    self.current_scene.render(self.bg_surface)
-                    self.screen.blit(self.bg_surface, (0, 0))
-                    pygame.display.flip()
+                    self._render_software()
+
+    def _render_software(self):
+        """Rendu logiciel : rien si l'image n'a pas changé, sinon zones modifiées ou image entière."""
+        scene = self.current_scene
+        key = scene.get_frame_key()
+        if key is not None and key == self.frame_key:
+            return
+        self.frame_key = key
+
+        background = scene.get_background()
+        if (self.scaled_surface is None and scene.tracks_dirty_rects and background is not None
+                and not scene.has_decals() and not scene.get_tint() and not scene.get_dim()):
+            self._present_dirty(background)
+            return
+
+        self.bg_surface.fill((0, 0, 0))
+        scene.render(self.bg_surface)
+        self.overlay_dirty.reset()
+        self._present_software()
+        pygame.display.flip()
+
+    def _present_dirty(self, background):
+        """Overlay sur le fond en cache, seules les zones modifiées sont recomposées et présentées."""
+        if background is not self.base_source:
+            self.base_layer = pygame.Surface(self.viewport.logical_size)
+            if pygame.display.get_surface() is not None:
+                self.base_layer = self.base_layer.convert()
+            self.base_layer.blit(background, (0, 0))
+            self.base_source = background
+            self.overlay_dirty.reset()
+
+        self.overlay_dirty.begin_frame(self.overlay_surface)
+        self.current_scene.render_overlay(self.overlay_surface)
+        rects = self.overlay_dirty.flush()
+        for rect in (self.screen.get_rect(),) if rects is None else rects:
+            self.screen.blit(self.base_layer, rect, rect)
+            self.screen.blit(self.overlay_surface, rect, rect)
+
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+    def _present_software(self):
+        """Copie l'image logique à l'écran, étirée dans la fenêtre si besoin."""
+        if self.scaled_surface is None:
+            self.screen.blit(self.bg_surface, (0, 0))
+        else:
+            pygame.transform.smoothscale(self.bg_surface, self.viewport.rect.size, self.scaled_surface)
+            self.screen.blit(self.scaled_surface, self.viewport.rect)
 
     def _render_hybrid(self):
         """Rendu: Background 2D -> Fruits 3D -> Overlay 2D."""
+        renderer = self.renderer
+        if self.gl_renderer is None:
+            # Renderer SDL (souvent son pilote logiciel) : image inchangée = ni rendu ni present,
+            # la fenêtre garde la dernière image présentée
+            key = self.current_scene.get_frame_key()
+            if key is not None and key == self.frame_key:
+                return
+            self.frame_key = key
+
         # 1. Clear
-        self.gl_renderer.begin_frame()
+        renderer.begin_frame()
 
-        # 2. Background 2D
-        self.bg_surface.fill((0, 0, 0, 0))
-        self.current_scene.render_background(self.bg_surface)
-        self.gl_renderer.setup_2d()
-        self.gl_renderer.draw_surface(self.bg_surface)
+        # 2. Background 2D : le fond statique reste sur le GPU, seuls les décors dynamiques sont envoyés
+        renderer.setup_2d()
+        background = self.current_scene.get_background()
+        if background is not None:
+            renderer.draw_static_surface(background)
+            if self.current_scene.has_decals():
+                if self.sprites is not None and self.current_scene.render_decal_sprites(self.sprites):
+                    self.sprites.flush()
+                else:
+                    self.bg_surface.fill((0, 0, 0, 0))
+                    self.current_scene.render_decals(self.bg_surface)
+                    renderer.draw_surface(self.bg_surface, 'background')
+        else:
+            self.bg_surface.fill((0, 0, 0, 0))
+            self.current_scene.render_background(self.bg_surface)
+            renderer.draw_surface(self.bg_surface, 'background')
+
+        # 3. Fruits 3D (OpenGL uniquement)
+        if self.gl_renderer:
+            self.gl_renderer.setup_3d()
+            self.current_scene.render_3d()
 
-        # 3. Fruits 3D
-        self.gl_renderer.setup_3d()
-        self.current_scene.render_3d()
+        # 4. Teinte des bonus (freeze / frenzy) en post-process GPU, puis primitives GL 2D
+        renderer.setup_2d()
+        tint = self.current_scene.get_tint()
+        if tint:
+            renderer.draw_tint(tint)
+        if self.gl_renderer:
+            self.current_scene.render_gl(self.gl_renderer)
 
-        # 4. Overlay 2D (blade, HUD)
-        self.overlay_surface.fill((0, 0, 0, 0))
+        # 5. Overlay 2D (blade, HUD) : seules les zones modifiées sont effacées et envoyées
+        self.overlay_dirty.begin_frame(self.overlay_surface)
+        if not self.current_scene.tracks_dirty_rects:
+            self.overlay_dirty.mark_full()
+            self.overlay_surface.fill((0, 0, 0, 0))
         self.current_scene.render_overlay(self.overlay_surface)
-        self.gl_renderer.setup_2d()
-        self.gl_renderer.draw_surface(self.overlay_surface)
+        if self.sprites is not None:
+            # Sprites ajoutés par render_overlay (coeurs, pastilles...), sous le texte
+            self.sprites.flush()
+        renderer.draw_surface(self.overlay_surface, 'overlay', self.overlay_dirty.flush())
+        if self.text is not None:
+            self.text.flush()
 
-        pygame.display.flip()
+        # 6. Assombrissement GPU puis éléments modaux (pause, tableaux)
+        dim = self.current_scene.get_dim()
+        if dim:
+            renderer.draw_tint(dim)
+            self.modal_surface.fill((0, 0, 0, 0))
+            self.current_scene.render_modal(self.modal_surface)
+            renderer.draw_surface(self.modal_surface, 'modal')
+            if self.text is not None:
+                self.text.flush()
+
+        renderer.end_frame()
+        renderer.present()
 
     def quit(self):
         self.running = False
+
+    def cleanup(self):
+        """Libère les ressources des scènes, avant celles du backend."""
+        for scene in self.scenes.values():
+            scene.cleanup()
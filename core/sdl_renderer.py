@@ -0,0 +1,159 @@
+"""
+Backend 2D matériel basé sur l'API Renderer/Texture de SDL2 (pygame._sdl2),
+utilisé quand OpenGL n'est pas disponible.
+"""
+import os
+import numpy
+from pygame._sdl2.video import Window, Renderer, Texture
+from core.viewport import Viewport
+
+# Mode de mélange SDL_BLENDMODE_BLEND (alpha classique)
+BLEND_ALPHA = 1
+
+
+def init_sdl_window(width, height, fullscreen=False, title="Fruit Ninja"):
+    """Crée la fenêtre SDL2 (sans surface d'affichage pygame)."""
+    # Filtrage linéaire des textures étirées : SDL lit cet indice à la création
+    # de chaque texture, il doit donc être posé avant la fenêtre et son renderer
+    os.environ.setdefault('SDL_RENDER_SCALE_QUALITY', '1')
+    if fullscreen:
+        return Window(title, (width or 1, height or 1), fullscreen_desktop=True)
+    return Window(title, (width, height))
+
+
+class SDLSpriteBatch:
+    """Équivalent de SpriteBatch : l'atlas est une texture, chaque sprite une copie teintée.
+
+    Fonctionne aussi avec le renderer logiciel de SDL (machines sans GPU).
+    """
+
+    def __init__(self, renderer, atlas):
+        self.atlas = atlas
+        self.texture = Texture.from_surface(renderer.renderer, atlas.surface)
+        self.texture.blend_mode = BLEND_ALPHA
+        self.sprites = []   # (région de l'atlas, rect écran, couleur, alpha)
+
+    def add(self, name, rect, color=(255, 255, 255), alpha=255):
+        """Ajoute le sprite name étiré sur rect (Rect ou (x, y, w, h) écran)."""
+        self.sprites.append((self.atlas.regions[name], tuple(rect), tuple(color[:3]), int(alpha)))
+
+    def add_many(self, name, centers, sizes, colors, alphas):
+        """Ajoute N sprites carrés centrés (mêmes arguments que SpriteBatch.add_many)."""
+        if len(centers) == 0:
+            return
+        region = self.atlas.regions[name]
+        sizes = numpy.asarray(sizes, dtype=numpy.float32)
+        corners = numpy.asarray(centers, dtype=numpy.float32) - sizes[:, None] * 0.5
+        colors = numpy.asarray(colors).astype(int).tolist()
+        alphas = numpy.asarray(alphas).astype(int).tolist()
+        for (x, y), size, color, alpha in zip(corners.tolist(), sizes.tolist(), colors, alphas):
+            self.sprites.append((region, (x, y, size, size), tuple(color), alpha))
+
+    def flush(self):
+        """Dessine les sprites accumulés puis vide le lot."""
+        texture = self.texture
+        for region, rect, color, alpha in self.sprites:
+            texture.color = color
+            texture.alpha = alpha
+            texture.draw(region, rect)
+        self.sprites = []
+
+    def release(self):
+        self.texture = None
+
+
+class SDLRenderer:
+    """Rendu 2D par le Renderer SDL2 : fonds, calques et sprites sont des textures.
+
+    Même interface que GLRenderer pour la partie 2D (calques, teintes,
+    lots de sprites). Hors taille native ou avec render_scale != 1, la
+    frame est dessinée dans une texture cible puis étirée dans la
+    fenêtre par une seule copie filtrée.
+    """
+
+    def __init__(self, window, width, height, render_scale=1.0):
+        self.window = window
+        self.width = width
+        self.height = height
+        self.renderer = Renderer(window, target_texture=True)
+        self.viewport = Viewport((width, height), self.renderer.get_viewport().size, window.size)
+        self.layers = {}           # Texture de streaming par nom de calque
+        self.static_textures = {}  # (surface, Texture) par id de surface
+
+        self.render_scale = render_scale
+        self.target = None
+        size = (max(1, round(width * render_scale)), max(1, round(height * render_scale)))
+        if size != self.viewport.rect.size or not self.viewport.identity:
+            self.target = Texture(self.renderer, size, target=True)
+
+    def begin_frame(self):
+        """Début du rendu d'une frame."""
+        if self.target is not None:
+            self.renderer.target = self.target
+            self.renderer.scale = (self.render_scale, self.render_scale)
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+
+    def setup_2d(self):
+        """Rien à configurer : le Renderer SDL est toujours en 2D."""
+        pass
+
+    def draw_surface(self, surface, layer='overlay', dirty_rects=None):
+        """Dessine une surface Pygame via la texture de streaming du calque.
+
+        dirty_rects limite la mise à jour aux zones modifiées (None = surface entière).
+        """
+        size = surface.get_size()
+        texture = self.layers.get(layer)
+        if texture is None or (texture.width, texture.height) != size:
+            texture = Texture(self.renderer, size, streaming=True)
+            texture.blend_mode = BLEND_ALPHA
+            self.layers[layer] = texture
+            dirty_rects = None
+
+        if dirty_rects is None:
+            texture.update(surface)
+        else:
+            for rect in dirty_rects:
+                texture.update(surface.subsurface(rect), rect)
+        texture.draw(dstrect=(0, 0) + size)
+
+    def draw_static_surface(self, surface):
+        """Dessine une surface qui ne change jamais (envoyée à la première utilisation)."""
+        entry = self.static_textures.get(id(surface))
+        if entry is None:
+            texture = Texture.from_surface(self.renderer, surface)
+            texture.blend_mode = BLEND_ALPHA
+            # On garde la surface pour que son id() reste unique
+            entry = (surface, texture)
+            self.static_textures[id(surface)] = entry
+        entry[1].draw(dstrect=(0, 0) + surface.get_size())
+
+    def draw_tint(self, color):
+        """Mélange une couleur RGBA (0-255) sur toute l'image."""
+        self.renderer.draw_blend_mode = BLEND_ALPHA
+        self.renderer.draw_color = tuple(color)
+        self.renderer.fill_rect((0, 0, self.width, self.height))
+
+    def sprite_batch(self, atlas):
+        """Lot de sprites de l'atlas pour ce backend."""
+        return SDLSpriteBatch(self, atlas)
+
+    def end_frame(self):
+        """Fin de frame : étire la résolution interne dans la fenêtre."""
+        if self.target is None:
+            return
+        self.renderer.target = None
+        self.renderer.scale = (1, 1)
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()   # Bandes noires hors de la zone logique
+        self.target.draw(dstrect=self.viewport.rect)
+
+    def present(self):
+        self.renderer.present()
+
+    def cleanup(self):
+        """Libère les textures."""
+        self.layers.clear()
+        self.static_textures.clear()
+        self.target = None
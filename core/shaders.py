@@ -0,0 +1,263 @@
+"""
+Compilation des programmes GLSL et sources des shaders du jeu.
+"""
+from OpenGL.GL import *
+
+# Emplacements fixes des attributs (liés avant l'édition de liens)
+ATTRIB_POSITION = 0
+ATTRIB_NORMAL = 1
+ATTRIB_TEXCOORD = 2
+
+ATTRIB_MODEL = 3      # mat4 par instance : occupe les emplacements 3 à 6
+ATTRIB_COLOR = 7      # Couleur par instance
+
+MESH_ATTRIBUTES = {
+    'a_position': ATTRIB_POSITION,
+    'a_normal': ATTRIB_NORMAL,
+    'a_texcoord': ATTRIB_TEXCOORD,
+}
+
+INSTANCED_MESH_ATTRIBUTES = dict(MESH_ATTRIBUTES, a_model=ATTRIB_MODEL, a_color=ATTRIB_COLOR)
+
+# Éclairage équivalent à GLRenderer._setup_lighting (lumière directionnelle en repère caméra)
+LIGHT_DIRECTION = (1.0, 1.0, 2.0)
+LIGHT_AMBIENT = 0.5   # Ambiante de la lumière (0.3) + ambiante globale par défaut (0.2)
+LIGHT_DIFFUSE = 0.8
+
+
+# Shaders des modèles : une variante GLSL 3.30 core (contexte core profile) et
+# une variante GLSL 1.20 pour les contextes 2.1 ; les matrices sont des uniforms
+MESH_VERTEX_SHADER_330 = """
+#version 330 core
+in vec3 a_position;
+in vec3 a_normal;
+in vec2 a_texcoord;
+
+uniform mat4 u_projection;
+uniform mat4 u_view;
+uniform mat4 u_model;
+uniform vec3 u_color;
+
+out vec3 v_normal;
+out vec2 v_texcoord;
+out vec3 v_color;
+
+void main() {
+    mat4 modelview = u_view * u_model;
+    v_normal = mat3(modelview) * a_normal;
+    v_texcoord = a_texcoord;
+    v_color = u_color;
+    gl_Position = u_projection * modelview * vec4(a_position, 1.0);
+}
+"""
+
+MESH_VERTEX_SHADER = """
+#version 120
+attribute vec3 a_position;
+attribute vec3 a_normal;
+attribute vec2 a_texcoord;
+
+uniform mat4 u_projection;
+uniform mat4 u_view;
+uniform mat4 u_model;
+uniform vec3 u_color;
+
+varying vec3 v_normal;
+varying vec2 v_texcoord;
+varying vec3 v_color;
+
+void main() {
+    mat4 modelview = u_view * u_model;
+    v_normal = mat3(modelview) * a_normal;
+    v_texcoord = a_texcoord;
+    v_color = u_color;
+    gl_Position = u_projection * modelview * vec4(a_position, 1.0);
+}
+"""
+
+INSTANCED_MESH_VERTEX_SHADER_330 = """
+#version 330 core
+in vec3 a_position;
+in vec3 a_normal;
+in vec2 a_texcoord;
+in mat4 a_model;
+in vec3 a_color;
+
+uniform mat4 u_projection;
+uniform mat4 u_view;
+
+out vec3 v_normal;
+out vec2 v_texcoord;
+out vec3 v_color;
+
+void main() {
+    mat4 modelview = u_view * a_model;
+    v_normal = mat3(modelview) * a_normal;
+    v_texcoord = a_texcoord;
+    v_color = a_color;
+    gl_Position = u_projection * modelview * vec4(a_position, 1.0);
+}
+"""
+
+INSTANCED_MESH_VERTEX_SHADER = """
+#version 120
+attribute vec3 a_position;
+attribute vec3 a_normal;
+attribute vec2 a_texcoord;
+attribute mat4 a_model;
+attribute vec3 a_color;
+
+uniform mat4 u_projection;
+uniform mat4 u_view;
+
+varying vec3 v_normal;
+varying vec2 v_texcoord;
+varying vec3 v_color;
+
+void main() {
+    mat4 modelview = u_view * a_model;
+    v_normal = mat3(modelview) * a_normal;
+    v_texcoord = a_texcoord;
+    v_color = a_color;
+    gl_Position = u_projection * modelview * vec4(a_position, 1.0);
+}
+"""
+
+MESH_FRAGMENT_SHADER_330 = """
+#version 330 core
+uniform sampler2D u_texture;
+uniform float u_use_texture;
+uniform vec3 u_light_direction;
+uniform float u_ambient;
+uniform float u_diffuse;
+
+in vec3 v_normal;
+in vec2 v_texcoord;
+in vec3 v_color;
+
+out vec4 frag_color;
+
+void main() {
+    vec3 normal = normalize(v_normal);
+    float lambert = max(dot(normal, u_light_direction), 0.0);
+    vec4 base = vec4(v_color, 1.0);
+    if (u_use_texture > 0.5) {
+        base *= texture(u_texture, v_texcoord);
+    }
+    frag_color = vec4(base.rgb * (u_ambient + u_diffuse * lambert), base.a);
+}
+"""
+
+MESH_FRAGMENT_SHADER = """
+#version 120
+uniform sampler2D u_texture;
+uniform float u_use_texture;
+uniform vec3 u_light_direction;
+uniform float u_ambient;
+uniform float u_diffuse;
+
+varying vec3 v_normal;
+varying vec2 v_texcoord;
+varying vec3 v_color;
+
+void main() {
+    vec3 normal = normalize(v_normal);
+    float lambert = max(dot(normal, u_light_direction), 0.0);
+    vec4 base = vec4(v_color, 1.0);
+    if (u_use_texture > 0.5) {
+        base *= texture2D(u_texture, v_texcoord);
+    }
+    gl_FragColor = vec4(base.rgb * (u_ambient + u_diffuse * lambert), base.a);
+}
+"""
+
+# (vertex, fragment) par ordre de préférence, pour compile_program_variants
+MESH_PROGRAM_VARIANTS = (
+    (MESH_VERTEX_SHADER_330, MESH_FRAGMENT_SHADER_330),
+    (MESH_VERTEX_SHADER, MESH_FRAGMENT_SHADER),
+)
+INSTANCED_MESH_PROGRAM_VARIANTS = (
+    (INSTANCED_MESH_VERTEX_SHADER_330, MESH_FRAGMENT_SHADER_330),
+    (INSTANCED_MESH_VERTEX_SHADER, MESH_FRAGMENT_SHADER),
+)
+
+# Post-process : quad plein écran (coordonnées NDC) d'une couleur uniforme
+POST_VERTEX_SHADER = """
+#version 120
+attribute vec2 a_position;
+
+void main() {
+    gl_Position = vec4(a_position, 0.0, 1.0);
+}
+"""
+
+POST_FRAGMENT_SHADER = """
+#version 120
+uniform vec4 u_color;
+
+void main() {
+    gl_FragColor = u_color;
+}
+"""
+
+
+def compile_shader(source, shader_type):
+    """Compile un shader et lève RuntimeError avec le log en cas d'échec."""
+    shader = glCreateShader(shader_type)
+    glShaderSource(shader, source)
+    glCompileShader(shader)
+    if not glGetShaderiv(shader, GL_COMPILE_STATUS):
+        log = glGetShaderInfoLog(shader)
+        glDeleteShader(shader)
+        raise RuntimeError(f"Shader compilation failed: {log}")
+    return shader
+
+
+def compile_program(vertex_source, fragment_source, attributes=None):
+    """Compile et lie un programme GLSL, retourne (program_id, uniforms).
+
+    uniforms associe le nom de chaque uniform actif à son emplacement.
+    """
+    vertex = compile_shader(vertex_source, GL_VERTEX_SHADER)
+    fragment = compile_shader(fragment_source, GL_FRAGMENT_SHADER)
+
+    program = glCreateProgram()
+    glAttachShader(program, vertex)
+    glAttachShader(program, fragment)
+    for name, location in (attributes or {}).items():
+        glBindAttribLocation(program, location, name)
+    glLinkProgram(program)
+
+    glDetachShader(program, vertex)
+    glDetachShader(program, fragment)
+    glDeleteShader(vertex)
+    glDeleteShader(fragment)
+
+    if not glGetProgramiv(program, GL_LINK_STATUS):
+        log = glGetProgramInfoLog(program)
+        glDeleteProgram(program)
+        raise RuntimeError(f"Program link failed: {log}")
+
+    uniforms = {}
+    for index in range(glGetProgramiv(program, GL_ACTIVE_UNIFORMS)):
+        name = glGetActiveUniform(program, index)[0]
+        if isinstance(name, bytes):
+            name = name.decode()
+        name = name.split('[')[0]
+        uniforms[name] = glGetUniformLocation(program, name)
+    return program, uniforms
+
+
+def compile_program_variants(variants, attributes=None):
+    """Compile la première variante (vertex, fragment) acceptée par le contexte.
+
+    Les variantes GLSL 3.30 core échouent sur un contexte 2.1 : on passe
+    alors à la suivante. Lève l'erreur de la dernière si aucune ne compile.
+    """
+    error = None
+    for vertex_source, fragment_source in variants:
+        try:
+            return compile_program(vertex_source, fragment_source, attributes)
+        except RuntimeError as e:
+            error = e
+    raise error
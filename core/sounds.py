@@ -0,0 +1,106 @@
+"""
+Banque de sons partagée : chaque fichier est décodé une seule fois (en
+parallèle au lancement) et le même objet Sound est rendu à tous ses
+utilisateurs.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+
+# Sons de la lame (joués à tour de rôle)
+BLADE_SWIPE_SOUNDS = [f"asset/Blade/bamboo-swipe-{i}.wav" for i in range(1, 5)]
+BLADE_IMPACT_SOUNDS = [f"asset/Blade/bamboo-impact-{i}.wav" for i in range(1, 5)]
+
+# Sons combo 1-8 (le combo 1 n'est jamais joué)
+COMBO_SOUNDS = {
+    i: f"asset/Sound Combo/combo-{i}.wav" if i <= 5 else f"asset/Sound Combo/Combo-{i}.wav"
+    for i in range(1, 9)
+}
+
+# Sons stack 1-5
+STACK_SOUNDS = {
+    1: "asset/Sound Combo/Stack-combo-1.wav",
+    2: "asset/Sound Combo/Strack-combo-2.wav",
+    3: "asset/Sound Combo/Stack-combo-3.wav",
+    4: "asset/Sound Combo/Stack-combo-4.wav",
+    5: "asset/Sound Combo/Stack-comb-5.wav"
+}
+
+# Sons ultra stack 1-6
+ULTRA_SOUNDS = {i: f"asset/Sound Combo/Ultra-Stack-combo-{i}.wav" for i in range(1, 7)}
+
+# Son de coupe par type de fruit
+IMPACT_SOUNDS = {
+    'apple': 'asset/Impact/Impact-Apple.wav',
+    'orange': 'asset/Impact/Impact-Orange.wav',
+    'watermelon': 'asset/Impact/Impact-Watermelon.wav',
+    'banana': 'asset/Impact/Impact-Banana-Chili.wav',
+    'chili': 'asset/Impact/Impact-Banana-Chili.wav',
+    'coconut': 'asset/Impact/Impact-Coconut.wav',
+    'ice': 'asset/Impact/Impact-Ice.mp3',
+}
+
+THROW_FRUIT_SOUND = "asset/Sound object/Throw-fruit.wav"
+THROW_BOMB_SOUND = "asset/Sound object/Throw-bomb.wav"
+BOMB_EXPLODE_SOUND = "asset/Sound object/Bomb-explode.wav"
+BOMB_FUSE_SOUND = "asset/Sound object/Bomb-Fuse.wav"
+GAME_START_SOUND = "asset/Sound Menu/Game-start.wav"
+GAME_OVER_SOUND = "asset/Sound Menu/Game-over.wav"
+
+# Tous les sons du jeu, préchargés au lancement
+GAME_SOUNDS = (
+    BLADE_SWIPE_SOUNDS + BLADE_IMPACT_SOUNDS
+    + list(COMBO_SOUNDS.values()) + list(STACK_SOUNDS.values()) + list(ULTRA_SOUNDS.values())
+    + list(IMPACT_SOUNDS.values())
+    + [THROW_FRUIT_SOUND, THROW_BOMB_SOUND, BOMB_EXPLODE_SOUND, BOMB_FUSE_SOUND,
+       GAME_START_SOUND, GAME_OVER_SOUND]
+)
+
+
+def load_sound(path):
+    """Décode un son, ou None s'il est absent ou si le mixer n'est pas disponible."""
+    try:
+        return pygame.mixer.Sound(path)
+    except Exception:
+        return None
+
+
+class SoundBank:
+    """Objets Sound par chemin de fichier.
+
+    Les échecs de chargement sont mémorisés (None) : un fichier absent n'est
+    essayé qu'une fois par processus.
+    """
+
+    def __init__(self):
+        self.sounds = {}
+
+    def preload(self, paths, workers=4):
+        """Décode en parallèle les sons pas encore chargés (pygame relâche le GIL pendant le décodage)."""
+        missing = [path for path in dict.fromkeys(paths) if path not in self.sounds]
+        if not missing:
+            return
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for path, sound in zip(missing, pool.map(load_sound, missing)):
+                self.sounds[path] = sound
+
+    def get(self, path):
+        """Son du fichier path (chargé à la première demande), ou None."""
+        if path not in self.sounds:
+            self.sounds[path] = load_sound(path)
+        return self.sounds[path]
+
+    def get_list(self, paths):
+        """Sons disponibles parmi paths, dans l'ordre."""
+        return [sound for sound in map(self.get, paths) if sound is not None]
+
+    def get_dict(self, paths):
+        """Sons disponibles d'un dictionnaire clé -> chemin."""
+        sounds = {key: self.get(path) for key, path in paths.items()}
+        return {key: sound for key, sound in sounds.items() if sound is not None}
+
+    def clear(self):
+        self.sounds.clear()
+
+
+# Banque partagée par la lame, les combos, les bombes et les scènes
+sounds = SoundBank()
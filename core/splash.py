@@ -3,51 +3,84 @@ Effet de splash quand un fruit est coupé.
 """
 import pygame
 import random
+from collections import OrderedDict, deque
+from core.images import images as image_cache
+from data.config import SPLASH_FADE_INTERVAL, SPLASH_FADE_RESIDUAL, SPLASH_TINT_CACHE_SIZE
 
 # Taille du splash en pixels
 SPLASH_SIZE = 150
 
+# Durée de vie d'un splash (s)
+SPLASH_LIFETIME = 5.0
+
 
 class Splash:
     """Splash coloré qui apparaît quand un fruit est coupé."""
 
     # Images de splash chargées une seule fois
     images = None
+    # Variantes teintées partagées : (index d'image, couleur) -> surface (LRU)
+    tinted = OrderedDict()
 
     def __init__(self, x, y, color):
         self.x = x
         self.y = y
         self.color = color  # RGB tuple (0-255)
         self.alpha = 255
-        self.fade_speed = 255 / 5.0  # Disparaît en 5 secondes
+        self.fade_speed = 255 / SPLASH_LIFETIME  # Disparaît en 5 secondes
         self.is_done = False
 
-        # Charger les images si pas encore fait
-        if Splash.images is None:
-            Splash.images = []
-            for i in [1, 2, 3, 4, 5, 6]:
-                try:
-                    if i == 4:
-                        img = pygame.image.load(f"asset/Splash/Slash-4.png").convert_alpha()
-                    else:
-                        img = pygame.image.load(f"asset/Splash/Splash-{i}.png").convert_alpha()
-                    # Redimensionner l'image
-                    img = pygame.transform.scale(img, (SPLASH_SIZE, SPLASH_SIZE))
-                    Splash.images.append(img)
-                except:
-                    pass
-
         # Choisir une image au hasard
-        if Splash.images:
-            self.original_image = random.choice(Splash.images)
-            self.image = self._tint_image(self.original_image, self.color)
+        images = Splash.load_images()
+        if images:
+            self.image_index = random.randrange(len(images))
+            self.original_image = images[self.image_index]
+            self.image = Splash.tinted_image(self.image_index, self.color)
             # Centrer l'image sur la position
             self.rect = self.image.get_rect(center=(x, y))
         else:
             self.image = None
             self.is_done = True
 
-    def _tint_image(self, image, color):
+    @classmethod
+    def load_images(cls):
+        """Charge les images de splash une seule fois (partagées avec l'atlas GL)."""
+        if cls.images is None:
+            cls.images = []
+            for i in [1, 2, 3, 4, 5, 6]:
+                try:
+                    path = "asset/Splash/Slash-4.png" if i == 4 else f"asset/Splash/Splash-{i}.png"
+                    cls.images.append(image_cache.load(path, (SPLASH_SIZE, SPLASH_SIZE), alpha=True))
+                except:
+                    pass
+        return cls.images
+
+    @classmethod
+    def tinted_image(cls, index, color):
+        """Image index teintée par color, partagée entre splashs (ne pas modifier).
+
+        Les variantes sont gardées dans un cache LRU de SPLASH_TINT_CACHE_SIZE entrées.
+        """
+        key = (index, tuple(color))
+        image = cls.tinted.get(key)
+        if image is None:
+            image = cls._tint_image(cls.load_images()[index], color)
+            cls.tinted[key] = image
+            if len(cls.tinted) > SPLASH_TINT_CACHE_SIZE:
+                cls.tinted.popitem(last=False)
+        else:
+            cls.tinted.move_to_end(key)
+        return image
+
+    @classmethod
+    def prewarm(cls, colors):
+        """Prépare les variantes teintées de toutes les images pour ces couleurs."""
+        for index in range(len(cls.load_images())):
+            for color in colors:
+                cls.tinted_image(index, color)
+
+    @staticmethod
+    def _tint_image(image, color):
         """Teinte une image blanche avec la couleur donnée."""
         # Créer une copie
         tinted = image.copy()
@@ -71,7 +104,89 @@ class Splash:
     def render(self, surface):
         """Dessine le splash sur la surface."""
         if self.image and not self.is_done:
-            # Appliquer l'alpha
-            temp_image = self.image.copy()
-            temp_image.set_alpha(int(self.alpha))
-            surface.blit(temp_image, self.rect)
+            # Alpha de surface appliqué au blit : l'image partagée n'est pas copiée
+            self.image.set_alpha(int(self.alpha))
+            surface.blit(self.image, self.rect)
+            self.image.set_alpha(255)
+
+    def render_sprite(self, sprites):
+        """Ajoute le splash au lot de sprites GL (teinte et alpha par quad)."""
+        if self.image and not self.is_done:
+            sprites.add(f"splash-{self.image_index}", self.rect, self.color, int(self.alpha))
+
+
+class SplashLayer:
+    """Calque persistant où chaque splash est cuit une seule fois, à sa création.
+
+    Au lieu de mélanger chaque splash vivant à chaque frame, l'alpha de tout
+    le calque est multiplié à intervalles réguliers (BLEND_RGBA_MULT) par un
+    facteur constant : chaque splash décroît géométriquement depuis sa
+    création, quel que soit le rythme des coupes, et garde residual de son
+    opacité au bout de lifetime secondes. À cette échéance sa zone est
+    effacée, puis les splashs encore vivants qui la recouvrent y sont
+    redessinés à leur opacité courante. Le coût ne dépend plus du nombre de
+    splashs vivants mais de leur fréquence de création.
+    """
+
+    def __init__(self, size, fade_interval=SPLASH_FADE_INTERVAL, lifetime=SPLASH_LIFETIME,
+                 residual=SPLASH_FADE_RESIDUAL):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.fade_interval = fade_interval
+        self.lifetime = lifetime
+        # Facteur d'un pas de fondu : residual ** (fade_interval / lifetime)
+        self.factor = residual ** (fade_interval / lifetime)
+        self.time = 0           # Horloge du calque, indépendante des ajouts
+        self.steps = 0          # Pas de fondu déjà appliqués au calque
+        self.live = deque()     # (échéance, pas à la création, image, rect), du plus ancien au plus récent
+        self.empty = True
+
+    def add(self, splash):
+        """Cuit le splash dans le calque à pleine opacité."""
+        if splash.image is None:
+            return
+        self.surface.blit(splash.image, splash.rect)
+        self.live.append((self.time + self.lifetime, self.steps, splash.image, splash.rect))
+        self.empty = False
+
+    def update(self, dt):
+        if self.empty:
+            return
+        self.time += dt
+        while self.time >= (self.steps + 1) * self.fade_interval:
+            self.steps += 1
+            factor = round(255 * self.factor)
+            self.surface.fill((255, 255, 255, factor), special_flags=pygame.BLEND_RGBA_MULT)
+        self._expire()
+
+    def _expire(self):
+        """Efface les splashs arrivés à échéance, du plus ancien au plus récent."""
+        expired = []
+        while self.live and self.live[0][0] <= self.time:
+            expired.append(self.live.popleft()[3])
+        if not expired:
+            return
+        if not self.live:
+            self.clear()
+            return
+        area = expired[0].unionall(expired[1:])
+        self.surface.fill((0, 0, 0, 0), area)
+        # Redessine les splashs vivants qui recouvraient la zone effacée
+        self.surface.set_clip(area)
+        for _, steps, image, rect in self.live:
+            if rect.colliderect(area):
+                image.set_alpha(round(255 * self.factor ** (self.steps - steps)))
+                self.surface.blit(image, rect)
+                image.set_alpha(255)
+        self.surface.set_clip(None)
+
+    def clear(self):
+        self.surface.fill((0, 0, 0, 0))
+        self.live.clear()
+        self.time = 0
+        self.steps = 0
+        self.empty = True
+
+    def render(self, surface):
+        """Un seul blit pour tous les splashs vivants."""
+        if not self.empty:
+            surface.blit(self.surface, (0, 0))
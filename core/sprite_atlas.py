@@ -0,0 +1,134 @@
+"""
+Atlas de sprites 2D et rendu groupé de quads texturés en un seul draw.
+"""
+import ctypes
+import numpy
+import pygame
+from OpenGL.GL import *
+from core.gl_renderer import StreamingTexture
+
+# Un sommet : position (2), coordonnées de texture (2), couleur RGBA (4)
+VERTEX_FLOATS = 8
+VERTEX_STRIDE = VERTEX_FLOATS * 4
+
+
+class SpriteAtlas:
+    """Regroupe des images nommées dans une seule surface (rangement par étagères).
+
+    Les images sont triées par hauteur puis posées de gauche à droite ; une
+    nouvelle étagère commence quand la ligne est pleine. Un pixel de marge
+    sépare les images pour éviter les fuites de filtrage.
+    """
+
+    def __init__(self, images, width=1024, padding=1):
+        self.regions = {}   # nom -> Rect dans la surface de l'atlas
+        placements = []
+        x = y = shelf_height = 0
+
+        for name, image in sorted(images.items(), key=lambda item: -item[1].get_height()):
+            w, h = image.get_size()
+            if x + w > width:
+                x = 0
+                y += shelf_height + padding
+                shelf_height = 0
+            placements.append((name, image, pygame.Rect(x, y, w, h)))
+            x += w + padding
+            shelf_height = max(shelf_height, h)
+
+        self.surface = pygame.Surface((width, max(1, y + shelf_height)), pygame.SRCALPHA)
+        for name, image, rect in placements:
+            self.surface.blit(image, rect)
+            self.regions[name] = rect
+
+        # Coordonnées de texture (u0, v0, u1, v1), ligne 0 de la texture en haut
+        atlas_w, atlas_h = self.surface.get_size()
+        self.uvs = {
+            name: (rect.left / atlas_w, rect.top / atlas_h, rect.right / atlas_w, rect.bottom / atlas_h)
+            for name, rect in self.regions.items()
+        }
+
+    def __contains__(self, name):
+        return name in self.regions
+
+
+class SpriteBatch:
+    """Accumule des quads de l'atlas et les dessine en un seul glDrawArrays.
+
+    Chaque quad porte sa propre teinte RGBA : la texture est multipliée par
+    la couleur du sommet, comme un BLEND_RGBA_MULT logiciel.
+    """
+
+    def __init__(self, renderer, atlas):
+        self.state = renderer.state
+        self.atlas = atlas
+        self.texture = StreamingTexture(self.state, use_pbo=False)
+        self.texture.upload(atlas.surface)
+        self.quads = []
+        self.blocks = []    # Tableaux (N, 4, VERTEX_FLOATS) ajoutés par add_many
+
+    def add(self, name, rect, color=(255, 255, 255), alpha=255):
+        """Ajoute le sprite name étiré sur rect (Rect ou (x, y, w, h) écran)."""
+        u0, v0, u1, v1 = self.atlas.uvs[name]
+        x, y, w, h = rect
+        r, g, b = color[0] / 255.0, color[1] / 255.0, color[2] / 255.0
+        a = alpha / 255.0
+        self.quads.append((
+            x, y, u0, v0, r, g, b, a,
+            x + w, y, u1, v0, r, g, b, a,
+            x + w, y + h, u1, v1, r, g, b, a,
+            x, y + h, u0, v1, r, g, b, a,
+        ))
+
+    def add_many(self, name, centers, sizes, colors, alphas):
+        """Ajoute N sprites carrés centrés, en une opération vectorisée.
+
+        centers (N, 2), sizes (N,) en pixels, colors (N, 3) et alphas (N,) en 0-255.
+        """
+        count = len(centers)
+        if count == 0:
+            return
+        u0, v0, u1, v1 = self.atlas.uvs[name]
+        half = (numpy.asarray(sizes, dtype=numpy.float32) * 0.5)[:, None]
+        centers = numpy.asarray(centers, dtype=numpy.float32)
+
+        corners = ((-1, -1, u0, v0), (1, -1, u1, v0), (1, 1, u1, v1), (-1, 1, u0, v1))
+
+        block = numpy.empty((count, 4, VERTEX_FLOATS), dtype=numpy.float32)
+        block[:, :, 4:7] = (numpy.asarray(colors, dtype=numpy.float32) / 255.0)[:, None]
+        block[:, :, 7] = (numpy.asarray(alphas, dtype=numpy.float32) / 255.0)[:, None]
+        for corner, (sx, sy, u, v) in enumerate(corners):
+            block[:, corner, 0:2] = centers + half * (sx, sy)
+            block[:, corner, 2:4] = (u, v)
+        self.blocks.append(block)
+
+    def flush(self):
+        """Dessine les quads accumulés (mode 2D) puis vide le lot."""
+        if not self.quads and not self.blocks:
+            return
+        parts = self.blocks
+        if self.quads:
+            parts = [numpy.array(self.quads, dtype=numpy.float32).reshape(-1, 4, VERTEX_FLOATS)] + parts
+        vertices = numpy.concatenate(parts) if len(parts) > 1 else parts[0]
+        self.quads = []
+        self.blocks = []
+
+        self.state.use_program(0)
+        self.state.bind_texture(self.texture.texture_id)
+        self.state.enable(GL_TEXTURE_2D, GL_BLEND)
+        self.state.set_blend_func(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        # Tableaux entrelacés côté client : pointeurs décalés dans le même buffer
+        base = vertices.ctypes.data
+        glVertexPointer(2, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(base))
+        glTexCoordPointer(2, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(base + 8))
+        glColorPointer(4, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(base + 16))
+        glDrawArrays(GL_QUADS, 0, len(vertices) * 4)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    def release(self):
+        self.texture.release()
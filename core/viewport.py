@@ -0,0 +1,44 @@
+"""
+Correspondance entre l'espace logique du jeu (SCREEN_WIDTH x SCREEN_HEIGHT)
+et la résolution de sortie de la fenêtre.
+"""
+import pygame
+
+
+def fit_rect(size, output_size):
+    """Plus grand rectangle au ratio de size centré dans output_size (bandes noires)."""
+    width, height = size
+    output_width, output_height = output_size
+    scale = min(output_width / width, output_height / height)
+    fitted = pygame.Rect(0, 0, round(width * scale), round(height * scale))
+    fitted.center = (output_width // 2, output_height // 2)
+    return fitted
+
+
+class Viewport:
+    """Zone de la fenêtre où l'image logique est affichée.
+
+    Les scènes travaillent toujours en coordonnées logiques ; seule la
+    présentation finale est mise à l'échelle. window_size est la taille
+    de la fenêtre en points (coordonnées de la souris), output_size celle
+    du framebuffer en pixels (différente sur un écran haute densité).
+    """
+
+    def __init__(self, logical_size, output_size, window_size=None):
+        self.logical_size = tuple(logical_size)
+        self.output_size = tuple(output_size)
+        self.window_size = tuple(window_size or output_size)
+        self.rect = fit_rect(self.logical_size, self.output_size)          # Pixels de sortie
+        self.window_rect = fit_rect(self.logical_size, self.window_size)   # Points de la fenêtre
+
+    @property
+    def identity(self):
+        """Vrai si la sortie est exactement l'espace logique (aucune mise à l'échelle)."""
+        return self.rect.size == self.logical_size and self.rect.topleft == (0, 0)
+
+    def to_logical(self, pos):
+        """Convertit une position fenêtre (souris) en coordonnées logiques."""
+        rect = self.window_rect
+        x = (pos[0] - rect.x) * self.logical_size[0] / rect.width
+        y = (pos[1] - rect.y) * self.logical_size[1] / rect.height
+        return int(x), int(y)
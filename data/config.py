@@ -3,6 +3,13 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 
+# Affichage : les scènes travaillent toujours en SCREEN_WIDTH x SCREEN_HEIGHT (espace logique),
+# l'image est mise à l'échelle dans la fenêtre (None = taille logique)
+WINDOW_SIZE = None
+FULLSCREEN = False
+# Résolution interne du rendu OpenGL, en multiple de la taille logique (0.5 pour les petites machines)
+RENDER_SCALE = 1.0
+
 # Gameplay
 STARTING_LIVES = 3
 POINTS_PER_FRUIT = 10
@@ -51,6 +58,50 @@ OPENGL_ENABLED = True
 OPENGL_FOV = 45.0
 OPENGL_NEAR = 0.1
 OPENGL_FAR = 100.0
+CAMERA_DISTANCE = 10.0
+
+# Sans OpenGL : rendu 2D par le Renderer SDL2 (textures GPU, ou renderer logiciel de SDL)
+# plutôt que par des blits pygame sur la surface d'affichage
+SDL_RENDERER_ENABLED = True
+
+# Backend des modèles 3D : 'vbo' (buffers + shader) ou 'display_list' (legacy)
+MODEL_BACKEND = 'vbo'
+
+# Niveaux de détail (backend vbo) : taille des cellules de simplification
+# (fraction de la taille du modèle) pour chaque niveau après le maillage complet
+MODEL_LOD_CELLS = (0.15, 0.3)
+# Rayon projeté (pixels rastérisés) minimal pour utiliser chaque niveau, du plus détaillé
+# au moins détaillé. La caméra est fixe : à la résolution native, le plus petit modèle
+# (moitié de piment) fait 24 px, tous restent donc au maillage complet ; les niveaux
+# simplifiés ne servent qu'avec une résolution de rendu réduite (RENDER_SCALE, fenêtre)
+MODEL_LOD_RADII = (16, 8)
+
+# Overlay 2D : au-delà de cette part de l'écran modifiée, on ré-uploade tout
+DIRTY_FULL_UPLOAD_RATIO = 0.5
+
+# Traînée de la lame (rendu GL) : points intercalés par segment (0 = pas de lissage)
+BLADE_TRAIL_SUBDIVISIONS = 4
+
+# Nombre maximal de particules vivantes (jus, pépins, étincelles)
+PARTICLE_CAPACITY = 4096
+
+# Calque des splashs (rendu logiciel) : intervalle entre deux pas de fondu (s)
+SPLASH_FADE_INTERVAL = 0.25
+
+# Calque des splashs : opacité restante d'un splash en fin de vie, juste avant son effacement
+SPLASH_FADE_RESIDUAL = 0.1
+
+# Nombre de variantes teintées des splashs gardées en cache (image x couleur)
+SPLASH_TINT_CACHE_SIZE = 64
+
+# Impostors du rendu logiciel : nombre d'angles pré-rendus par modèle,
+# inclinaison de la vue (degrés) et dossier du cache des planches
+IMPOSTOR_FRAMES = 24
+IMPOSTOR_TILT = 20.0
+IMPOSTOR_CACHE_DIR = 'cache/impostors'
+
+# Dossier du cache binaire des modèles OBJ analysés (None = toujours relire les .obj)
+MESH_CACHE_DIR = 'cache/meshes'
 
 # Éclairage
 LIGHT_POSITION = (1.0, 1.0, 1.0, 0.0)
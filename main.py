@@ -1,21 +1,47 @@
 import pygame
-from data.config import SCREEN_WIDTH, SCREEN_HEIGHT, OPENGL_ENABLED
+from data.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, OPENGL_ENABLED, SDL_RENDERER_ENABLED, WINDOW_SIZE, FULLSCREEN, RENDER_SCALE
+)
 
 def main():
     pygame.init()
     gl_renderer = None
+    sdl_renderer = None
+    screen = None
+
+    # Taille de la fenêtre : (0, 0) en plein écran = résolution du bureau
+    window_size = (0, 0) if FULLSCREEN else (WINDOW_SIZE or (SCREEN_WIDTH, SCREEN_HEIGHT))
+    display_flags = pygame.FULLSCREEN if FULLSCREEN else 0
 
     if OPENGL_ENABLED:
         try:
             from core.gl_renderer import init_opengl_display, GLRenderer
-            screen = init_opengl_display(SCREEN_WIDTH, SCREEN_HEIGHT)
-            gl_renderer = GLRenderer(SCREEN_WIDTH, SCREEN_HEIGHT)
+            screen = init_opengl_display(*window_size, fullscreen=FULLSCREEN)
+            gl_renderer = GLRenderer(SCREEN_WIDTH, SCREEN_HEIGHT, render_scale=RENDER_SCALE)
             pygame.display.set_caption("Fruit Ninja 3D")
         except Exception as e:
             print(f"OpenGL fail: {e}")
-            screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    else:
-        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            # Ferme la fenêtre OpenGL éventuellement ouverte avant de changer de backend
+            pygame.display.quit()
+            pygame.display.init()
+
+    # Sans OpenGL : rendu 2D par le Renderer SDL2, sinon logiciel pur
+    if gl_renderer is None and SDL_RENDERER_ENABLED:
+        try:
+            from core.sdl_renderer import init_sdl_window, SDLRenderer
+            window = init_sdl_window(*window_size, fullscreen=FULLSCREEN)
+            sdl_renderer = SDLRenderer(window, SCREEN_WIDTH, SCREEN_HEIGHT, render_scale=RENDER_SCALE)
+        except Exception as e:
+            print(f"SDL renderer fail: {e}")
+            sdl_renderer = None
+
+    if gl_renderer is None and sdl_renderer is None:
+        screen = pygame.display.set_mode(window_size, display_flags)
+    renderer = gl_renderer or sdl_renderer
+
+    # Sons décodés une seule fois, en parallèle, avant la création des scènes
+    from core.sounds import sounds, GAME_SOUNDS
+    sounds.preload(GAME_SOUNDS)
 
     from core.scene_manager import SceneManager
     # Importations des scènes
@@ -31,7 +57,29 @@ def main():
     except ModuleNotFoundError:
         from keyboard_mode_view import NormalGameScene as KeyboardGameScene
 
-    manager = SceneManager(screen, gl_renderer=gl_renderer)
+    # Atlas des sprites 2D (splashs, HUD) et des glyphes pour le rendu GL groupé
+    sprites = None
+    text = None
+    if renderer:
+        try:
+            from ui.sprites import build_game_atlas
+            from ui.text import TextBatch
+            if gl_renderer is None:
+                # Sans 3D, les fruits sont des impostors : leurs images rejoignent l'atlas
+                from core.fruit import Fruit
+                from core.bomb import Bomb
+                Fruit.load_impostors()
+                Bomb.load_impostors()
+            sprites = renderer.sprite_batch(build_game_atlas())
+            text = TextBatch(renderer)
+        except Exception as e:
+            print(f"Warning: sprite atlas unavailable: {e}")
+
+    from core.viewport import Viewport
+    viewport = renderer.viewport if renderer else \
+        Viewport((SCREEN_WIDTH, SCREEN_HEIGHT), screen.get_size(), pygame.display.get_window_size())
+    manager = SceneManager(screen, gl_renderer=gl_renderer, sprites=sprites, text=text, viewport=viewport,
+                           renderer=renderer)
 
     # Enregistrement des scènes dans le manager
     manager.add_scene('menu', MenuScene(manager))
@@ -54,8 +102,13 @@ def main():
     # Lancement de la boucle de jeu
     manager.run()
 
-    if gl_renderer:
-        gl_renderer.cleanup()
+    manager.cleanup()
+    if text:
+        text.release()
+    if sprites:
+        sprites.release()
+    if renderer:
+        renderer.cleanup()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 import pygame
 from core.scene_manager import Scene
+from core.images import images
+from core.sounds import sounds, GAME_START_SOUND
 from ui.menu import Button
+from data.config import SCREEN_WIDTH, SCREEN_HEIGHT
 
 
 class MenuScene(Scene):
@@ -8,18 +11,14 @@ class MenuScene(Scene):
         super().__init__(manager)
 
         # Background
-        self.background = pygame.image.load("asset/Background/Menu Background.png")
-        self.background = pygame.transform.scale(self.background, (800, 600))
+        self.background = images.load("asset/Background/Menu Background.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
 
         # Son de démarrage
-        try:
-            self.start_sound = pygame.mixer.Sound("asset/Sound Menu/Game-start.wav")
-        except:
-            self.start_sound = None
+        self.start_sound = sounds.get(GAME_START_SOUND)
 
         # Boutons centrés
         btn_width, btn_height = 200, 60
-        center_x = 800 // 2 - btn_width // 2
+        center_x = SCREEN_WIDTH // 2 - btn_width // 2
 
         self.buttons = {
             'easy': Button(center_x, 220, btn_width, btn_height, "Facile", (50, 150, 50), (70, 200, 70)),
@@ -55,7 +54,7 @@ class MenuScene(Scene):
                 self.manager.quit()
 
     def update(self, dt):
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.manager.mouse_pos()
         for button in self.buttons.values():
             button.update(mouse_pos)
 
@@ -64,7 +63,7 @@ class MenuScene(Scene):
 
     def render_overlay(self, surface):
         title = self.title_font.render("FRUIT NINJA", True, (255, 100, 50))
-        title_rect = title.get_rect(center=(400, 100))
+        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100))
         surface.blit(title, title_rect)
 
         for button in self.buttons.values():
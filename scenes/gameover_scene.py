@@ -2,7 +2,11 @@ import pygame
 import json
 import os
 from core.scene_manager import Scene
+from core.images import images
+from core.sounds import sounds, GAME_OVER_SOUND
 from ui.menu import Button
+from ui.text import draw_text, get_font
+from data.config import SCREEN_WIDTH, SCREEN_HEIGHT
 
 # Chemin vers le fichier de scores
 HIGHSCORE_PATH = "data/highscores.json"
@@ -12,14 +16,10 @@ class GameOverScene(Scene):
         super().__init__(manager)
 
         # Background
-        self.background = pygame.image.load("asset/Background/Menu Background.png")
-        self.background = pygame.transform.scale(self.background, (800, 600))
+        self.background = images.load("asset/Background/Menu Background.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
 
         # Son game over
-        try:
-            self.gameover_sound = pygame.mixer.Sound("asset/Sound Menu/Game-over.wav")
-        except:
-            self.gameover_sound = None
+        self.gameover_sound = sounds.get(GAME_OVER_SOUND)
 
         self.sound_played = False
         self.highscore_processed = False
@@ -30,7 +30,7 @@ class GameOverScene(Scene):
         self.current_mode = "normal"  # Valeur de secours
 
         btn_width, btn_height = 200, 60
-        center_x = 800 // 2 - btn_width // 2
+        center_x = SCREEN_WIDTH // 2 - btn_width // 2
 
         self.buttons = {
             'replay': Button(center_x, 350, btn_width, btn_height, "Rejouer", (50, 150, 50), (70, 200, 70)),
@@ -38,10 +38,10 @@ class GameOverScene(Scene):
             'quit': Button(center_x, 510, btn_width, btn_height, "Quitter", (150, 50, 50), (200, 70, 70))
         }
 
-        self.title_font = pygame.font.Font(None, 70)
-        self.score_font = pygame.font.Font(None, 50)
-        self.high_font = pygame.font.Font(None, 35)
-        self.input_font = pygame.font.Font(None, 60)
+        self.title_font = get_font(None, 70)
+        self.score_font = get_font(None, 50)
+        self.high_font = get_font(None, 35)
+        self.input_font = get_font(None, 60)
 
     def on_enter(self):
         # Récupérer les infos envoyées par la scène de jeu
@@ -150,45 +150,50 @@ class GameOverScene(Scene):
 
     def update(self, dt):
         if not self.is_typing:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = self.manager.mouse_pos()
             for button in self.buttons.values():
                 button.update(mouse_pos)
 
-    def render_background(self, surface):
-        surface.blit(self.background, (0, 0))
+    def get_background(self):
+        return self.background
 
     def render_overlay(self, surface):
         # Titre et Score
         title_color = (255, 50, 50)
-        title = self.title_font.render("GAME OVER", True, title_color)
-        surface.blit(title, title.get_rect(center=(400, 80)))
+        draw_text(surface, self.title_font, "GAME OVER", title_color, self.manager.text, center=(SCREEN_WIDTH // 2, 80))
 
         score = self.manager.shared_data.get('score', 0)
-        score_txt = self.score_font.render(f"Score ({self.current_mode.upper()}): {score}", True, (255, 255, 255))
-        surface.blit(score_txt, score_txt.get_rect(center=(400, 170)))
+        draw_text(surface, self.score_font, f"Score ({self.current_mode.upper()}): {score}", (255, 255, 255),
+                  self.manager.text, center=(SCREEN_WIDTH // 2, 170))
 
-        if self.is_typing:
-            # Filtre sombre pour la saisie
-            overlay = pygame.Surface((800, 600), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 230))
-            
-            prompt_txt = f"NOUVEAU RECORD {self.current_mode.upper()} ! NOM :"
-            prompt = self.high_font.render(prompt_txt, True, (255, 215, 0))
-            
-            # Curseur clignotant
-            cursor = "_" if (pygame.time.get_ticks() // 500) % 2 == 0 else ""
-            name_surf = self.input_font.render(self.player_name + cursor, True, (255, 255, 255))
-            info = self.high_font.render("Appuyez sur Entrée pour valider", True, (150, 150, 150))
-            
-            overlay.blit(prompt, prompt.get_rect(center=(400, 250)))
-            overlay.blit(name_surf, name_surf.get_rect(center=(400, 320)))
-            overlay.blit(info, info.get_rect(center=(400, 380)))
-            surface.blit(overlay, (0, 0))
-        else:
+        if not self.is_typing:
             # Affichage des boutons si on ne tape pas de nom
             for button in self.buttons.values():
-                button.render(surface)
+                button.render(surface, self.manager.text)
+
+    def cursor_visible(self):
+        """Curseur de saisie clignotant (500 ms)."""
+        return (pygame.time.get_ticks() // 500) % 2 == 0
 
-    def render(self, surface):
-        self.render_background(surface)
-        self.render_overlay(surface)
\ No newline at end of file
+    def get_frame_key(self):
+        # L'image ne change qu'avec le survol des boutons, la saisie et le curseur
+        if self.is_typing:
+            return (True, self.player_name, self.cursor_visible())
+        return (False,) + tuple(button.is_hovered for button in self.buttons.values())
+
+    def get_dim(self):
+        # Filtre sombre pour la saisie
+        if self.is_typing:
+            return (0, 0, 0, 230)
+        return None
+
+    def render_modal(self, surface):
+        prompt_txt = f"NOUVEAU RECORD {self.current_mode.upper()} ! NOM :"
+        draw_text(surface, self.high_font, prompt_txt, (255, 215, 0), self.manager.text, center=(SCREEN_WIDTH // 2, 250))
+
+        # Curseur clignotant
+        cursor = "_" if self.cursor_visible() else ""
+        draw_text(surface, self.input_font, self.player_name + cursor, (255, 255, 255), self.manager.text,
+                  center=(SCREEN_WIDTH // 2, 320))
+        draw_text(surface, self.high_font, "Appuyez sur Entrée pour valider", (150, 150, 150), self.manager.text,
+                  center=(SCREEN_WIDTH // 2, 380))
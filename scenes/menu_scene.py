@@ -2,23 +2,26 @@ import pygame
 import json
 import os
 from core.scene_manager import Scene
+from core.images import images
+from core.sounds import sounds, GAME_START_SOUND
 from ui.menu import Button
+from ui.text import draw_text, get_font
+from data.config import SCREEN_WIDTH, SCREEN_HEIGHT
 
 class MenuScene(Scene):
     def __init__(self, manager):
         super().__init__(manager)
 
         # Background
-        self.background = pygame.image.load("asset/Background/Menu Background.png")
-        self.background = pygame.transform.scale(self.background, (800, 600))
+        self.background = images.load("asset/Background/Menu Background.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
         
         # Logo (Taille diminuée à 300px)
         try:
-            self.logo = pygame.image.load("asset/Background/logo.png")
-            logo_w, logo_h = self.logo.get_size()
+            logo_w, logo_h = images.source("asset/Background/logo.png").get_size()
             target_width = 300
             ratio = target_width / logo_w
-            self.logo = pygame.transform.smoothscale(self.logo, (target_width, int(logo_h * ratio)))
+            self.logo = images.load("asset/Background/logo.png", (target_width, int(logo_h * ratio)),
+                                    alpha=True, smooth=True)
         except:
             self.logo = None
 
@@ -31,14 +34,11 @@ class MenuScene(Scene):
         except Exception as e:
             print(f"Erreur chargement OST: {e}")
 
-        try:
-            self.start_sound = pygame.mixer.Sound("asset/Sound Menu/Game-start.wav")
-        except:
-            self.start_sound = None
+        self.start_sound = sounds.get(GAME_START_SOUND)
 
         # Boutons centrés (Descendus un peu)
         btn_width, btn_height = 200, 60
-        center_x = 800 // 2 - btn_width // 2
+        center_x = SCREEN_WIDTH // 2 - btn_width // 2
 
         self.buttons = {
             'easy': Button(center_x, 260, btn_width, btn_height, "Facile", (50, 150, 50), (70, 200, 70)),
@@ -48,10 +48,10 @@ class MenuScene(Scene):
         }
 
         # Bouton Clavier en bas à gauche
-        self.keyboard_button = Button(20, 530, 130, 50, "Clavier", (70, 70, 180), (100, 100, 255))
+        self.keyboard_button = Button(20, SCREEN_HEIGHT - 70, 130, 50, "Clavier", (70, 70, 180), (100, 100, 255))
         
         # Bouton Score en bas à droite
-        self.score_button = Button(650, 530, 130, 50, "Scores", (100, 100, 100), (150, 150, 150))
+        self.score_button = Button(SCREEN_WIDTH - 150, SCREEN_HEIGHT - 70, 130, 50, "Scores", (100, 100, 100), (150, 150, 150))
         
         # État du tableau des scores
         self.show_scores = False
@@ -59,11 +59,11 @@ class MenuScene(Scene):
         self.json_path = "data/highscores.json"
 
         # Fonts
-        self.title_font = pygame.font.Font(None, 80)
-        self.score_title_font = pygame.font.SysFont("Arial", 40, bold=True)
-        self.score_text_font = pygame.font.SysFont("Arial", 18, bold=False)
-        self.category_font = pygame.font.SysFont("Arial", 22, bold=True)
-        self.high_score_font = pygame.font.SysFont("Arial", 25, bold=True)
+        self.title_font = get_font(None, 80)
+        self.score_title_font = get_font("Arial", 40, bold=True)
+        self.score_text_font = get_font("Arial", 18, bold=False)
+        self.category_font = get_font("Arial", 22, bold=True)
+        self.high_score_font = get_font("Arial", 25, bold=True)
 
     def load_scores(self):
         """Charge les scores depuis le fichier JSON et les trie par score décroissant."""
@@ -117,28 +117,24 @@ class MenuScene(Scene):
                 self.manager.quit()
 
     def update(self, dt):
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.manager.mouse_pos()
         if not self.show_scores:
             for button in self.buttons.values():
                 button.update(mouse_pos)
             self.score_button.update(mouse_pos)
             self.keyboard_button.update(mouse_pos)
 
-    def render_background(self, surface):
-        surface.blit(self.background, (0, 0))
+    def get_background(self):
+        return self.background
 
     def render_scores_overlay(self, surface):
         """Affiche le tableau des scores avec rectangles en colonnes."""
-        overlay = pygame.Surface((800, 600), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 225))
-        surface.blit(overlay, (0, 0))
-
-        title_surf = self.score_title_font.render("TABLEAU DES SCORES", True, (255, 255, 255))
-        surface.blit(title_surf, (400 - title_surf.get_width() // 2, 40))
+        text = self.manager.text
+        draw_text(surface, self.score_title_font, "TABLEAU DES SCORES", (255, 255, 255), text, midtop=(SCREEN_WIDTH // 2, 40))
 
         categories = [("easy", "FACILE"), ("normal", "NORMAL"), ("hard", "DIFFICILE"), ("clavier", "CLAVIER")]
         panel_margin = 30
-        panel_area_w = 800 - (panel_margin * 2)
+        panel_area_w = SCREEN_WIDTH - (panel_margin * 2)
         col_width = (panel_area_w // 4) - 15
         y_top = 110
         rect_height = 400
@@ -149,8 +145,8 @@ class MenuScene(Scene):
             pygame.draw.rect(surface, (40, 40, 40), rect, border_radius=8)
             pygame.draw.rect(surface, (255, 255, 255), rect, 1, border_radius=8)
 
-            cat_surf = self.category_font.render(display_name, True, (255, 235, 59))
-            surface.blit(cat_surf, (x + col_width//2 - cat_surf.get_width()//2, y_top + 12))
+            draw_text(surface, self.category_font, display_name, (255, 235, 59), text,
+                      midtop=(x + col_width//2, y_top + 12))
             
             pygame.draw.line(surface, (200, 200, 200), (x + 10, y_top + 45), (x + col_width - 10, y_top + 45), 1)
 
@@ -162,32 +158,36 @@ class MenuScene(Scene):
                     name = str(entry.get("name", "---"))
                     score = str(entry.get("score", "0"))
                     if len(name) > 8: name = name[:7] + "."
-                    n_txt = self.score_text_font.render(name, True, (255, 255, 255))
-                    s_txt = self.score_text_font.render(score, True, (0, 255, 150))
-                    surface.blit(n_txt, (x + 10, entry_y))
-                    surface.blit(s_txt, (x + col_width - s_txt.get_width() - 10, entry_y))
+                    draw_text(surface, self.score_text_font, name, (255, 255, 255), text, topleft=(x + 10, entry_y))
+                    draw_text(surface, self.score_text_font, score, (0, 255, 150), text,
+                              topright=(x + col_width - 10, entry_y))
                     entry_y += 26
             else:
-                val_surf = self.score_text_font.render(str(entries), True, (255, 255, 255))
-                surface.blit(val_surf, (x + col_width//2 - val_surf.get_width()//2, entry_y))
+                draw_text(surface, self.score_text_font, str(entries), (255, 255, 255), text,
+                          midtop=(x + col_width//2, entry_y))
 
-        close_surf = self.score_text_font.render("Cliquez pour fermer", True, (150, 150, 150))
-        surface.blit(close_surf, (400 - close_surf.get_width() // 2, 545))
+        draw_text(surface, self.score_text_font, "Cliquez pour fermer", (150, 150, 150), text, midtop=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 55))
 
     def render_overlay(self, surface):
         # Rendu du logo (taille réduite)
         if self.logo:
-            logo_rect = self.logo.get_rect(center=(400, 130))
+            logo_rect = self.logo.get_rect(center=(SCREEN_WIDTH // 2, 130))
             surface.blit(self.logo, logo_rect)
 
         for button in self.buttons.values():
-            button.render(surface)
-        self.score_button.render(surface)
-        self.keyboard_button.render(surface)
+            button.render(surface, self.manager.text)
+        self.score_button.render(surface, self.manager.text)
+        self.keyboard_button.render(surface, self.manager.text)
+
+    def get_frame_key(self):
+        # L'image ne change qu'avec le survol des boutons ou le tableau des scores
+        buttons = [*self.buttons.values(), self.score_button, self.keyboard_button]
+        return (self.show_scores,) + tuple(button.is_hovered for button in buttons)
 
+    def get_dim(self):
         if self.show_scores:
-            self.render_scores_overlay(surface)
+            return (0, 0, 0, 225)
+        return None
 
-    def render(self, surface):
-        self.render_background(surface)
-        self.render_overlay(surface)
\ No newline at end of file
+    def render_modal(self, surface):
+        self.render_scores_overlay(surface)
@@ -2,63 +2,42 @@ import pygame
 import random
 import time
 from core.scene_manager import Scene
+from core.images import images
 from core.fruit import Fruit
 from core.bomb import Bomb
 from core.objet3D import Fruit3D, Bomb3D, SPLASH_COLORS
-from core.splash import Splash
+from core.splash import Splash, SplashLayer
+from core.particles import ParticleSystem
 from core.blade import Blade
 from core.combo import ComboSystem
-from core.model_cache import ModelCache
+from core.sounds import sounds, THROW_FRUIT_SOUND, THROW_BOMB_SOUND, BOMB_EXPLODE_SOUND, IMPACT_SOUNDS
+from core.model_cache import shared_models
 from data.scores import Score
-from ui.hud import render_hud
+from ui.hud import HUD, draw_pause_button
+from ui.text import draw_text, get_font
 from data.config import (
     SCREEN_HEIGHT, SCREEN_WIDTH, STARTING_LIVES, BOMB_CHANCE, POINTS_PER_FRUIT,
-    get_spawn_interval, OPENGL_ENABLED, FRUIT_MODELS, FRUIT_MODELS_CUT, FRUIT_MODELS_CUT2,
-    FRUIT_SCALES, TEXTURE_ATLAS_PATH, BOMB_MODEL, NORMAL_SPEED
+    get_spawn_interval, OPENGL_ENABLED, NORMAL_SPEED
 )
 
 
 class NormalGameScene(Scene):
+    tracks_dirty_rects = True
+
     def __init__(self, manager):
         super().__init__(manager)
 
         # Background
-        self.background = pygame.image.load("asset/Background/Game Background.png")
-        self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.background = images.load("asset/Background/Game Background.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
 
         # Musique de fond (Normal Mode)
         self.ost_path = "asset/Sound Menu/normal_background_ost.ogg"
 
-        # Sons
-        try:
-            self.throw_fruit_sound = pygame.mixer.Sound("asset/Sound object/Throw-fruit.wav")
-        except:
-            self.throw_fruit_sound = None
-        try:
-            self.throw_bomb_sound = pygame.mixer.Sound("asset/Sound object/Throw-bomb.wav")
-        except:
-            self.throw_bomb_sound = None
-        try:
-            self.bomb_explode_sound = pygame.mixer.Sound("asset/Sound object/Bomb-explode.wav")
-        except:
-            self.bomb_explode_sound = None
-
-        # Sons d'impact par type de fruit
-        self.impact_sounds = {}
-        impact_files = {
-            'apple': 'asset/Impact/Impact-Apple.wav',
-            'orange': 'asset/Impact/Impact-Orange.wav',
-            'watermelon': 'asset/Impact/Impact-Watermelon.wav',
-            'banana': 'asset/Impact/Impact-Banana-Chili.wav', 
-            'chili': 'asset/Impact/Impact-Banana-Chili.wav',  
-            'coconut': 'asset/Impact/Impact-Coconut.wav',
-            'ice': 'asset/Impact/Impact-Ice.mp3',
-        }
-        for fruit_type, path in impact_files.items():
-            try:
-                self.impact_sounds[fruit_type] = pygame.mixer.Sound(path)
-            except:
-                self.impact_sounds[fruit_type] = None
+        # Sons (partagés entre les scènes)
+        self.throw_fruit_sound = sounds.get(THROW_FRUIT_SOUND)
+        self.throw_bomb_sound = sounds.get(THROW_BOMB_SOUND)
+        self.bomb_explode_sound = sounds.get(BOMB_EXPLODE_SOUND)
+        self.impact_sounds = sounds.get_dict(IMPACT_SOUNDS)
 
         self.model_cache = None
         self.use_3d = OPENGL_ENABLED and manager.gl_renderer is not None
@@ -70,25 +49,27 @@ class NormalGameScene(Scene):
         self.game_time = 0
         self.freeze_timer = 0
         self.frenzy_timer = 0
-        self.pause_font = pygame.font.SysFont("Arial", 80, bold=True)
-        self.button_font = pygame.font.SysFont("Arial", 40)
+        self.pause_font = get_font("Arial", 80, bold=True)
+        self.button_font = get_font("Arial", 40)
         self.pause_button_rect = pygame.Rect(SCREEN_WIDTH - 60, 20, 40, 40)
+        self.particles = ParticleSystem()
+        self.splash_layer = SplashLayer((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.hud = HUD()
+        Splash.prewarm(SPLASH_COLORS.values())
+        if not self.use_3d:
+            Fruit.load_impostors()
+            Bomb.load_impostors()
         
         self.reset()
 
     def _init_model_cache(self):
-        self.model_cache = ModelCache()
-        self.model_cache.load_texture(TEXTURE_ATLAS_PATH)
-        for fruit_type, model_path in FRUIT_MODELS.items():
-            scale = FRUIT_SCALES.get(fruit_type, 1.0)
-            self.model_cache.load_model(fruit_type.capitalize(), model_path, custom_scale=scale)
-        for fruit_type, model_path in FRUIT_MODELS_CUT.items():
-            scale = FRUIT_SCALES.get(fruit_type, 1.0)
-            self.model_cache.load_model(f"{fruit_type.capitalize()}-C", model_path, custom_scale=scale)
-        for fruit_type, model_path in FRUIT_MODELS_CUT2.items():
-            scale = FRUIT_SCALES.get(fruit_type, 1.0)
-            self.model_cache.load_model(f"{fruit_type.capitalize()}-C2", model_path, custom_scale=scale)
-        self.model_cache.load_model('Bomb', BOMB_MODEL, custom_scale=1.0)
+        # Modèles partagés entre les modes : chargés une seule fois
+        self.model_cache, self.batch_renderer = shared_models.acquire(self.manager.gl_renderer)
+
+    def cleanup(self):
+        if self.model_cache is not None:
+            shared_models.release()
+            self.model_cache = None
 
     def reset(self):
         self.score = Score()
@@ -97,7 +78,10 @@ class NormalGameScene(Scene):
         self.cut_halves = []
         self.bombs = []
         self.splashes = []
+        self.particles.clear()
+        self.splash_layer.clear()
         self.blade = Blade()
+        self.hud.clear()
         self.combo_system = ComboSystem()
         self.spawn_timer = 0
         self.explosion_delay = 0
@@ -190,7 +174,7 @@ class NormalGameScene(Scene):
             time_mult = 1.1
 
         self.game_time += dt
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.manager.mouse_pos()
         self.blade.update(mouse_pos)
         if self.blade.is_moving:
             self.check_cuts()
@@ -221,31 +205,48 @@ class NormalGameScene(Scene):
         for bomb in self.bombs[:]:
             bomb.update(effective_dt)
             if bomb.is_off_screen(SCREEN_HEIGHT): self.bombs.remove(bomb)
+        self.particles.update(effective_dt)
+        self.splash_layer.update(dt)
         for splash in self.splashes[:]:
             splash.update(dt)
             if splash.is_done: self.splashes.remove(splash)
 
-    def render_background(self, surface):
-        surface.blit(self.background, (0, 0))
+    def get_background(self):
+        return self.background
+
+    def has_decals(self):
+        return bool(self.splashes) or not self.splash_layer.empty
+
+    def render_decals(self, surface):
+        self.splash_layer.render(surface)
         for splash in self.splashes: splash.render(surface)
 
-    def render_overlay(self, surface):
+    def render_decal_sprites(self, sprites):
+        for splash in self.splashes: splash.render_sprite(sprites)
+        return True
+
+    def get_tint(self):
         # Overlay effet ice (bleu) ou chili (rouge) avec fade
         if self.freeze_timer > 0:
-            opacity = int((self.freeze_timer / 5.0) * 60)
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 100, 255, opacity))
-            surface.blit(overlay, (0, 0))
+            return (0, 100, 255, int((self.freeze_timer / 5.0) * 60))
         elif self.frenzy_timer > 0:
-            opacity = int((self.frenzy_timer / 5.0) * 60)
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((255, 50, 0, opacity))
-            surface.blit(overlay, (0, 0))
+            return (255, 50, 0, int((self.frenzy_timer / 5.0) * 60))
+        return None
+
+    def render_gl(self, renderer):
+        self.blade.render_gl(renderer)
 
+    def render_overlay(self, surface):
         if not self.use_3d:
-            for fruit in self.fruits: fruit.render(surface)
-            for bomb in self.bombs: bomb.render(surface)
-        self.blade.render(surface)
+            # Impostors en sprites si l'atlas les contient, sinon blittés sur l'overlay
+            sprites = self.manager.sprites
+            for obj in self.fruits + self.bombs:
+                if sprites is None or not obj.render_sprite(sprites):
+                    self.mark_dirty(obj.render(surface))
+        if self.manager.sprites is not None: self.particles.render_sprites(self.manager.sprites)
+        else: self.mark_dirty(self.particles.render(surface))
+        if self.manager.gl_renderer is None:
+            self.mark_dirty(self.blade.render(surface))
         mins, secs = int(self.game_time // 60), int(self.game_time % 60)
         timer_text = f"{mins:02d}:{secs:02d}"
         
@@ -253,42 +254,44 @@ class NormalGameScene(Scene):
         if self.freeze_timer > 0: status_text = "FREEZE !"
         if self.frenzy_timer > 0: status_text = "FRENZY !"
 
-        render_hud(surface, self.score.current, self.lives, status_text, self.combo_system.get_progress(), timer_text)
+        self.hud.render(surface, self.score.current, self.lives, status_text, self.combo_system.get_progress(), timer_text,
+                        dirty=self.manager.overlay_dirty, sprites=self.manager.sprites,
+                        text_batch=self.manager.text)
         
         if not self.game_over:
-            pygame.draw.rect(surface, (200, 200, 200), self.pause_button_rect, border_radius=5)
-            pygame.draw.rect(surface, (50, 50, 50), (SCREEN_WIDTH - 50, 28, 5, 24))
-            pygame.draw.rect(surface, (50, 50, 50), (SCREEN_WIDTH - 38, 28, 5, 24))
+            if self.manager.sprites is not None:
+                self.manager.sprites.add('pause_button', self.pause_button_rect)
+            else:
+                self.mark_dirty(draw_pause_button(surface, self.pause_button_rect))
 
+    def get_frame_key(self):
+        # En pause rien ne bouge : l'image n'est redessinée qu'en sortant de la pause
+        return 'paused' if self.paused else None
+
+    def get_dim(self):
         if self.paused:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            surface.blit(overlay, (0, 0))
-            pause_txt = self.pause_font.render("PAUSE - NORMAL", True, (255, 255, 255))
-            surface.blit(pause_txt, (SCREEN_WIDTH // 2 - pause_txt.get_width() // 2, 150))
-            self.draw_button(surface, "Continuer", 300)
-            self.draw_button(surface, "Recommencer", 370)
-            self.draw_button(surface, "Retour", 440)
+            return (0, 0, 0, 180)
+        return None
+
+    def render_modal(self, surface):
+        draw_text(surface, self.pause_font, "PAUSE - NORMAL", (255, 255, 255), self.manager.text,
+                  midtop=(SCREEN_WIDTH // 2, 150))
+        self.draw_button(surface, "Continuer", 300)
+        self.draw_button(surface, "Recommencer", 370)
+        self.draw_button(surface, "Retour", 440)
 
     def draw_button(self, surface, text, y):
         center_x = SCREEN_WIDTH // 2
         rect = pygame.Rect(center_x - 100, y, 200, 50)
         pygame.draw.rect(surface, (255, 255, 255), rect, 2, border_radius=10)
-        txt_surf = self.button_font.render(text, True, (255, 255, 255))
-        surface.blit(txt_surf, (center_x - txt_surf.get_width() // 2, y + 5))
-
-    def render(self, surface):
-        self.render_background(surface)
-        self.render_overlay(surface)
+        draw_text(surface, self.button_font, text, (255, 255, 255), self.manager.text, midtop=(center_x, y + 5))
 
     def render_3d(self):
         if not self.use_3d or self.paused: return
-        width, height = SCREEN_WIDTH, SCREEN_HEIGHT
-        for fruit in self.fruits:
-            if not fruit.is_cut: fruit.render_3d(width, height)
-        for half in self.cut_halves: half.render_3d(width, height)
-        for bomb in self.bombs:
-            if not bomb.is_exploded: bomb.render_3d(width, height)
+        objects = [fruit for fruit in self.fruits if not fruit.is_cut]
+        objects += self.cut_halves
+        objects += [bomb for bomb in self.bombs if not bomb.is_exploded]
+        self.batch_renderer.render(objects)
 
     def spawn_objects(self):
         for _ in range(4):
@@ -324,7 +327,11 @@ class NormalGameScene(Scene):
                 self.score.add(POINTS_PER_FRUIT)
                 self.combo_system.add_hit()
                 splash_color = SPLASH_COLORS.get(fruit.fruit_type, (255, 255, 255))
-                self.splashes.append(Splash(fruit.x, fruit.y, splash_color))
+                splash = Splash(fruit.x, fruit.y, splash_color)
+                # Le lot GL dessine chaque splash ; sans lui, le splash est cuit dans le calque
+                if self.manager.sprites is not None: self.splashes.append(splash)
+                else: self.splash_layer.add(splash)
+                self.particles.emit_juice(fruit.x, fruit.y, splash_color)
                 self.blade.play_impact_sound()
                 impact_sound = self.impact_sounds.get(fruit.fruit_type)
                 if impact_sound: impact_sound.play()
@@ -332,6 +339,7 @@ class NormalGameScene(Scene):
         for bomb in self.bombs:
             if not bomb.is_exploded and self.blade.collides_with(bomb.x, bomb.y, bomb.radius):
                 bomb.explode()
+                self.particles.emit_sparks(bomb.x, bomb.y)
                 if self.bomb_explode_sound: self.bomb_explode_sound.play()
                 self.lives = 0
                 self.explosion_delay = 0.5
\ No newline at end of file
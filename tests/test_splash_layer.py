@@ -0,0 +1,84 @@
+"""
+Le calque des splashs doit s'estomper au même rythme qu'un Splash dessiné
+seul (alpha de surface), pas seulement sur ses contours.
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+from core.splash import Splash, SplashLayer, SPLASH_LIFETIME
+from data.config import SPLASH_FADE_RESIDUAL
+
+FRAME = 1 / 60
+SIZE = (200, 200)
+
+
+def visible_pixels(surface, threshold=8):
+    return int((pygame.surfarray.array_alpha(surface) > threshold).sum())
+
+
+def splash_with_image(index):
+    splash = Splash(100, 100, (255, 80, 80))
+    splash.image_index = index
+    splash.image = Splash.tinted_image(index, splash.color)
+    splash.rect = splash.image.get_rect(center=(100, 100))
+    return splash
+
+
+@pytest.mark.parametrize('index', range(len(Splash.load_images())))
+def test_layer_coverage_follows_splash_fade(index):
+    splash = splash_with_image(index)
+    layer = SplashLayer(SIZE)
+    layer.add(splash)
+
+    elapsed = 0.0
+    for mark in (1.0, 2.0, 3.0, 4.0):
+        while elapsed < mark:
+            splash.update(FRAME)
+            layer.update(FRAME)
+            elapsed += FRAME
+        reference = pygame.Surface(SIZE, pygame.SRCALPHA)
+        splash.render(reference)
+        expected = visible_pixels(reference)
+        assert 0.9 * expected <= visible_pixels(layer.surface) <= 1.3 * expected + 200, mark
+
+    while elapsed < SPLASH_LIFETIME + FRAME:
+        layer.update(FRAME)
+        elapsed += FRAME
+    assert layer.empty
+    assert visible_pixels(layer.surface, threshold=0) == 0
+
+
+def test_fast_cuts_do_not_hold_older_splashes():
+    # Coupes plus rapprochées que l'intervalle de fondu : le premier splash
+    # doit quand même s'estomper et disparaître à son échéance.
+    layer = SplashLayer((400, 200))
+    first = splash_with_image(0)
+    layer.add(first)
+    cut = 0.2
+    elapsed = 0.0
+    next_cut = cut
+    overlap = None
+    checked = False
+    while elapsed < SPLASH_LIFETIME + FRAME:
+        if elapsed >= next_cut:
+            splash = splash_with_image(0)
+            splash.rect = splash.rect.move(200, 0)
+            layer.add(splash)
+            next_cut += cut
+            if overlap is None and elapsed >= 1.0:
+                # Un splash qui chevauche le premier survit à son effacement
+                overlap = splash_with_image(0)
+                overlap.rect = overlap.rect.move(60, 0)
+                layer.add(overlap)
+        layer.update(FRAME)
+        elapsed += FRAME
+        if not checked and elapsed >= SPLASH_LIFETIME / 2:
+            checked = True
+            alpha = pygame.surfarray.array_alpha(layer.surface.subsurface((25, 25, 35, 150)))
+            assert 0 < alpha.max() <= 255 * SPLASH_FADE_RESIDUAL ** 0.5 + 16
+
+    assert checked and not layer.empty
+    assert visible_pixels(layer.surface.subsurface((25, 25, 35, 150)), threshold=0) == 0
+    assert visible_pixels(layer.surface.subsurface(overlap.rect.clip(first.rect))) > 0
@@ -1,59 +1,146 @@
 import pygame
+from ui.text import get_font
 
 
-def render_hud(screen, score, lives, combo_text="", combo_progress=0, timer_text="00:00"):
-    """Affiche le score à gauche, le timer en haut au centre, les vies à gauche et le combo."""
-    font = pygame.font.Font(None, 40)
-
-    # 1. Score en haut à gauche
-    score_text = font.render(f"Score: {score}", True, (255, 255, 255))
-    screen.blit(score_text, (20, 20))
-
-    # 2. Timer en haut au centre (Modifié pour être au centre)
-    timer_surf = font.render(timer_text, True, (255, 255, 255))
-    timer_rect = timer_surf.get_rect(center=(screen.get_width() // 2, 30))
-    screen.blit(timer_surf, timer_rect)
-
-    # 3. Vies à gauche (en dessous du score)
-    heart_size = 25
-    for i in range(lives):
-        # Position X fixe à gauche, décalée par i
-        x = 35 + (i * 35)
-        y = 70 # Remonté un peu puisque le timer n'est plus là
-        pygame.draw.polygon(screen, (255, 50, 50), [
-            (x, y),
-            (x - heart_size // 2, y - 10),
-            (x - heart_size // 2 - 5, y),
-            (x - heart_size // 2, y + 15),
-            (x, y + 25),
-            (x + heart_size // 2, y + 15),
-            (x + heart_size // 2 + 5, y),
-            (x + heart_size // 2, y - 10)
-        ])
-
-    # 4. Combo text au centre (en dessous du timer)
-    if combo_text:
-        combo_font = pygame.font.Font(None, 50)
-        combo_surface = combo_font.render(combo_text, True, (255, 200, 0))
-        combo_rect = combo_surface.get_rect(center=(screen.get_width() // 2, 80))
-        screen.blit(combo_surface, combo_rect)
-
-        # Barre de temps du combo
-        if combo_progress > 0:
-            bar_width = 150
-            bar_height = 8
-            bar_x = screen.get_width() // 2 - bar_width // 2
-            bar_y = 105
-
-            # Fond de la barre (gris)
-            pygame.draw.rect(screen, (80, 80, 80), (bar_x, bar_y, bar_width, bar_height), border_radius=4)
-
-            # Barre de progression (jaune -> rouge selon le temps restant)
-            fill_width = int(bar_width * combo_progress)
-            if fill_width > 0:
-                # Couleur qui passe de vert à rouge
-                if combo_progress > 0.5:
-                    color = (int(255 * (1 - combo_progress) * 2), 255, 0)
-                else:
-                    color = (255, int(255 * combo_progress * 2), 0)
-                pygame.draw.rect(screen, color, (bar_x, bar_y, fill_width, bar_height), border_radius=4)
\ No newline at end of file
+HEART_SIZE = 25
+
+
+def heart_points(x, y):
+    """Contour d'un coeur de vie dont la pointe haute est en (x, y)."""
+    half = HEART_SIZE // 2
+    return [
+        (x, y),
+        (x - half, y - 10),
+        (x - half - 5, y),
+        (x - half, y + 15),
+        (x, y + 25),
+        (x + half, y + 15),
+        (x + half + 5, y),
+        (x + half, y - 10)
+    ]
+
+
+def heart_rect(x, y):
+    """Zone occupée par draw_heart(surface, x, y)."""
+    half = HEART_SIZE // 2
+    return pygame.Rect(x - half - 5, y - 10, 2 * (half + 5) + 1, 36)
+
+
+def draw_heart(surface, x, y):
+    return pygame.draw.polygon(surface, (255, 50, 50), heart_points(x, y))
+
+
+def draw_pause_button(surface, rect):
+    """Bouton pause (fond gris arrondi et deux barres) dans rect."""
+    rect = pygame.Rect(rect)
+    pygame.draw.rect(surface, (200, 200, 200), rect, border_radius=5)
+    pygame.draw.rect(surface, (50, 50, 50), (rect.x + 10, rect.y + 8, 5, 24))
+    pygame.draw.rect(surface, (50, 50, 50), (rect.x + 22, rect.y + 8, 5, 24))
+    return rect
+
+
+# Pas de la barre de combo : elle n'est re-rastérisée qu'en changeant de pas
+COMBO_BAR_STEPS = 50
+COMBO_BAR_SIZE = (150, 8)
+
+# Origine de la rangée de coeurs (coin haut gauche du premier coeur)
+HEARTS_ORIGIN = heart_rect(35, 70).topleft
+HEART_SPACING = 35
+
+
+class HUD:
+    """HUD retenu : score, timer, vies, combo et barre de combo.
+
+    Chaque widget garde sa surface rendue avec la valeur qui l'a produite et
+    n'est re-rastérisé que lorsque cette valeur change. Les polices sont
+    chargées une fois à la création.
+    """
+
+    def __init__(self):
+        self.font = get_font(None, 40)
+        self.combo_font = get_font(None, 50)
+        self.widgets = {}   # nom -> (valeur, surface)
+
+    def clear(self):
+        """Oublie les surfaces rendues (nouvelle partie)."""
+        self.widgets.clear()
+
+    def _widget(self, name, value, build):
+        """Surface du widget name pour value, reconstruite seulement si value a changé."""
+        entry = self.widgets.get(name)
+        if entry is None or entry[0] != value:
+            entry = (value, build(value))
+            self.widgets[name] = entry
+        return entry[1]
+
+    def _text(self, screen, name, font, text, color, text_batch, **position):
+        if text_batch is not None:
+            text_batch.add(font, text, color, **position)
+            return None
+        rendered = self._widget(name, text, lambda value: font.render(value, True, color))
+        return screen.blit(rendered, rendered.get_rect(**position))
+
+    @staticmethod
+    def _build_hearts(lives):
+        hearts = pygame.Surface((HEART_SPACING * lives + 1, 36), pygame.SRCALPHA)
+        origin_x, origin_y = HEARTS_ORIGIN
+        for i in range(lives):
+            draw_heart(hearts, 35 + i * HEART_SPACING - origin_x, 70 - origin_y)
+        return hearts
+
+    @staticmethod
+    def _build_combo_bar(step):
+        bar = pygame.Surface(COMBO_BAR_SIZE, pygame.SRCALPHA)
+        bar_width, bar_height = COMBO_BAR_SIZE
+        progress = step / COMBO_BAR_STEPS
+
+        # Fond de la barre (gris)
+        pygame.draw.rect(bar, (80, 80, 80), (0, 0, bar_width, bar_height), border_radius=4)
+
+        # Barre de progression (jaune -> rouge selon le temps restant)
+        fill_width = int(bar_width * progress)
+        if fill_width > 0:
+            # Couleur qui passe de vert à rouge
+            if progress > 0.5:
+                color = (int(255 * (1 - progress) * 2), 255, 0)
+            else:
+                color = (255, int(255 * progress * 2), 0)
+            pygame.draw.rect(bar, color, (0, 0, fill_width, bar_height), border_radius=4)
+        return bar
+
+    def render(self, screen, score, lives, combo_text="", combo_progress=0, timer_text="00:00", dirty=None,
+               sprites=None, text_batch=None):
+        """Affiche le score à gauche, le timer en haut au centre, les vies à gauche et le combo.
+
+        Si dirty (DirtyRegion) est fourni, chaque zone dessinée y est signalée.
+        Si sprites (SpriteBatch) est fourni, les coeurs passent par l'atlas GL,
+        et si text_batch (TextBatch) est fourni, les textes aussi.
+        """
+        mark = dirty.add if dirty is not None else (lambda rect: None)
+        center_x = screen.get_width() // 2
+
+        # 1. Score en haut à gauche
+        mark(self._text(screen, 'score', self.font, f"Score: {score}", (255, 255, 255), text_batch,
+                        topleft=(20, 20)))
+
+        # 2. Timer en haut au centre
+        mark(self._text(screen, 'timer', self.font, timer_text, (255, 255, 255), text_batch,
+                        center=(center_x, 30)))
+
+        # 3. Vies à gauche (en dessous du score)
+        if sprites is not None:
+            for i in range(lives):
+                sprites.add('heart', heart_rect(35 + i * HEART_SPACING, 70))
+        elif lives > 0:
+            mark(screen.blit(self._widget('lives', lives, self._build_hearts), HEARTS_ORIGIN))
+
+        # 4. Combo text au centre (en dessous du timer)
+        if combo_text:
+            mark(self._text(screen, 'combo', self.combo_font, combo_text, (255, 200, 0), text_batch,
+                            center=(center_x, 80)))
+
+            # Barre de temps du combo
+            if combo_progress > 0:
+                step = round(combo_progress * COMBO_BAR_STEPS)
+                bar = self._widget('combo_bar', step, self._build_combo_bar)
+                mark(screen.blit(bar, (center_x - COMBO_BAR_SIZE[0] // 2, 105)))
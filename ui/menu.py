@@ -1,4 +1,5 @@
 import pygame
+from ui.text import draw_text, get_font
 
 
 class Button:
@@ -11,15 +12,13 @@ class Button:
         self.font = None
         self.is_hovered = False
 
-    def render(self, screen):
+    def render(self, screen, text_batch=None):
         pygame.draw.rect(screen, self.current_color, self.rect, border_radius=10)
         pygame.draw.rect(screen, (255, 255, 255), self.rect, 3, border_radius=10)
 
         if self.font is None:
-            self.font = pygame.font.Font(None, 40)
-        text_surface = self.font.render(self.text, True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+            self.font = get_font(None, 40)
+        draw_text(screen, self.font, self.text, (255, 255, 255), text_batch, center=self.rect.center)
 
     def update(self, mouse_pos):
         self.is_hovered = self.rect.collidepoint(mouse_pos)
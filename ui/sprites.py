@@ -0,0 +1,57 @@
+"""
+Construction de l'atlas des sprites du jeu (splashs, formes du HUD, impostors).
+"""
+import pygame
+from core.impostors import impostors
+from core.splash import Splash
+from core.sprite_atlas import SpriteAtlas
+from ui.hud import draw_heart, heart_rect, draw_pause_button
+
+# Rayon de référence des pastilles de touche (mode clavier) dans l'atlas
+KEY_BADGE_RADIUS = 32
+
+# Taille du sprite de particule dans l'atlas (étiré à la taille de chaque particule)
+PARTICLE_SPRITE_SIZE = 16
+
+
+def build_game_atlas():
+    """Rassemble les images de splash, les formes du HUD et les impostors chargés dans un SpriteAtlas.
+
+    Les splashs et les pastilles sont blancs : la couleur vient de la teinte
+    du quad au moment du rendu.
+    """
+    images = {}
+    for index, image in enumerate(Splash.load_images()):
+        images[f"splash-{index}"] = image
+
+    bounds = heart_rect(0, 0)
+    heart = pygame.Surface(bounds.size, pygame.SRCALPHA)
+    draw_heart(heart, -bounds.x, -bounds.y)
+    images['heart'] = heart
+
+    pause = pygame.Surface((40, 40), pygame.SRCALPHA)
+    draw_pause_button(pause, pause.get_rect())
+    images['pause_button'] = pause
+
+    size = KEY_BADGE_RADIUS * 2
+    disc = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(disc, (255, 255, 255), (KEY_BADGE_RADIUS, KEY_BADGE_RADIUS), KEY_BADGE_RADIUS)
+    images['key_disc'] = disc
+
+    ring = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(ring, (255, 255, 255), (KEY_BADGE_RADIUS, KEY_BADGE_RADIUS), KEY_BADGE_RADIUS, 3)
+    images['key_ring'] = ring
+
+    # Particule : disque blanc à bord adouci
+    particle = pygame.Surface((PARTICLE_SPRITE_SIZE, PARTICLE_SPRITE_SIZE), pygame.SRCALPHA)
+    center = PARTICLE_SPRITE_SIZE / 2
+    for radius in range(PARTICLE_SPRITE_SIZE // 2, 0, -1):
+        alpha = int(255 * min(1.0, (PARTICLE_SPRITE_SIZE / 2 - radius + 1) / 3))
+        pygame.draw.circle(particle, (255, 255, 255, alpha), (center, center), radius)
+    images['particle'] = particle
+
+    # Impostors des fruits (rendu sans 3D) : seulement ceux déjà chargés
+    frames = impostors.frame_images()
+    images.update(frames)
+
+    return SpriteAtlas(images, width=2048 if frames else 1024)
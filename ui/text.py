@@ -0,0 +1,133 @@
+"""
+Rendu du texte partagé par les scènes : cache des chaînes rendues (logiciel)
+et atlas de glyphes dessinés en sprites (OpenGL ou Renderer SDL2).
+"""
+import string
+from collections import OrderedDict
+import pygame
+
+# Nombre de chaînes rendues gardées en cache (les plus anciennes sont oubliées)
+TEXT_CACHE_SIZE = 512
+
+# Caractères rastérisés dans les atlas de glyphes : ASCII imprimable et Latin-1 accentué
+GLYPHS = string.digits + string.ascii_letters + string.punctuation + " " + \
+    "".join(chr(code) for code in range(0xC0, 0x100))
+
+_fonts = {}
+_text_cache = OrderedDict()
+
+
+def get_font(name=None, size=40, bold=False):
+    """Police partagée : chaque (nom, taille, gras) n'est chargé qu'une fois.
+
+    name=None donne la police par défaut de pygame, sinon une police système.
+    """
+    key = (name, size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        if name is None:
+            font = pygame.font.Font(None, size)
+            font.set_bold(bold)
+        else:
+            font = pygame.font.SysFont(name, size, bold=bold)
+        _fonts[key] = font
+    return font
+
+
+def render_text(font, text, color):
+    """Équivalent de font.render(text, True, color) avec cache LRU."""
+    key = (font, text, tuple(color))
+    surface = _text_cache.get(key)
+    if surface is None:
+        surface = font.render(text, True, color)
+        _text_cache[key] = surface
+        if len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    else:
+        _text_cache.move_to_end(key)
+    return surface
+
+
+def draw_text(surface, font, text, color, text_batch=None, **position):
+    """Dessine text placé par un ancrage de Rect (center=..., topleft=...).
+
+    Avec text_batch (TextBatch), la chaîne est ajoutée au lot GL et rien n'est
+    dessiné sur la surface : retourne None. Sinon la surface en cache est
+    blittée et la zone touchée est retournée.
+    """
+    if text_batch is not None:
+        text_batch.add(font, text, color, **position)
+        return None
+    rendered = render_text(font, text, color)
+    return surface.blit(rendered, rendered.get_rect(**position))
+
+
+class GlyphAtlas:
+    """Glyphes blancs d'une police rangés dans un SpriteAtlas, avec leurs avances."""
+
+    def __init__(self, font):
+        from core.sprite_atlas import SpriteAtlas
+
+        images = {}
+        for char in GLYPHS:
+            glyph = font.render(char, True, (255, 255, 255))
+            if glyph.get_width() > 0:
+                images[char] = glyph
+        self.atlas = SpriteAtlas(images, width=512)
+        self.advances = {char: image.get_width() for char, image in images.items()}
+        self.height = font.get_height()
+        self.font = font
+
+    def size(self, text):
+        """Taille (largeur, hauteur) de la chaîne posée glyphe par glyphe."""
+        width = 0
+        for char in text:
+            advance = self.advances.get(char)
+            width += advance if advance is not None else self.font.size(char)[0]
+        return width, self.height
+
+
+class TextBatch:
+    """Chaînes posées en quads texturés, un draw par police utilisée.
+
+    Chaque police est rastérisée une seule fois dans son atlas de glyphes ;
+    une chaîne ne coûte ensuite que quatre sommets par caractère.
+    """
+
+    def __init__(self, renderer):
+        self.renderer = renderer    # GLRenderer ou SDLRenderer
+        self.batches = {}   # police -> (GlyphAtlas, lot de sprites du backend)
+
+    def _batch(self, font):
+        entry = self.batches.get(font)
+        if entry is None:
+            glyphs = GlyphAtlas(font)
+            entry = (glyphs, self.renderer.sprite_batch(glyphs.atlas))
+            self.batches[font] = entry
+        return entry
+
+    def add(self, font, text, color, **position):
+        """Ajoute une chaîne placée comme font.render(...).get_rect(**position)."""
+        glyphs, sprites = self._batch(font)
+        rect = pygame.Rect((0, 0), glyphs.size(text))
+        for anchor, value in position.items():
+            setattr(rect, anchor, value)
+        x = rect.x
+        for char in text:
+            advance = glyphs.advances.get(char)
+            if advance is None:
+                # Caractère hors atlas : on laisse sa place vide
+                x += font.size(char)[0]
+                continue
+            sprites.add(char, (x, rect.y, advance, glyphs.height), color)
+            x += advance
+
+    def flush(self):
+        """Dessine toutes les chaînes accumulées (mode 2D)."""
+        for _, sprites in self.batches.values():
+            sprites.flush()
+
+    def release(self):
+        for _, sprites in self.batches.values():
+            sprites.release()
+        self.batches.clear()